@@ -1,65 +1,243 @@
 # Problema del Puente y la Antorcha
 # Estrategia óptima: siempre usar los dos más rápidos como "mensajeros"
 # y en cada paso decidir la opción que minimiza el tiempo.
+#
+# Uso:
+#     python Practica1.py                                   (interactivo)
+#     python Practica1.py instancias.txt --output totales.txt
+#     python Practica1.py instancias.txt --pasos            (con el recorrido)
+#     python Practica1.py instancias.txt --k 3              (3 personas por viaje)
+# El archivo de instancias tiene una instancia por línea: los tiempos de cruce
+# separados por espacios o comas ('-' = entrada estándar; '#' = comentario).
+# Cada línea de salida es el total, y con --pasos también el recorrido:
+#     17<TAB>(1,2) -> 2; 1 <- 1; (5,10) -> 10; 2 <- 2; (1,2) -> 2
+import argparse
+import heapq
+import sys
+from math import inf as INF
 
-def cruzar_puente(tiempos):
-    # Ordenamos los tiempos de menor a mayor
-    tiempos.sort()
-    pasos = []   # Aquí guardamos los movimientos
-    total = 0    # Tiempo total
-
-    # Mientras haya más de 3 personas en la orilla inicial
-    while len(tiempos) > 3:
-        a = tiempos[0]         # El más rápido
-        b = tiempos[1]         # El segundo más rápido
-        x = tiempos[-2]        # El penúltimo más lento
-        y = tiempos[-1]        # El más lento
+# Los tiempos se ordenan una vez (O(n log n)); después se recorren con índices,
+# sacando de a dos a los más lentos sin copiar la lista (O(n)).
 
-        # Estrategia 1: a y b cruzan, a regresa, x y y cruzan, b regresa
-        tiempo_op1 = b + a + y + b
+def _total(orden):
+    # Tiempo total sobre los tiempos ya ordenados, sin armar los pasos
+    total = 0
+    izq = len(orden) - 1   # Índice del más lento que falta cruzar
+    if izq >= 3:
+        a, b = orden[0], orden[1]
+        while izq >= 3:
+            x, y = orden[izq - 1], orden[izq]
+            tiempo_op1 = b + a + y + b   # Estrategia 1 (ver _pasos)
+            tiempo_op2 = y + a + x + a   # Estrategia 2
+            total += tiempo_op1 if tiempo_op1 <= tiempo_op2 else tiempo_op2
+            izq -= 2
+    # Casos finales (<=3 personas)
+    if izq == 2:
+        total += orden[0] + orden[1] + orden[2]
+    elif izq >= 0:
+        total += orden[izq]
+    return total
+
+def _pasos(orden):
+    # Genera los pasos (en texto) sobre los tiempos ya ordenados, uno por vez
+    izq = len(orden) - 1
+    while izq >= 3:
+        a = orden[0]         # El más rápido
+        b = orden[1]         # El segundo más rápido
+        x = orden[izq - 1]   # El penúltimo más lento
+        y = orden[izq]       # El más lento
 
+        # Estrategia 1: a y b cruzan, a regresa, x y y cruzan, b regresa
         # Estrategia 2: a y y cruzan, a regresa, a y x cruzan, a regresa
-        tiempo_op2 = y + a + x + a
-
-        # Elegimos la mejor estrategia
-        if tiempo_op1 <= tiempo_op2:
-            # Estrategia 1
-            pasos.append(f"({a},{b}) -> {b}")
-            pasos.append(f"{a} <- {a}")
-            pasos.append(f"({x},{y}) -> {y}")
-            pasos.append(f"{b} <- {b}")
-            total += tiempo_op1
+        if b + a + y + b <= y + a + x + a:
+            yield f"({a},{b}) -> {b}"
+            yield f"{a} <- {a}"
+            yield f"({x},{y}) -> {y}"
+            yield f"{b} <- {b}"
         else:
-            # Estrategia 2
-            pasos.append(f"({a},{y}) -> {y}")
-            pasos.append(f"{a} <- {a}")
-            pasos.append(f"({a},{x}) -> {x}")
-            pasos.append(f"{a} <- {a}")
-            total += tiempo_op2
+            yield f"({a},{y}) -> {y}"
+            yield f"{a} <- {a}"
+            yield f"({a},{x}) -> {x}"
+            yield f"{a} <- {a}"
 
-        # Sacamos a los dos más lentos (ya cruzaron)
-        tiempos = tiempos[:-2]
+        # Los dos más lentos ya cruzaron
+        izq -= 2
 
     # Casos finales (<=3 personas)
-    if len(tiempos) == 3:
-        a, b, c = tiempos
-        pasos.append(f"({a},{b}) -> {b}")
-        pasos.append(f"{a} <- {a}")
-        pasos.append(f"({a},{c}) -> {c}")
-        total += a + b + c
-    elif len(tiempos) == 2:
-        a, b = tiempos
-        pasos.append(f"({a},{b}) -> {b}")
-        total += b
-    elif len(tiempos) == 1:
-        pasos.append(f"{tiempos[0]} -> {tiempos[0]}")
-        total += tiempos[0]
+    if izq == 2:
+        a, b, c = orden[0], orden[1], orden[2]
+        yield f"({a},{b}) -> {b}"
+        yield f"{a} <- {a}"
+        yield f"({a},{c}) -> {c}"
+    elif izq == 1:
+        a, b = orden[0], orden[1]
+        yield f"({a},{b}) -> {b}"
+    elif izq == 0:
+        yield f"{orden[0]} -> {orden[0]}"
+
+def cruzar_puente(tiempos):
+    """Devuelve (pasos, total): la lista de movimientos y el tiempo total. No modifica tiempos."""
+    orden = sorted(tiempos)
+    return list(_pasos(orden)), _total(orden)
+
+def tiempo_total(tiempos):
+    """Solo el tiempo total (camino rápido: no arma los textos de los pasos)."""
+    return _total(sorted(tiempos))
+
+def recorrido(tiempos):
+    """Los pasos de cruzar_puente de a uno (generador), sin guardarlos en una lista."""
+    return _pasos(sorted(tiempos))
+
+
+# ------------------- CAPACIDAD K -------------------
+# Con k personas por viaje la regla de las dos estrategias ya no alcanza: se busca el
+# camino más corto (Dijkstra) entre estados del cruce, guardando el mejor tiempo de
+# cada estado. Con los tiempos ordenados, los k más rápidos son los "mensajeros" (los
+# únicos que regresan con la antorcha) y los demás cruzan una sola vez: los más lentos
+# en grupos consecutivos desde el final y los más rápidos de ellos ocupando asientos
+# libres. Así los que faltan cruzar son siempre un rango [lo, hi) del orden más los
+# mensajeros de la orilla inicial, y el estado es (lo, hi, mensajeros, antorcha).
+# Hay O(n^2 * 2^k) estados y O(n^2 * 3^k) transiciones; con k = 2 da los mismos
+# totales que cruzar_puente. Que estos estados alcanzan para el óptimo se verifica
+# contra una búsqueda exhaustiva en puente_benchmark.py.
+
+def _cruces_k(orden, k):
+    # Dijkstra sobre los estados; devuelve (total, movimientos) con cada movimiento
+    # como (sentido, personas): '->' de ida y '<-' de regreso.
+    n = len(orden)
+    m = min(n, k)
+    inicio = (m, n, (1 << m) - 1, 1)   # Bit j de f: el mensajero j está en la orilla inicial
+    mejor = {inicio: 0}
+    anterior = {}   # Estado -> estado previo (el movimiento se deduce de la diferencia)
+    cola = [(0, inicio)]
+    while cola:
+        tiempo, estado = heapq.heappop(cola)
+        if tiempo > mejor[estado]:
+            continue
+        lo, hi, f, antorcha = estado
+        if lo == hi and f == 0:
+            return tiempo, _movimientos(orden, m, estado, anterior)
+
+        def relajar(costo, nuevo):
+            if tiempo + costo < mejor.get(nuevo, INF):
+                mejor[nuevo] = tiempo + costo
+                anterior[nuevo] = estado
+                heapq.heappush(cola, (tiempo + costo, nuevo))
+
+        if antorcha:
+            # Ida: algunos mensajeros (sub), g de los más lentos y h de los más rápidos del rango
+            resto = hi - lo
+            sub = f
+            while True:
+                libres = k - sub.bit_count()
+                # Con lentos el viaje cuesta lo del más lento: los asientos que
+                # sobran se llenan con los más rápidos del rango (van gratis)
+                for g in range(1, min(libres, resto) + 1):
+                    h = min(libres - g, resto - g)
+                    relajar(orden[hi - 1], (lo + h, hi - g, f & ~sub, 0))
+                # Solo mensajeros: los del rango que no son más lentos que ellos también
+                # van gratis; cada uno más que se sume cuesta lo que tarda
+                if sub:
+                    lento = orden[sub.bit_length() - 1]
+                    gratis = 0
+                    while gratis < min(libres, resto) and orden[lo + gratis] <= lento:
+                        gratis += 1
+                    relajar(lento, (lo + gratis, hi, f & ~sub, 0))
+                    for h in range(gratis + 1, min(libres, resto) + 1):
+                        relajar(orden[lo + h - 1], (lo + h, hi, f & ~sub, 0))
+                if sub == 0:
+                    break
+                sub = (sub - 1) & f
+        else:
+            # Regreso: un mensajero de la otra orilla
+            for j in range(m):
+                if not f >> j & 1:
+                    relajar(orden[j], (lo, hi, f | 1 << j, 1))
+    raise ValueError(f"Con capacidad {k} no pueden cruzar {n} personas")
 
+def _movimientos(orden, m, estado, anterior):
+    # Reconstruye los movimientos desde el estado final hacia atrás
+    movimientos = []
+    while estado in anterior:
+        previo = anterior[estado]
+        (lo, hi, f, antorcha), (lo2, hi2, f2, _) = previo, estado
+        if antorcha:
+            personas = ([orden[j] for j in range(m) if (f & ~f2) >> j & 1]
+                        + orden[lo:lo2] + orden[hi2:hi])
+            movimientos.append(('->', sorted(personas)))
+        else:
+            movimientos.append(('<-', [orden[(f2 & ~f).bit_length() - 1]]))
+        estado = previo
+    return movimientos[::-1]
+
+def cruzar_puente_k(tiempos, k=2):
+    """
+    Como cruzar_puente, pero cruzan hasta k personas por viaje (k >= 2, o k = 1 con
+    una sola persona). Devuelve (pasos, total) con los pasos en el mismo formato."""
+    orden = sorted(tiempos)
+    if not orden:
+        return [], 0
+    total, movimientos = _cruces_k(orden, k)
+    pasos = []
+    for sentido, personas in movimientos:
+        if sentido == '<-':
+            pasos.append(f"{personas[0]} <- {personas[0]}")
+        elif len(personas) == 1:
+            pasos.append(f"{personas[0]} -> {personas[0]}")
+        else:
+            pasos.append(f"({','.join(str(t) for t in personas)}) -> {personas[-1]}")
     return pasos, total
 
 
-# ------------------- PROGRAMA PRINCIPAL -------------------
-if __name__ == "__main__":
+# ------------------- LOTES -------------------
+def leer_instancias(archivo):
+    """Genera las instancias (listas de tiempos) de un archivo abierto, de a una línea."""
+    for linea in archivo:
+        linea = linea.split('#', 1)[0].replace(',', ' ').split()
+        if linea:
+            yield [int(t) for t in linea]
+
+def resolver_lote(instancias, salida, pasos=False, k=2):
+    """
+    Escribe en salida una línea por instancia: el total y, con pasos=True, el
+    recorrido (separado por un tabulador). Los pasos se escriben a medida que se
+    generan, así que nunca se guarda el recorrido completo. Con k != 2 se usa
+    cruzar_puente_k. Devuelve cuántas instancias resolvió."""
+    cuenta = 0
+    for tiempos in instancias:
+        if k != 2:
+            recorrido_k, total = cruzar_puente_k(tiempos, k)
+            salida.write(f"{total}\t{'; '.join(recorrido_k)}\n" if pasos else f"{total}\n")
+        elif pasos:
+            orden = sorted(tiempos)
+            salida.write(f"{_total(orden)}\t")
+            for i, paso in enumerate(_pasos(orden)):
+                salida.write(f"; {paso}" if i else paso)
+            salida.write("\n")
+        else:
+            salida.write(f"{tiempo_total(tiempos)}\n")
+        cuenta += 1
+    return cuenta
+
+def main():
+    parser = argparse.ArgumentParser(description="Problema del puente y la antorcha por lotes")
+    parser.add_argument('instancias', help="Archivo con una instancia por línea ('-' = entrada estándar)")
+    parser.add_argument('--output', default=None, help="Archivo de resultados (por defecto, salida estándar)")
+    parser.add_argument('--pasos', action='store_true', help="Incluir el recorrido de cada instancia")
+    parser.add_argument('--k', type=int, default=2, help="Personas por viaje")
+    args = parser.parse_args()
+
+    entrada = sys.stdin if args.instancias == '-' else open(args.instancias, 'r', encoding='utf-8')
+    salida = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        resolver_lote(leer_instancias(entrada), salida, args.pasos, args.k)
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if salida is not sys.stdout:
+            salida.close()
+
+def interactivo():
     n = int(input("Número de personas: "))
     tiempos = []
     print("Ingresa los tiempos de cruce:")
@@ -74,3 +252,11 @@ if __name__ == "__main__":
         print(p, end="; ")
 
     print(f"Total = {total}")
+
+
+# ------------------- PROGRAMA PRINCIPAL -------------------
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        main()
+    else:
+        interactivo()
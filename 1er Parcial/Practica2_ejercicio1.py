@@ -1,9 +1,17 @@
 import csv
 import heapq
 import os
+import struct
+import time
+import zlib
+from array import array
 from collections import deque
+from functools import wraps
+import numpy as np
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import PatternFill, Font
+from openpyxl.utils import get_column_letter
 
 def load_maze(filename):
     with open(filename, 'r', newline='', encoding='utf-8-sig') as file:
@@ -16,6 +24,13 @@ def load_maze(filename):
 ''' Lee el archivo CSV y limpia cada celda (elimina espacios y comillas)
     Retorna el laberinto como una lista de listas (matriz)'''
 def find_start_end(maze):
+    if isinstance(maze, PackedMaze):
+        if maze.start is None:
+            raise ValueError("No se encontró el punto de inicio 'S'")
+        if maze.end is None:
+            raise ValueError("No se encontró el punto final 'E'")
+        return maze.coords(maze.start), maze.coords(maze.end)
+
     start = None
     end = None
     for i, row in enumerate(maze):
@@ -33,35 +48,278 @@ def find_start_end(maze):
     return start, end
 '''    Busca las coordenadas de 'S' (start) y 'E' (end)
 Lanza excepción si no encuentra alguno de ellos'''
+
+# =============================================================================
+# LABERINTO EMPAQUETADO (modo compacto para mapas grandes)
+# =============================================================================
+class PackedMaze:
+    """
+    Laberinto empaquetado en un arreglo NumPy uint8 plano (1 = pared, 0 = libre).
+    Cada celda (i, j) se identifica con el índice entero i * cols + j, de modo que
+    las búsquedas trabajan con enteros y buffers planos en lugar de tuplas y dicts.
+    """
+    def __init__(self, cells, rows, cols, start=None, end=None):
+        self.cells = cells          # Arreglo uint8 de rows * cols celdas
+        self.rows = rows
+        self.cols = cols
+        self.size = rows * cols
+        self.start = start          # Índice plano de 'S' (None si no existe)
+        self.end = end              # Índice plano de 'E' (None si no existe)
+        self.walls = memoryview(cells)  # Acceso rápido celda a celda desde Python
+
+    def index(self, cell):
+        return cell[0] * self.cols + cell[1]
+
+    def coords(self, index):
+        return divmod(index, self.cols)
+
+    def neighbors(self, index):
+        """
+        Vecinos libres de una celda, en el mismo orden que usan las búsquedas
+        sobre listas: derecha, abajo, izquierda, arriba.
+        """
+        cols = self.cols
+        walls = self.walls
+        j = index % cols
+        result = []
+        if j + 1 < cols and not walls[index + 1]:
+            result.append(index + 1)
+        if index + cols < self.size and not walls[index + cols]:
+            result.append(index + cols)
+        if j > 0 and not walls[index - 1]:
+            result.append(index - 1)
+        if index >= cols and not walls[index - cols]:
+            result.append(index - cols)
+        return result
+
+def pack_maze(maze):
+    rows = len(maze)
+    cols = len(maze[0]) if rows else 0
+    if any(len(row) != cols for row in maze):
+        raise ValueError("El laberinto no es rectangular: todas las filas deben tener el mismo número de celdas")
+
+    cells = np.zeros(rows * cols, dtype=np.uint8)
+    start = None
+    end = None
+    for i, row in enumerate(maze):
+        base = i * cols
+        cells[base:base + cols] = [cell == '1' for cell in row]
+        for j, cell in enumerate(row):
+            if cell == 'S':
+                start = base + j
+            elif cell == 'E':
+                end = base + j
+    return PackedMaze(cells, rows, cols, start, end)
+''' Convierte el laberinto (lista de listas) a su forma empaquetada.
+    Las paredes ('1') quedan en 1 y todo lo demás (incluidos 'S' y 'E') en 0'''
+
+# =============================================================================
+# CARGA RÁPIDA Y FORMATO BINARIO
+# =============================================================================
+MAZE_MAGIC = b'LABRNTO1'   # Encabezado: magia + filas, columnas, inicio, fin (int64)
+MAZE_HEADER_SIZE = len(MAZE_MAGIC) + 4 * 8
+
+def load_maze_packed(filename):
+    with open(filename, 'rb') as file:
+        data = file.read()
+    if data.startswith(b'\xef\xbb\xbf'):
+        data = data[3:]  # BOM de UTF-8
+    # Misma limpieza que load_maze (espacios y comillas), pero sobre todo el archivo
+    lines = data.translate(None, b' \t\r"\'').split(b'\n')
+    while lines and not lines[-1]:
+        lines.pop()  # Líneas vacías al final del archivo
+    width = len(lines[0]) if lines else 0
+
+    if lines and all(len(line) == width for line in lines):
+        chars = np.frombuffer(b','.join(lines), dtype=np.uint8)
+        # Celdas de un carácter separadas por comas: posiciones pares = celdas
+        if width % 2 == 1 and np.all(chars[1::2] == ord(',')):
+            chars = chars[0::2]
+            cells = (chars == ord('1')).astype(np.uint8)
+            starts = np.flatnonzero(chars == ord('S'))
+            ends = np.flatnonzero(chars == ord('E'))
+            return PackedMaze(cells, len(lines), (width + 1) // 2,
+                              int(starts[-1]) if len(starts) else None,
+                              int(ends[-1]) if len(ends) else None)
+
+    # Formato irregular (celdas de más de un carácter, vacías, etc.): camino lento
+    return pack_maze(load_maze(filename))
+''' Carga el CSV directamente a un PackedMaze, procesando el archivo completo con
+    NumPy en lugar de limpiar celda por celda. Equivale a pack_maze(load_maze(...))'''
+
+def save_maze_binary(maze, filename):
+    header = np.array([maze.rows, maze.cols,
+                       -1 if maze.start is None else maze.start,
+                       -1 if maze.end is None else maze.end], dtype='<i8')
+    with open(filename, 'wb') as file:
+        file.write(MAZE_MAGIC)
+        file.write(header.tobytes())
+        file.write(np.ascontiguousarray(maze.cells, dtype=np.uint8).tobytes())
+''' Guarda el laberinto en formato binario: encabezado fijo + un byte por celda'''
+
+def open_maze_binary(filename, writable=False):
+    with open(filename, 'rb') as file:
+        magic = file.read(len(MAZE_MAGIC))
+        if magic != MAZE_MAGIC:
+            raise ValueError(f"'{filename}' no es un laberinto binario")
+        rows, cols, start, end = np.frombuffer(file.read(4 * 8), dtype='<i8').tolist()
+    cells = np.memmap(filename, dtype=np.uint8, mode='r+' if writable else 'r',
+                      offset=MAZE_HEADER_SIZE, shape=(rows * cols,))
+    return PackedMaze(cells, rows, cols,
+                      None if start == -1 else start,
+                      None if end == -1 else end)
+''' Abre un laberinto binario mapeándolo en memoria: no se lee ni se procesa nada,
+    el sistema operativo trae las celdas a medida que las búsquedas las tocan.
+    Con writable=True los cambios de celdas se escriben en el archivo'''
+
+def open_maze(filename, cache_binary=False):
+    with open(filename, 'rb') as file:
+        if file.read(len(MAZE_MAGIC)) == MAZE_MAGIC:
+            return open_maze_binary(filename)
+    if not cache_binary:
+        return load_maze_packed(filename)
+
+    binary = os.path.splitext(filename)[0] + '.lab'
+    if os.path.exists(binary) and os.path.getmtime(binary) >= os.path.getmtime(filename):
+        return open_maze_binary(binary)
+    maze = load_maze_packed(filename)
+    save_maze_binary(maze, binary)
+    return maze
+''' Abre un laberinto en cualquiera de los dos formatos (binario o CSV).
+    Con cache_binary=True un CSV se convierte una vez a <nombre>.lab junto al original
+    y las siguientes ejecuciones lo mapean directamente (si el CSV no cambió)'''
+
+def _index_buffer(size, fill):
+    # Buffer plano de enteros (int32 mientras los índices quepan, int64 si no)
+    typecode = 'i' if size < 2**31 else 'q'
+    return array(typecode, [fill]) * size
+
+def _rebuild_packed_path(maze, parent, start, end):
+    path = []
+    current = end
+    while current != start:
+        path.append(maze.coords(current))
+        current = parent[current]
+    path.append(maze.coords(start))
+    path.reverse()
+    return path
+''' Reconstruye el camino desde el buffer de padres y lo devuelve como
+    coordenadas (i, j), igual que las búsquedas sobre listas'''
+
+class SearchStats:
+    """
+    Contadores opcionales que llenan las búsquedas cuando se les pasa stats=...
+    nodes_expanded: nodos que se sacaron de la frontera y se expandieron.
+    nodes_pushed: entradas agregadas a la frontera (incluye la inicial y las repetidas).
+    peak_frontier: tamaño máximo que alcanzó la lista abierta (pila, cola o heap).
+    reopenings: nodos ya expandidos que recibieron un costo mejor.
+    heap_ops: operaciones push/pop sobre colas de prioridad (0 en bfs y dfs).
+    wall_time: segundos de reloj que tardó la búsqueda completa.
+    Los contadores se acumulan si se reutiliza el mismo objeto en varias búsquedas.
+    """
+    FIELDS = ('nodes_expanded', 'nodes_pushed', 'peak_frontier', 'reopenings',
+              'heap_ops', 'wall_time')
+
+    def __init__(self):
+        self.nodes_expanded = 0
+        self.nodes_pushed = 0
+        self.peak_frontier = 0
+        self.reopenings = 0
+        self.heap_ops = 0
+        self.wall_time = 0.0
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+def _record(stats, peak, pushed, heap_ops=0, reopenings=0):
+    # Vuelca los contadores locales de una búsqueda en stats (si se pidió)
+    if stats is not None:
+        stats.peak_frontier = max(stats.peak_frontier, peak)
+        stats.nodes_pushed += pushed
+        stats.heap_ops += heap_ops
+        stats.reopenings += reopenings
+
+def _timed(search):
+    # Mide el tiempo de reloj de la búsqueda completa y lo suma a stats.wall_time
+    @wraps(search)
+    def wrapper(maze, start, end, *args, stats=None, **kwargs):
+        if stats is None:
+            return search(maze, start, end, *args, **kwargs)
+        t0 = time.perf_counter()
+        try:
+            return search(maze, start, end, *args, stats=stats, **kwargs)
+        finally:
+            stats.wall_time += time.perf_counter() - t0
+    return wrapper
+
+def _blocked(maze, start, end):
+    # True si el inicio o el fin es pared (en cualquiera de los dos formatos): ningún
+    # motor debe devolver un camino que salga de una pared o termine dentro de ella
+    if isinstance(maze, PackedMaze):
+        return bool(maze.walls[maze.index(start)] or maze.walls[maze.index(end)])
+    return maze[start[0]][start[1]] == '1' or maze[end[0]][end[1]] == '1'
+
+def _rebuild_path(came_from, start, end):
+    path = []
+    current = end
+    while current in came_from:
+        path.append(current)
+        current = came_from[current]
+    path.append(start)
+    path.reverse()
+    return path
+''' Reconstruye el camino siguiendo came_from desde 'E' hasta 'S' '''
+
+def _list_neighbors(maze, cell):
+    result = []
+    for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
+        neighbor = (cell[0] + dx, cell[1] + dy)
+        if 0 <= neighbor[0] < len(maze) and 0 <= neighbor[1] < len(maze[0]) \
+                and maze[neighbor[0]][neighbor[1]] != '1':
+            result.append(neighbor)
+    return result
+''' Vecinos libres de una celda de la lista de listas (derecha, abajo, izquierda, arriba)'''
 def heuristic(a, b):
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 ''' Heurística utilizada: Distancia de Manhattan
     Calcula la suma de las diferencias absolutas en las coordenadas X e Y
     Es admisible (nunca sobrestima el costo real) para movimientos en 4 direcciones'''
-def a_star(maze, start, end):
+@_timed
+def a_star(maze, start, end, stats=None, index_heuristic=None):
+    if _blocked(maze, start, end):
+        return None
+    if isinstance(maze, PackedMaze):
+        return _a_star_packed(maze, start, end, stats, index_heuristic)
+
     # Inicialización de estructuras de datos
     neighbors = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # Movimientos posibles
+    if index_heuristic is None:
+        estimate = lambda cell: heuristic(cell, end)
+    else:
+        # Misma numeración plana que PackedMaze (fila * columnas + columna)
+        cols = len(maze[0])
+        estimate = lambda cell: index_heuristic(cell[0] * cols + cell[1])
     open_list = []  # Cola de prioridad
     heapq.heappush(open_list, (0, start))
     g_score = {start: 0}  # Costo desde el inicio
-    f_score = {start: heuristic(start, end)}  # Costo estimado total
+    f_score = {start: estimate(start)}  # Costo estimado total
     came_from = {}  # Para reconstruir el camino
     closed_set = set()  # Nodos ya evaluados
+    peak = pushed = 1
+    popped = reopened = 0
 
     while open_list:
         _, current = heapq.heappop(open_list)
+        popped += 1
         
         # Si llegamos al final, reconstruimos el camino
         if current == end:
-            path = []
-            while current in came_from:
-                path.append(current)
-                current = came_from[current]
-            path.append(start)
-            path.reverse()
-            return path
+            _record(stats, peak, pushed, pushed + popped, reopened)
+            return _rebuild_path(came_from, start, end)
 
         closed_set.add(current)
+        if stats is not None:
+            stats.nodes_expanded += 1
         
         # Explorar vecinos
         for dx, dy in neighbors:
@@ -84,27 +342,50 @@ def a_star(maze, start, end):
                 
             # Actualizar si encontramos un mejor camino
             if tentative_g < g_score.get(neighbor, float('inf')):
+                if neighbor in closed_set:
+                    reopened += 1
                 came_from[neighbor] = current
                 g_score[neighbor] = tentative_g
-                f_score[neighbor] = tentative_g + heuristic(neighbor, end)
+                f_score[neighbor] = tentative_g + estimate(neighbor)
                 heapq.heappush(open_list, (f_score[neighbor], neighbor))
+                pushed += 1
+        if len(open_list) > peak:
+            peak = len(open_list)
     
+    _record(stats, peak, pushed, pushed + popped, reopened)
     return None  # No se encontró camino
 
-def dfs(maze, start, end):
-    stack = [(start, [start])]  # Pila con (nodo_actual, camino_hasta_ahora)
+@_timed
+def dfs(maze, start, end, memory_bounded=False, stats=None):
+    if _blocked(maze, start, end):
+        return None
+    if isinstance(maze, PackedMaze):
+        if memory_bounded:
+            return _dfs_bounded_packed(maze, start, end, stats)
+        return _dfs_packed(maze, start, end, stats)
+    if memory_bounded:
+        return _dfs_bounded(maze, start, end, stats)
+
+    stack = [(start, None)]  # Pila con (nodo_actual, nodo_que_lo_apiló)
     visited = set()  # Nodos visitados
+    came_from = {}  # Padre de cada nodo, para reconstruir el camino
+    peak = pushed = 1
     
     while stack:
-        (current, path) = stack.pop()
+        (current, parent) = stack.pop()
         if current in visited:
             continue
             
         visited.add(current)
+        if parent is not None:
+            came_from[current] = parent
         
-        # Si encontramos el final, retornar camino
+        # Si encontramos el final, reconstruir el camino una sola vez
         if current == end:
-            return path
+            _record(stats, peak, pushed)
+            return _rebuild_path(came_from, start, end)
+        if stats is not None:
+            stats.nodes_expanded += 1
             
         # Explorar vecinos
         for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
@@ -118,26 +399,78 @@ def dfs(maze, start, end):
             if maze[neighbor[0]][neighbor[1]] == '1':
                 continue
                 
-            # Agregar a la pila si no ha sido visitado
+            # Agregar a la pila si no ha sido visitado (solo el nodo, no el camino)
             if neighbor not in visited:
-                stack.append((neighbor, path + [neighbor]))
+                stack.append((neighbor, current))
+                pushed += 1
+        peak = max(peak, len(stack))
     
+    _record(stats, peak, pushed)
     return None  # No se encontró camino
+''' DFS con punteros a padre: cada entrada de la pila guarda solo el nodo y quién
+    lo apiló, y el camino se reconstruye al llegar a 'E' como en a_star.
+    Con memory_bounded=True se usa _dfs_bounded, cuya pila es el camino actual'''
 
-def bfs(maze, start, end):
-    queue = deque([(start, [start])])  # Cola con (nodo_actual, camino_hasta_ahora)
-    visited = set()  # Nodos visitados
+def _dfs_bounded(maze, start, end, stats=None):
+    # Pila = camino actual. Cada marco guarda la celda y cuántos de sus vecinos
+    # ya se probaron; los vecinos se prueban en orden inverso (arriba, izquierda,
+    # abajo, derecha) porque es el orden en que la pila de dfs los extrae.
+    path = [start]
+    tried = [0]
+    visited = {start}
+    peak = pushed = 1
+
+    while path:
+        current = path[-1]
+        if current == end:
+            _record(stats, peak, pushed)
+            return list(path)
+
+        neighbors = _list_neighbors(maze, current)
+        k = tried[-1]
+        if k == 0 and stats is not None:
+            stats.nodes_expanded += 1
+        while k < len(neighbors) and neighbors[-1 - k] in visited:
+            k += 1
+        if k == len(neighbors):
+            path.pop()   # Sin vecinos nuevos: retroceder
+            tried.pop()
+            continue
+
+        tried[-1] = k + 1
+        neighbor = neighbors[-1 - k]
+        visited.add(neighbor)
+        path.append(neighbor)
+        tried.append(0)
+        pushed += 1
+        peak = max(peak, len(path))
+
+    _record(stats, peak, pushed)
+    return None
+''' DFS de memoria acotada: la frontera nunca guarda más que el camino actual
+    (a lo sumo una entrada por celda del camino) y devuelve el mismo camino que dfs'''
+
+@_timed
+def bfs(maze, start, end, stats=None):
+    if _blocked(maze, start, end):
+        return None
+    if isinstance(maze, PackedMaze):
+        return _bfs_packed(maze, start, end, stats)
+
+    queue = deque([start])  # Cola FIFO de nodos
+    visited = {start}  # Nodos ya encolados
+    came_from = {}  # Padre de cada nodo, para reconstruir el camino
+    peak = pushed = 1
     
     while queue:
-        (current, path) = queue.popleft()  # Extraer el primero (FIFO)
-        if current in visited:
-            continue
-            
-        visited.add(current)
+        current = queue.popleft()  # Extraer el primero (FIFO)
         
-        # Si encontramos el final, retornar camino
+        # Si encontramos el final, reconstruir el camino una sola vez
         if current == end:
-            return path
+            _record(stats, peak, pushed)
+            return _rebuild_path(came_from, start, end)
+        if stats is not None:
+            stats.nodes_expanded += 1
             
         # Explorar vecinos
         for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
@@ -151,22 +484,557 @@ def bfs(maze, start, end):
             if maze[neighbor[0]][neighbor[1]] == '1':
                 continue
                 
-            # Agregar a la cola si no ha sido visitado
+            # Marcar al encolar: cada celda entra una sola vez a la cola y su
+            # padre es el primer nodo que la descubre (el mismo camino de antes)
             if neighbor not in visited:
-                queue.append((neighbor, path + [neighbor]))
+                visited.add(neighbor)
+                came_from[neighbor] = current
+                queue.append(neighbor)
+                pushed += 1
+        peak = max(peak, len(queue))
     
+    _record(stats, peak, pushed)
     return None  # No se encontró camino
 
+def _a_star_packed(maze, start, end, stats=None, index_heuristic=None):
+    start = maze.index(start)
+    end = maze.index(end)
+    end_i, end_j = maze.coords(end)
+    cols = maze.cols
+
+    if index_heuristic is None:
+        h = abs(start // cols - end_i) + abs(start % cols - end_j)
+    else:
+        h = index_heuristic(start)
+    open_list = [(h, start)]
+    g_score = _index_buffer(maze.size, -1)  # -1 = todavía sin costo
+    parent = _index_buffer(maze.size, -1)
+    closed = bytearray(maze.size)
+    g_score[start] = 0
+    peak = pushed = 1
+    popped = reopened = 0
+
+    while open_list:
+        _, current = heapq.heappop(open_list)
+        popped += 1
+        if current == end:
+            _record(stats, peak, pushed, pushed + popped, reopened)
+            return _rebuild_packed_path(maze, parent, start, end)
+        if closed[current]:
+            continue  # Entrada vieja de la cola: ya se expandió con mejor costo
+        closed[current] = 1
+        if stats is not None:
+            stats.nodes_expanded += 1
+
+        tentative_g = g_score[current] + 1
+        for neighbor in maze.neighbors(current):
+            old_g = g_score[neighbor]
+            if old_g == -1 or tentative_g < old_g:
+                if closed[neighbor]:
+                    # Solo con heurísticas inconsistentes: se vuelve a abrir para
+                    # expandirlo otra vez con el costo mejorado
+                    reopened += 1
+                    closed[neighbor] = 0
+                parent[neighbor] = current
+                g_score[neighbor] = tentative_g
+                if index_heuristic is None:
+                    h = abs(neighbor // cols - end_i) + abs(neighbor % cols - end_j)
+                else:
+                    h = index_heuristic(neighbor)
+                heapq.heappush(open_list, (tentative_g + h, neighbor))
+                pushed += 1
+        if len(open_list) > peak:
+            peak = len(open_list)
+
+    _record(stats, peak, pushed, pushed + popped, reopened)
+    return None
+''' A* sobre el laberinto empaquetado. Los empates de la cola se rompen por
+    índice plano, que sigue el mismo orden que las tuplas (i, j), así que el
+    camino es idéntico al de a_star sobre listas.
+    index_heuristic: función opcional índice -> cota inferior de la distancia a 'E'
+    (por ejemplo la de laberinto_indice); por defecto se usa Manhattan. Si no es
+    consistente, un nodo cerrado cuyo costo mejora se vuelve a abrir y a expandir,
+    así que el camino sigue siendo óptimo. a_star sobre listas la usa con el mismo
+    índice plano'''
+
+def _dfs_packed(maze, start, end, stats=None):
+    start = maze.index(start)
+    end = maze.index(end)
+    parent = _index_buffer(maze.size, -1)
+    visited = bytearray(maze.size)
+    stack = [(start, start)]  # (nodo, nodo desde el que se apiló)
+    peak = pushed = 1
+
+    while stack:
+        current, came_from = stack.pop()
+        if visited[current]:
+            continue
+        visited[current] = 1
+        parent[current] = came_from
+
+        if current == end:
+            _record(stats, peak, pushed)
+            return _rebuild_packed_path(maze, parent, start, end)
+        if stats is not None:
+            stats.nodes_expanded += 1
+
+        for neighbor in maze.neighbors(current):
+            if not visited[neighbor]:
+                stack.append((neighbor, current))
+                pushed += 1
+        peak = max(peak, len(stack))
+
+    _record(stats, peak, pushed)
+    return None
+
+def _dfs_bounded_packed(maze, start, end, stats=None):
+    start = maze.index(start)
+    end = maze.index(end)
+    visited = bytearray(maze.size)
+    visited[start] = 1
+    path = [start]
+    tried = [0]
+    peak = pushed = 1
+
+    while path:
+        current = path[-1]
+        if current == end:
+            _record(stats, peak, pushed)
+            return [maze.coords(cell) for cell in path]
+
+        neighbors = maze.neighbors(current)
+        k = tried[-1]
+        if k == 0 and stats is not None:
+            stats.nodes_expanded += 1
+        while k < len(neighbors) and visited[neighbors[-1 - k]]:
+            k += 1
+        if k == len(neighbors):
+            path.pop()
+            tried.pop()
+            continue
+
+        tried[-1] = k + 1
+        neighbor = neighbors[-1 - k]
+        visited[neighbor] = 1
+        path.append(neighbor)
+        tried.append(0)
+        pushed += 1
+        peak = max(peak, len(path))
+
+    _record(stats, peak, pushed)
+    return None
+''' Versión empaquetada de _dfs_bounded: la pila es el camino actual'''
+
+def _bfs_packed(maze, start, end, stats=None):
+    start = maze.index(start)
+    end = maze.index(end)
+    parent = _index_buffer(maze.size, -1)
+    visited = bytearray(maze.size)
+    visited[start] = 1
+    queue = deque([start])
+    peak = pushed = 1
+
+    while queue:
+        current = queue.popleft()
+        if current == end:
+            _record(stats, peak, pushed)
+            return _rebuild_packed_path(maze, parent, start, end)
+        if stats is not None:
+            stats.nodes_expanded += 1
+
+        for neighbor in maze.neighbors(current):
+            if not visited[neighbor]:
+                # Se marca al encolar: el primer nodo que lo descubre es el mismo
+                # padre que deja la versión que marca al extraer de la cola
+                visited[neighbor] = 1
+                parent[neighbor] = current
+                queue.append(neighbor)
+                pushed += 1
+        peak = max(peak, len(queue))
+
+    _record(stats, peak, pushed)
+    return None
+
+# =============================================================================
+# JUMP POINT SEARCH (4 direcciones, costo uniforme)
+# =============================================================================
+def _next_in_row(stop, wall):
+    # Para cada celda, la columna de la primera parada a su derecha (sin contar la
+    # celda misma) que aparece antes de una pared o del borde; -1 si no hay
+    cols = wall.shape[1]
+    columns = np.arange(cols, dtype=np.int32)
+    none = np.int32(cols)
+    next_stop = np.minimum.accumulate(np.where(stop, columns, none)[:, ::-1], axis=1)[:, ::-1]
+    next_wall = np.minimum.accumulate(np.where(wall, columns, none)[:, ::-1], axis=1)[:, ::-1]
+    target = np.full(wall.shape, -1, dtype=np.int32)
+    target[:, :-1] = np.where(next_stop[:, 1:] < next_wall[:, 1:], next_stop[:, 1:], -1)
+    return target
+
+def _rightward_stops(wall, end_r, end_c):
+    # Celdas donde se detiene un avance hacia la derecha: la meta, o una celda
+    # libre con un vecino forzado arriba o abajo (libre, con pared a su izquierda)
+    free = ~wall
+    behind = np.zeros_like(wall)
+    behind[:, 1:] = wall[:, :-1]
+    forced = np.zeros_like(wall)
+    forced[1:] |= free[:-1] & behind[:-1]
+    forced[:-1] |= free[1:] & behind[1:]
+    stop = free & forced
+    stop[end_r, end_c] = free[end_r, end_c]
+    return stop
+
+def _jump_tables(maze, end):
+    # Resultado de saltar desde cada celda en cada dirección: {(dr, dc): memoryview
+    # de enteros con el índice del siguiente punto de salto, o -1 si choca con pared o con el
+    # borde}. Se calcula una vez por búsqueda con numpy (O(celdas)); así cada salto
+    # es una consulta en lugar de un recorrido celda por celda, y los avances
+    # verticales no tienen que probar un salto horizontal en cada paso.
+    rows, cols = maze.rows, maze.cols
+    wall = np.asarray(maze.cells, dtype=bool).reshape(rows, cols)
+    end_r, end_c = maze.coords(end)
+
+    # Horizontal (la izquierda se calcula como derecha sobre el tablero espejado)
+    right = _next_in_row(_rightward_stops(wall, end_r, end_c), wall)
+    mirrored = wall[:, ::-1]
+    left = _next_in_row(_rightward_stops(mirrored, end_r, cols - 1 - end_c), mirrored)
+    left = np.where(left >= 0, cols - 1 - left, -1)[:, ::-1]
+
+    # Vertical: se detiene en la meta o donde un salto horizontal encuentra algo
+    stop = ~wall & ((right >= 0) | (left >= 0))
+    stop[end_r, end_c] = not wall[end_r, end_c]
+    down = _next_in_row(stop.T, wall.T).T
+    up = _next_in_row(stop.T[:, ::-1], wall.T[:, ::-1])
+    up = np.where(up >= 0, rows - 1 - up, -1)[:, ::-1].T
+
+    row_base = (np.arange(rows, dtype=np.int32) * np.int32(cols))[:, None]
+    column = np.arange(cols, dtype=np.int32)[None, :]
+
+    def flat(target, base):
+        # Índices planos (int32) leídos como memoryview: cada consulta es un int de Python
+        return memoryview(np.where(target >= 0, base, np.int32(-1)).ravel())
+
+    return {
+        (0, 1): flat(right, row_base + right),
+        (0, -1): flat(left, row_base + left),
+        (1, 0): flat(down, down * np.int32(cols) + column),
+        (-1, 0): flat(up, up * np.int32(cols) + column),
+    }
+''' Un avance horizontal se detiene en la meta o junto a un vecino forzado; uno
+    vertical, en la meta o donde desde esa celda un salto horizontal encuentra un
+    punto de salto (los caminos canónicos giran a horizontal en cualquier punto)'''
+
+def _jump_directions(maze, current, parent):
+    if parent == -1:
+        return [(0, 1), (1, 0), (0, -1), (-1, 0)]  # El inicio explora todo
+
+    r, c = maze.coords(current)
+    pr, pc = maze.coords(parent)
+    dr = (r > pr) - (r < pr)
+    dc = (c > pc) - (c < pc)
+    if dr != 0:
+        # Llegó en vertical: seguir en vertical o girar a cualquier lado
+        return [(dr, 0), (0, 1), (0, -1)]
+
+    # Llegó en horizontal: seguir, y girar solo hacia vecinos forzados
+    cols, walls = maze.cols, maze.walls
+    directions = [(0, dc)]
+    if r > 0 and not walls[current - cols] and walls[current - cols - dc]:
+        directions.append((-1, 0))
+    if r + 1 < maze.rows and not walls[current + cols] and walls[current + cols - dc]:
+        directions.append((1, 0))
+    return directions
+''' Direcciones que quedan tras la poda por simetría: los caminos canónicos
+    avanzan en vertical y giran a horizontal en cualquier punto, pero solo
+    vuelven a vertical donde una pared obliga a hacerlo'''
+
+@_timed
+def jump_point_search(maze, start, end, stats=None):
+    maze = maze if isinstance(maze, PackedMaze) else pack_maze(maze)
+    if _blocked(maze, start, end):
+        return None
+    start = maze.index(start)
+    end = maze.index(end)
+    end_i, end_j = maze.coords(end)
+    cols = maze.cols
+    jumps = _jump_tables(maze, end)
+
+    open_list = [(abs(start // cols - end_i) + abs(start % cols - end_j), start)]
+    g_score = {start: 0}      # Solo se guardan puntos de salto, no todas las celdas
+    came_from = {start: -1}
+    closed = set()
+    peak = pushed = 1
+    popped = reopened = 0
+
+    while open_list:
+        _, current = heapq.heappop(open_list)
+        popped += 1
+        if current == end:
+            _record(stats, peak, pushed, pushed + popped, reopened)
+            return _expand_jump_path(maze, came_from, end)
+        if current in closed:
+            continue
+        closed.add(current)
+        if stats is not None:
+            stats.nodes_expanded += 1
+
+        r, c = divmod(current, cols)
+        for dr, dc in _jump_directions(maze, current, came_from[current]):
+            jump_point = jumps[(dr, dc)][current]
+            if jump_point == -1:
+                continue
+            jr, jc = divmod(jump_point, cols)
+            tentative_g = g_score[current] + abs(jr - r) + abs(jc - c)
+            if tentative_g < g_score.get(jump_point, float('inf')):
+                if jump_point in closed:
+                    reopened += 1
+                g_score[jump_point] = tentative_g
+                came_from[jump_point] = current
+                h = abs(jr - end_i) + abs(jc - end_j)
+                heapq.heappush(open_list, (tentative_g + h, jump_point))
+                pushed += 1
+        if len(open_list) > peak:
+            peak = len(open_list)
+
+    _record(stats, peak, pushed, pushed + popped, reopened)
+    return None
+''' Jump Point Search: A* que solo expande puntos de salto en lugar de cada
+    celda. Devuelve un camino óptimo (misma longitud que a_star), aunque entre
+    caminos empatados puede elegir otro'''
+
+def _expand_jump_path(maze, came_from, end):
+    # Rellena las celdas intermedias entre puntos de salto consecutivos
+    jump_points = []
+    current = end
+    while current != -1:
+        jump_points.append(maze.coords(current))
+        current = came_from[current]
+    jump_points.reverse()
+
+    path = [jump_points[0]]
+    for (r, c), (nr, nc) in zip(jump_points, jump_points[1:]):
+        dr = (nr > r) - (nr < r)
+        dc = (nc > c) - (nc < c)
+        while (r, c) != (nr, nc):
+            r += dr
+            c += dc
+            path.append((r, c))
+    return path
+
+# =============================================================================
+# BÚSQUEDAS BIDIRECCIONALES (desde 'S' y desde 'E' a la vez)
+# =============================================================================
+def _join_paths(maze, parent_f, parent_b, meet):
+    # Mitad hacia adelante: de meet hasta 'S'; mitad hacia atrás: de meet hasta 'E'
+    path = []
+    current = meet
+    while current != -1:
+        path.append(maze.coords(current))
+        current = parent_f[current]
+    path.reverse()
+    current = parent_b[meet]
+    while current != -1:
+        path.append(maze.coords(current))
+        current = parent_b[current]
+    return path
+
+@_timed
+def bidirectional_bfs(maze, start, end, stats=None):
+    maze = maze if isinstance(maze, PackedMaze) else pack_maze(maze)
+    if _blocked(maze, start, end):
+        return None
+    start = maze.index(start)
+    end = maze.index(end)
+    if start == end:
+        return [maze.coords(start)]
+
+    dist_f = _index_buffer(maze.size, -1)   # -1 = no alcanzado desde ese lado
+    dist_b = _index_buffer(maze.size, -1)
+    parent_f = _index_buffer(maze.size, -1)
+    parent_b = _index_buffer(maze.size, -1)
+    dist_f[start] = 0
+    dist_b[end] = 0
+    frontier_f = [start]
+    frontier_b = [end]
+    peak = pushed = 2
+
+    while frontier_f and frontier_b:
+        # Expandir una capa completa del lado con la frontera más chica
+        if len(frontier_f) <= len(frontier_b):
+            frontier, dist, parent, other_dist = frontier_f, dist_f, parent_f, dist_b
+        else:
+            frontier, dist, parent, other_dist = frontier_b, dist_b, parent_b, dist_f
+
+        next_frontier = []
+        best = float('inf')
+        meet = -1
+        for current in frontier:
+            if stats is not None:
+                stats.nodes_expanded += 1
+            for neighbor in maze.neighbors(current):
+                if dist[neighbor] != -1:
+                    continue
+                dist[neighbor] = dist[current] + 1
+                parent[neighbor] = current
+                next_frontier.append(neighbor)
+                pushed += 1
+                # Al terminar la capa se elige el encuentro más corto de toda la capa
+                if other_dist[neighbor] != -1 and dist[neighbor] + other_dist[neighbor] < best:
+                    best = dist[neighbor] + other_dist[neighbor]
+                    meet = neighbor
+
+        if frontier is frontier_f:
+            frontier_f = next_frontier
+        else:
+            frontier_b = next_frontier
+        peak = max(peak, len(frontier_f) + len(frontier_b))
+        if meet != -1:
+            _record(stats, peak, pushed)
+            return _join_paths(maze, parent_f, parent_b, meet)
+
+    _record(stats, peak, pushed)
+    return None
+''' BFS desde ambos extremos por capas completas. Se detiene en la primera capa
+    donde las dos búsquedas se tocan, así que el camino es el más corto'''
+
+@_timed
+def bidirectional_a_star(maze, start, end, stats=None):
+    maze = maze if isinstance(maze, PackedMaze) else pack_maze(maze)
+    if _blocked(maze, start, end):
+        return None
+    start = maze.index(start)
+    end = maze.index(end)
+    cols = maze.cols
+    start_i, start_j = maze.coords(start)
+    end_i, end_j = maze.coords(end)
+
+    g_f = _index_buffer(maze.size, -1)
+    g_b = _index_buffer(maze.size, -1)
+    parent_f = _index_buffer(maze.size, -1)
+    parent_b = _index_buffer(maze.size, -1)
+    closed_f = bytearray(maze.size)
+    closed_b = bytearray(maze.size)
+    g_f[start] = 0
+    g_b[end] = 0
+    open_f = [(abs(start_i - end_i) + abs(start_j - end_j), start)]
+    open_b = [(abs(start_i - end_i) + abs(start_j - end_j), end)]
+
+    best = float('inf')   # Costo del mejor camino completo encontrado (mu)
+    meet = start if start == end else -1
+    if meet != -1:
+        best = 0
+    peak = pushed = 2
+    popped = 0
+
+    while True:
+        # Descartar entradas viejas antes de mirar el tope de cada cola
+        while open_f and closed_f[open_f[0][1]]:
+            heapq.heappop(open_f)
+            popped += 1
+        while open_b and closed_b[open_b[0][1]]:
+            heapq.heappop(open_b)
+            popped += 1
+        if not open_f or not open_b:
+            break
+        # Terminación óptima: si el menor f de cualquiera de los dos lados ya no
+        # puede mejorar el mejor camino, ningún camino pendiente es más corto
+        if open_f[0][0] >= best or open_b[0][0] >= best:
+            break
+
+        forward = len(open_f) <= len(open_b)
+        if forward:
+            open_list, g, other_g, parent, closed = open_f, g_f, g_b, parent_f, closed_f
+            target_i, target_j = end_i, end_j
+        else:
+            open_list, g, other_g, parent, closed = open_b, g_b, g_f, parent_b, closed_b
+            target_i, target_j = start_i, start_j
+
+        _, current = heapq.heappop(open_list)
+        popped += 1
+        closed[current] = 1
+        if stats is not None:
+            stats.nodes_expanded += 1
+
+        tentative_g = g[current] + 1
+        for neighbor in maze.neighbors(current):
+            old_g = g[neighbor]
+            if old_g == -1 or tentative_g < old_g:
+                g[neighbor] = tentative_g
+                parent[neighbor] = current
+                h = abs(neighbor // cols - target_i) + abs(neighbor % cols - target_j)
+                heapq.heappush(open_list, (tentative_g + h, neighbor))
+                pushed += 1
+            if other_g[neighbor] != -1 and g[neighbor] + other_g[neighbor] < best:
+                best = g[neighbor] + other_g[neighbor]
+                meet = neighbor
+        peak = max(peak, len(open_f) + len(open_b))
+
+    _record(stats, peak, pushed, pushed + popped)
+    if meet == -1:
+        return None
+    return _join_paths(maze, parent_f, parent_b, meet)
+''' A* bidireccional (cada lado con Manhattan hacia el extremo opuesto). Siempre
+    expande el lado con la cola más chica y termina cuando el mejor f de alguno
+    de los dos lados alcanza al mejor camino encontrado, lo que garantiza optimalidad'''
+
+# Motores de búsqueda disponibles, seleccionables por nombre
+ENGINES = {
+    'a_star': a_star,
+    'jps': jump_point_search,
+    'bfs': bfs,
+    'dfs': dfs,
+    'bidirectional_bfs': bidirectional_bfs,
+    'bidirectional_a_star': bidirectional_a_star,
+}
+
+def solve(maze, start, end, engine='a_star', stats=None):
+    if engine not in ENGINES:
+        raise ValueError(f"Motor desconocido '{engine}'. Opciones: {', '.join(ENGINES)}")
+    return ENGINES[engine](maze, start, end, stats=stats)
+
+# =============================================================================
+# EXPORTACIÓN DE SOLUCIONES
+# =============================================================================
+EXCEL_MAX_ROWS = 1048576   # Límites de una hoja de Excel
+EXCEL_MAX_COLS = 16384
+EXCEL_PRACTICAL_CELLS = 1_000_000   # Más allá de esto main() solo exporta la imagen
+
+def _maze_rows(maze):
+    # Filas del laberinto como listas de textos ('0', '1', 'S', 'E'), sea cual sea el formato
+    if not isinstance(maze, PackedMaze):
+        yield from maze
+        return
+    cells = np.asarray(maze.cells).reshape(maze.rows, maze.cols)
+    for i in range(maze.rows):
+        row = np.where(cells[i] == 1, '1', '0').tolist()
+        if maze.start is not None and maze.start // maze.cols == i:
+            row[maze.start % maze.cols] = 'S'
+        if maze.end is not None and maze.end // maze.cols == i:
+            row[maze.end % maze.cols] = 'E'
+        yield row
+
 def create_excel_with_colored_solutions(maze, a_star_path, dfs_path, bfs_path, filename):
-    # Crear un nuevo libro de trabajo de Excel
-    wb = Workbook()
+    rows = maze.rows if isinstance(maze, PackedMaze) else len(maze)
+    cols = maze.cols if isinstance(maze, PackedMaze) else (len(maze[0]) if maze else 0)
+    if rows > EXCEL_MAX_ROWS or cols > EXCEL_MAX_COLS:
+        raise ValueError(f"El laberinto ({rows}x{cols}) no cabe en una hoja de Excel; use export_maze_image")
+
+    # Libro en modo solo escritura: las filas se escriben en orden y no quedan en memoria
+    wb = Workbook(write_only=True)
     
-    # Definir colores
+    # Definir colores (un solo objeto de estilo por tipo, compartido por todas las celdas)
     start_fill = PatternFill(start_color="00FF00", end_color="00FF00", fill_type="solid")  # Verde para inicio
     end_fill = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")    # Rojo para fin
     path_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")   # Amarillo para camino
     obstacle_fill = PatternFill(start_color="000000", end_color="000000", fill_type="solid") # Negro para obstáculos
     free_fill = PatternFill(start_color="FFFFFF", end_color="FFFFFF", fill_type="solid")    # Blanco para celdas libres
+    fills = {'S': start_fill, 'E': end_fill, '1': obstacle_fill, '0': free_fill, '*': path_fill}
+    
+    # Ancho de columna según el texto más largo de cada una (como antes, máximo 10)
+    widths = [1] * cols
+    for row in _maze_rows(maze):
+        for j, cell in enumerate(row):
+            if len(cell) > widths[j]:
+                widths[j] = len(cell)
     
     # Crear hojas para cada algoritmo
     algorithms = {
@@ -176,79 +1044,141 @@ def create_excel_with_colored_solutions(maze, a_star_path, dfs_path, bfs_path, f
     }
     
     for algo_name, path in algorithms.items():
-        if algo_name == "A_Star":
-            ws = wb.active
-            ws.title = algo_name
-        else:
-            ws = wb.create_sheet(algo_name)
+        ws = wb.create_sheet(algo_name)
+        # En modo solo escritura los anchos se fijan antes de escribir filas
+        for j, width in enumerate(widths):
+            ws.column_dimensions[get_column_letter(j + 1)].width = min(width + 2, 10)
         
-        # Escribir el laberinto en la hoja
-        for i, row in enumerate(maze):
-            for j, cell in enumerate(row):
-                ws.cell(row=i+1, column=j+1, value=cell)
-                
-                # Aplicar colores según el tipo de celda
-                if cell == 'S':
-                    ws.cell(i+1, j+1).fill = start_fill
-                elif cell == 'E':
-                    ws.cell(i+1, j+1).fill = end_fill
-                elif cell == '1':
-                    ws.cell(i+1, j+1).fill = obstacle_fill
-                else:
-                    ws.cell(i+1, j+1).fill = free_fill
+        # Celdas del camino agrupadas por fila
+        path_by_row = {}
+        for i, j in path or []:
+            path_by_row.setdefault(i, set()).add(j)
         
-        # Resaltar el camino encontrado
-        if path:
-            for i, j in path:
-                if maze[i][j] not in ['S', 'E']:
-                    ws.cell(row=i+1, column=j+1).value = '*'
-                    ws.cell(row=i+1, column=j+1).fill = path_fill
-    
-    # Ajustar el ancho de las columnas para mejor visualización
-    for sheet_name in wb.sheetnames:
-        ws = wb[sheet_name]
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 10)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        # Escribir el laberinto fila por fila, resaltando el camino encontrado
+        for i, row in enumerate(_maze_rows(maze)):
+            on_path = path_by_row.get(i, ())
+            out = []
+            for j, cell in enumerate(row):
+                if j in on_path and cell not in ('S', 'E'):
+                    cell = '*'
+                out_cell = WriteOnlyCell(ws, value=cell)
+                out_cell.fill = fills.get(cell, free_fill)
+                out.append(out_cell)
+            ws.append(out)
     
     # Guardar el archivo Excel
     wb.save(filename)
     print(f"Archivo Excel con soluciones guardado en: {os.path.abspath(filename)}")
 
+# Colores de la imagen (RGB): fondo, paredes, inicio, fin y un color por camino
+IMAGE_FREE = (255, 255, 255)
+IMAGE_WALL = (0, 0, 0)
+IMAGE_START = (0, 255, 0)
+IMAGE_END = (255, 0, 0)
+PATH_COLORS = {
+    "A_Star": (255, 255, 0),   # Amarillo, como en el Excel
+    "DFS": (0, 128, 255),
+    "BFS": (255, 128, 0),
+}
+
+def export_maze_image(maze, paths, filename, scale=1, colors=None, block_rows=256):
+    maze = maze if isinstance(maze, PackedMaze) else pack_maze(maze)
+    colors = {**PATH_COLORS, **(colors or {})}
+    if len(paths) > 252:
+        raise ValueError("La imagen admite a lo sumo 252 caminos superpuestos")
+
+    # Una etiqueta por celda (0 libre, 1 pared, 2 inicio, 3 fin, 4+ camino k) y una
+    # paleta etiqueta -> color; la imagen sale de indexar la paleta en bloque
+    palette = [IMAGE_FREE, IMAGE_WALL, IMAGE_START, IMAGE_END]
+    labels = np.asarray(maze.cells, dtype=np.uint8).copy()
+    for name, path in paths.items():
+        palette.append(colors.get(name, (128, 128, 128)))
+        if path:
+            cells = np.fromiter((i * maze.cols + j for i, j in path), dtype=np.int64, count=len(path))
+            labels[cells] = len(palette) - 1  # Los caminos posteriores quedan encima
+    if maze.start is not None:
+        labels[maze.start] = 2
+    if maze.end is not None:
+        labels[maze.end] = 3
+    labels = labels.reshape(maze.rows, maze.cols)
+    palette = np.array(palette, dtype=np.uint8)
+
+    def blocks():
+        # Bloques de filas ya escalados, para no armar la imagen completa en memoria
+        for top in range(0, maze.rows, block_rows):
+            block = labels[top:top + block_rows]
+            if scale > 1:
+                block = np.repeat(np.repeat(block, scale, axis=0), scale, axis=1)
+            yield block
+
+    width, height = maze.cols * scale, maze.rows * scale
+    if filename.lower().endswith('.ppm'):
+        with open(filename, 'wb') as file:
+            file.write(f"P6\n{width} {height}\n255\n".encode('ascii'))
+            for block in blocks():
+                file.write(palette[block].tobytes())
+    else:
+        _write_png(filename, width, height, palette, blocks())
+    print(f"Imagen con soluciones guardada en: {os.path.abspath(filename)}")
+''' Exporta el laberinto con los caminos superpuestos a PNG (con paleta) o PPM,
+    sin límite de tamaño de hoja. paths: {nombre: camino}; cada camino se pinta con
+    colors[nombre] (por defecto PATH_COLORS) y scale agranda cada celda a scale x scale'''
+
+def _write_png(filename, width, height, palette, blocks):
+    def chunk(kind, data):
+        file.write(struct.pack('>I', len(data)) + kind + data)
+        file.write(struct.pack('>I', zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+    with open(filename, 'wb') as file:
+        file.write(b'\x89PNG\r\n\x1a\n')
+        chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 3, 0, 0, 0))  # 8 bits, paleta
+        chunk(b'PLTE', palette.tobytes())
+        compressor = zlib.compressobj(6)
+        for block in blocks:
+            # Cada fila del PNG empieza con el byte de filtro (0 = sin filtro)
+            raw = np.empty((block.shape[0], block.shape[1] + 1), dtype=np.uint8)
+            raw[:, 0] = 0
+            raw[:, 1:] = block
+            data = compressor.compress(raw.tobytes())
+            if data:
+                chunk(b'IDAT', data)
+        chunk(b'IDAT', compressor.flush())
+        chunk(b'IEND', b'')
+''' Escribe un PNG indexado (una etiqueta de paleta por píxel) bloque por bloque'''
+
 def main():
     try:
         input_filename = 'C:/Users/Rodri/OneDrive/Documentos/GitHub/IA/1er Parcial/laberinto.csv'
         output_filename = 'laberinto_soluciones.xlsx'
+        image_filename = 'laberinto_soluciones.png'
         
-        maze = load_maze(input_filename)        
-        start, end = find_start_end(maze)
+        grid = open_maze(input_filename)  # Las búsquedas corren sobre la forma empaquetada
+        start, end = find_start_end(grid)
         
         print("Ejecutando A*...")
-        a_star_path = a_star(maze, start, end)
+        a_star_path = a_star(grid, start, end)
         
         print("Ejecutando DFS...")
-        dfs_path = dfs(maze, start, end)
+        dfs_path = dfs(grid, start, end)
         
         print("Ejecutando BFS...")
-        bfs_path = bfs(maze, start, end)
+        bfs_path = bfs(grid, start, end)
         
         if a_star_path and dfs_path and bfs_path:
             print(f"A* encontró un camino de {len(a_star_path)} pasos")
             print(f"DFS encontró un camino de {len(dfs_path)} pasos")
             print(f"BFS encontró un camino de {len(bfs_path)} pasos")
             
-            # Crear archivo Excel con las soluciones
-            create_excel_with_colored_solutions(maze, a_star_path, dfs_path, bfs_path, output_filename)
+            # Imagen con los tres caminos superpuestos (sirve para cualquier tamaño)
+            export_maze_image(grid, {"BFS": bfs_path, "DFS": dfs_path, "A_Star": a_star_path}, image_filename)
+            
+            # Crear archivo Excel con las soluciones (solo si el mapa es razonable para una hoja)
+            if grid.size <= EXCEL_PRACTICAL_CELLS:
+                create_excel_with_colored_solutions(grid, a_star_path, dfs_path, bfs_path, output_filename)
+            else:
+                print("Laberinto demasiado grande para Excel: se generó solo la imagen.")
             
-            print("Proceso completado. Revise el archivo Excel generado.")
+            print("Proceso completado. Revise los archivos generados.")
         else:
             print("Al menos uno de los algoritmos no encontró un camino válido.")
             
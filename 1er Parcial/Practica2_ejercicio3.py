@@ -3,13 +3,25 @@
 -Conforme la temperatura baja (enfriamiento controlado), el algoritmo se vuelve más estricto y sólo acepta mejoras o cambios muy cercanos, estabilizándose 
 alrededor de un mínimo.
 -Su objetivo: encontrar el mínimo global de una función, evitando quedarse atrapado en mínimos locales.'''
+import argparse
 import math
+import os
 import random
+import time
+from collections import OrderedDict
+from multiprocessing import Pool
 
-# Función de Himmelblau, toma dos variables x y y
+import numpy as np
+
+from benchmark_comun import print_speedup
+
+# Función de Himmelblau, toma dos variables x y y (números o arreglos de numpy)
 def himmelblau(x, y):
     return (x**2 + y - 11)**2 + (x + y**2 - 7)**2
 
+# Región donde se buscan los mínimos de Himmelblau: (mínimo, máximo) por coordenada
+HIMMELBLAU_BOUNDS = ((-6, 6), (-6, 6))
+
 # Función de recocido simulado con criterio de Boltzmann
 def simulated_annealing(x0, y0, T=1000, T_min=1e-6, alpha=0.95, steps_per_T=100):
     """
@@ -18,56 +30,452 @@ def simulated_annealing(x0, y0, T=1000, T_min=1e-6, alpha=0.95, steps_per_T=100)
     T_min: temperatura mínima (criterio de parada).
     alpha: factor de enfriamiento (qué tan rápido baja la temperatura).
     steps_per_T: intentos de movimiento en cada temperatura."""
+    return anneal(himmelblau, (x0, y0), None, T, T_min, alpha, steps_per_T)
+
+# Ajuste del paso según la tasa de aceptación (ver target_acceptance)
+ADAPT_GAIN = 2.0     # paso *= exp(ADAPT_GAIN * (tasa - objetivo)) en cada temperatura
+MIN_STEP = 1e-9      # El paso nunca baja de aquí...
+MAX_STEP_FACTOR = 10 # ...ni sube de MAX_STEP_FACTOR veces el paso inicial
+VECTOR_BATCH_ACCEPTANCE = 0.2   # Lote * tasa de aceptación en anneal(vectorized=True)
+# Opciones recomendadas: paso adaptativo, enfriamiento más rápido y parada por convergencia
+ADAPTIVE = dict(target_acceptance=0.4, alpha=0.85, patience=5)
+
+# El mismo recocido para cualquier función objetivo y cualquier cantidad de variables
+def anneal(objective, x0, bounds=None, T=1000, T_min=1e-6, alpha=0.95, steps_per_T=100,
+           step=0.5, rng=random, max_evals=None, target_acceptance=None, patience=None,
+           tol=1e-6, max_reheats=0, reheat_factor=10.0, trace=None, vectorized=False):
+    """
+    objective: función a minimizar; recibe las coordenadas como argumentos (objective(*punto)).
+    x0: punto inicial (una coordenada por variable).
+    bounds: (mínimo, máximo) por coordenada; los vecinos que se salen se recortan al
+    borde. None = sin límites (como el original).
+    step: tamaño máximo del movimiento en cada coordenada.
+    rng: generador de números aleatorios: el módulo random o random.Random(semilla)
+    (un número por llamada, como el original) o np.random.default_rng(semilla): los
+    saltos y los umbrales de aceptación de cada temperatura se sacan en un bloque.
+    vectorized: objective recibe un arreglo por coordenada y devuelve un valor por
+    punto (himmelblau ya funciona así); se evalúan varias propuestas por llamada.
+    Las que siguen a una aceptación se descartan (~10% de lo evaluado), así que
+    conviene cuando cada llamada cuesta más que cada punto. Sin max_evals da el mismo
+    resultado que vectorized=False con la misma semilla (requiere rng de numpy).
+    Para funciones caras, ver CachedObjective.
+    Enfriamiento adaptativo (todo opcional; con None se comporta como el original):
+    max_evals: presupuesto de puntos evaluados (con vectorized, también los
+    descartados); al agotarse se devuelve lo mejor.
+    target_acceptance: tasa de aceptación buscada (p. ej. 0.4); después de cada
+    temperatura el paso crece si se aceptó más que eso y se achica si se aceptó menos.
+    patience, tol: la cadena convergió si al final de patience temperaturas seguidas
+    el valor actual quedó a menos de tol del mejor (criterio de Corana). Entonces
+    se termina antes de llegar a T_min...
+    max_reheats, reheat_factor: ...salvo que queden recalentamientos: se vuelve al
+    mejor estado con T *= reheat_factor para buscar una cuenca mejor.
+    trace: lista opcional; se le agrega un diccionario por temperatura con evals, T,
+    step, acceptance (tasa de aceptación), value (valor actual) y best (mejor valor).
+    Devuelve (mejor_estado, mejor_valor)."""
     # Estado inicial
-    estado_actual = (x0, y0)
-    valor_actual = himmelblau(*estado_actual)
+    estado_actual = tuple(x0)
+    if vectorized:
+        if not isinstance(rng, np.random.Generator):
+            raise ValueError("vectorized=True requiere rng = np.random.default_rng(semilla)")
+        valor_actual = float(objective(*np.array(estado_actual, dtype=float)[:, None])[0])
+    else:
+        valor_actual = objective(*estado_actual)
     mejor_estado = estado_actual
     mejor_valor = valor_actual
+    evals = 1
+    max_step = step * MAX_STEP_FACTOR
+    convergidas = 0         # Temperaturas seguidas terminando cerca del mejor valor
+    recalentamientos = 0
+    tasa = 1.0              # Tasa de aceptación de la temperatura anterior
+    bloques = isinstance(rng, np.random.Generator)
     
     # Mientras la temperatura sea mayor a T_min
     while T > T_min:
-        for _ in range(steps_per_T):
-            # Generar estado vecino (movimiento pequeño)
-            x_new = estado_actual[0] + random.uniform(-0.5, 0.5)
-            y_new = estado_actual[1] + random.uniform(-0.5, 0.5)
-            estado_nuevo = (x_new, y_new)
-            valor_nuevo = himmelblau(*estado_nuevo)
-            '''Se crea un estado vecino moviéndose un poco en x y y (entre -0.5 y 0.5).
-            Se evalúa Himmelblau en ese punto → valor_nuevo.'''
-            delta = valor_nuevo - valor_actual
-            '''Si delta < 0, el nuevo estado es mejor.
-            Si delta > 0, el nuevo estado es peor.'''
-            # Criterio de aceptación (Boltzmann)
-            if delta < 0:
-                estado_actual, valor_actual = estado_nuevo, valor_nuevo
+        aceptados = pasos = 0
+        if bloques:
+            tasa = max(tasa, 1 / steps_per_T)
+            if vectorized:
+                # Lo evaluado después de una aceptación se descarta: lotes de
+                # VECTOR_BATCH_ACCEPTANCE / tasa propuestas descartan ~10% de lo evaluado
+                lote = max(1, min(steps_per_T, int(VECTOR_BATCH_ACCEPTANCE / tasa)))
             else:
-                p = math.exp(-delta / T)
-                if random.random() < p:
+                # Solo se arman (sin evaluar): unas dos veces las esperadas hasta la próxima aceptación
+                lote = max(1, min(steps_per_T, round(2 / tasa)))
+            (estado_actual, valor_actual, mejor_estado, mejor_valor, aceptados, pasos,
+             evaluados) = _block_level(objective, estado_actual, valor_actual, mejor_estado,
+                                       mejor_valor, T, step, steps_per_T, bounds, rng, lote,
+                                       vectorized, None if max_evals is None else max_evals - evals)
+            evals += evaluados
+        else:
+            for _ in range(steps_per_T):
+                if max_evals is not None and evals >= max_evals:
+                    break
+                # Generar estado vecino (movimiento pequeño)
+                estado_nuevo = tuple(v + rng.uniform(-step, step) for v in estado_actual)
+                if bounds is not None:
+                    estado_nuevo = tuple(min(max(v, low), high) for v, (low, high) in zip(estado_nuevo, bounds))
+                valor_nuevo = objective(*estado_nuevo)
+                evals += 1
+                pasos += 1
+                '''Se crea un estado vecino moviéndose un poco en cada coordenada (entre -step y step).
+                Se evalúa la función objetivo en ese punto → valor_nuevo.'''
+                delta = valor_nuevo - valor_actual
+                '''Si delta < 0, el nuevo estado es mejor.
+                Si delta > 0, el nuevo estado es peor.'''
+                # Criterio de aceptación (Boltzmann)
+                if delta < 0:
                     estado_actual, valor_actual = estado_nuevo, valor_nuevo
-            '''Si el nuevo estado es mejor → lo aceptamos siempre.
-            Si es peor → lo aceptamos con criterio de descenso de boltzmann
-            random.random() genera un número entre [0,1].
-            Si es menor que p, aceptamos el cambio.
-            Esto permite “subir” a estados peores al inicio, evitando caer en mínimos locales.'''
-            # Actualizar mejor solución encontrada
-            if valor_actual < mejor_valor:
-                mejor_estado, mejor_valor = estado_actual, valor_actual
-            '''Guardamos el mejor estado encontrado hasta ahora.'''
+                    aceptados += 1
+                else:
+                    p = math.exp(-delta / T)
+                    if rng.random() < p:
+                        estado_actual, valor_actual = estado_nuevo, valor_nuevo
+                        aceptados += 1
+                '''Si el nuevo estado es mejor → lo aceptamos siempre.
+                Si es peor → lo aceptamos con criterio de descenso de boltzmann
+                rng.random() genera un número entre [0,1].
+                Si es menor que p, aceptamos el cambio.
+                Esto permite “subir” a estados peores al inicio, evitando caer en mínimos locales.'''
+                # Actualizar mejor solución encontrada
+                if valor_actual < mejor_valor:
+                    mejor_estado, mejor_valor = estado_actual, valor_actual
+                '''Guardamos el mejor estado encontrado hasta ahora.'''
+        tasa = aceptados / pasos if pasos else 0.0
+        if trace is not None:
+            trace.append(dict(evals=evals, T=T, step=step, acceptance=tasa,
+                              value=valor_actual, best=mejor_valor))
+        if max_evals is not None and evals >= max_evals:
+            break   # Se agotó el presupuesto de evaluaciones
+
+        # Convergencia: recalentar o terminar
+        convergidas = convergidas + 1 if valor_actual - mejor_valor <= tol else 0
+        if patience is not None and convergidas >= patience:
+            if recalentamientos >= max_reheats:
+                break
+            T *= reheat_factor
+            estado_actual, valor_actual = mejor_estado, mejor_valor
+            recalentamientos += 1
+            convergidas = 0
+            continue
+        # Paso adaptativo según la tasa de aceptación
+        if target_acceptance is not None:
+            step = min(max(step * math.exp(ADAPT_GAIN * (tasa - target_acceptance)), MIN_STEP), max_step)
         # Enfriar la temperatura
         T *= alpha
     
     return mejor_estado, mejor_valor
 
+def _block_level(objective, estado, valor, mejor_estado, mejor_valor, T, step, n, bounds, rng,
+                 lote, vectorized, presupuesto=None):
+    # Una temperatura de anneal con los números aleatorios en bloque: n saltos y n
+    # umbrales. Boltzmann: random < exp(-delta / T) equivale a delta < -T * log(random),
+    # así que cada aceptación es una sola comparación (las mejoras, delta < 0, siempre pasan).
+    # Las próximas `lote` propuestas se arman de una vez (suma y recorte con numpy),
+    # todas desde el estado actual, y se recorren en orden; al aceptar una, las
+    # siguientes quedan viejas y se rearman desde el nuevo estado con los mismos
+    # saltos. Así la cadena es la misma que armando una propuesta por vez.
+    # presupuesto: máximo de puntos evaluados (contando los descartados).
+    # Devuelve (estado, valor, mejor_estado, mejor_valor, aceptados, pasos, evaluados).
+    saltos = rng.uniform(-step, step, (n, len(estado)))
+    umbrales = -T * np.log1p(-rng.random(n))   # 1 - random está en (0, 1]: sin log(0)
+    if bounds is not None:
+        low, high = np.array(bounds, dtype=float).T
+    aceptados = evaluados = 0
+    i = 0
+    while i < n and (presupuesto is None or evaluados < presupuesto):
+        tope = n if presupuesto is None else i + presupuesto - evaluados
+        puntos = np.add(estado, saltos[i:min(i + lote, tope)])   # (propuestas, d)
+        if bounds is not None:
+            np.minimum(np.maximum(puntos, low, out=puntos), high, out=puntos)
+        if vectorized:
+            # Todas las propuestas en una llamada
+            valores = objective(*puntos.T)
+            evaluados += len(puntos)
+            acepta = np.flatnonzero(valores - valor < umbrales[i:i + len(puntos)])
+            j = int(acepta[0]) if len(acepta) else None
+            if j is not None:
+                estado, valor = tuple(puntos[j].tolist()), float(valores[j])
+        else:
+            # Una llamada por propuesta, hasta la primera aceptada
+            j = None
+            for k, (punto, umbral) in enumerate(zip(puntos.tolist(), umbrales[i:i + lote].tolist())):
+                valor_nuevo = objective(*punto)
+                evaluados += 1
+                if valor_nuevo - valor < umbral:
+                    j = k
+                    estado, valor = tuple(punto), valor_nuevo
+                    break
+        if j is None:
+            i += len(puntos)
+            continue
+        aceptados += 1
+        if valor < mejor_valor:
+            mejor_estado, mejor_valor = estado, valor
+        i += j + 1
+    return estado, valor, mejor_estado, mejor_valor, aceptados, i, evaluados
+
+# Caché para funciones objetivo caras
+class CachedObjective:
+    """
+    Envuelve una función objetivo con un caché LRU de a lo sumo maxsize puntos. La
+    clave es el punto redondeado a múltiplos de quantum: dos puntos más cerca que eso
+    comparten el valor del primero que se evaluó. Conviene cuando cada evaluación es
+    cara y la cadena vuelve a los mismos puntos (paso chico, bounds que recortan).
+    vectorized: la función recibe un arreglo por coordenada (como en anneal con
+    vectorized=True); solo los puntos que faltan en el caché se le envían, en una
+    sola llamada.
+    hits y misses cuentan los puntos encontrados y no encontrados en el caché."""
+    def __init__(self, objective, maxsize=4096, quantum=1e-9, vectorized=False):
+        self.objective = objective
+        self.maxsize = maxsize
+        self.quantum = quantum
+        self.vectorized = vectorized
+        self.cache = OrderedDict()   # Clave -> valor, del menos al más usado
+        self.hits = self.misses = 0
+
+    def _key(self, punto):
+        return tuple(round(v / self.quantum) for v in punto)
+
+    def _get(self, clave):
+        valor = self.cache.get(clave)
+        if valor is None:
+            self.misses += 1
+        else:
+            self.cache.move_to_end(clave)
+            self.hits += 1
+        return valor
+
+    def _put(self, clave, valor):
+        self.cache[clave] = valor
+        if len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)   # Sale el menos usado
+
+    def __call__(self, *coordenadas):
+        if not self.vectorized:
+            clave = self._key(coordenadas)
+            valor = self._get(clave)
+            if valor is None:
+                valor = self.objective(*coordenadas)
+                self._put(clave, valor)
+            return valor
+
+        puntos = np.array(coordenadas, dtype=float)   # (d, puntos)
+        claves = [self._key(punto) for punto in puntos.T.tolist()]
+        valores = np.array([self._get(clave) for clave in claves], dtype=float)   # None -> nan
+        faltan = np.flatnonzero(np.isnan(valores))
+        if len(faltan):
+            valores[faltan] = self.objective(*puntos[:, faltan])
+            for i in faltan.tolist():
+                self._put(claves[i], float(valores[i]))
+        return valores
+
+# Recocido simulado con muchas cadenas a la vez (vectorizado con numpy)
+def simulated_annealing_batch(n_chains=1000, T=1000, T_min=1e-6, alpha=0.95, steps_per_T=100,
+                              bounds=HIMMELBLAU_BOUNDS, step=0.5, seed=None, objective=himmelblau,
+                              max_evals=None, target_acceptance=None, patience=None,
+                              tol=1e-6, max_reheats=0, reheat_factor=10.0, trace=None):
+    """
+    Mismo algoritmo que simulated_annealing, pero n_chains cadenas independientes
+    avanzan juntas: los estados, los vecinos y la aceptación de Boltzmann son
+    arreglos, así que cada paso es una operación de numpy para todas las cadenas.
+    bounds: (mínimo, máximo) por coordenada; ahí empiezan las cadenas (al azar) y
+    los vecinos que se salen se recortan al borde.
+    step: tamaño máximo del movimiento en cada coordenada (0.5 como el original).
+    seed: semilla del generador; con la misma semilla el resultado es idéntico.
+    objective: función vectorizada; objective(*coordenadas) recibe un arreglo por
+    coordenada y devuelve un valor por cadena (himmelblau ya funciona así).
+    Las opciones de enfriamiento adaptativo son las de anneal, con estas diferencias:
+    max_evals cuenta puntos evaluados (n_chains por paso); el paso se adapta por
+    cadena; la temperatura es común, así que la convergencia (patience, tol) es de
+    todas las cadenas: cada una terminó cerca de su mejor valor. En trace,
+    acceptance es la tasa media y value/best son los mínimos entre las cadenas.
+    Devuelve (mejores_estados, mejores_valores): arreglos de forma (n_chains, d) y
+    (n_chains,) con el mejor punto que encontró cada cadena."""
+    rng = np.random.default_rng(seed)
+    # Una fila por coordenada (d, n_chains): cada fila es contigua en memoria
+    low, high = np.array(bounds, dtype=float).T[:, :, None]
+    estado = rng.uniform(low, high, (len(low), n_chains))
+    valor = objective(*estado)
+    mejor_estado, mejor_valor = estado.copy(), valor.copy()
+    evals = n_chains
+    if target_acceptance is not None:
+        step = np.full(n_chains, float(step))   # Un paso por cadena
+    max_step = step * MAX_STEP_FACTOR
+    convergidas = 0
+    recalentamientos = 0
+
+    while T > T_min:
+        aceptados = np.zeros(n_chains)
+        pasos = 0
+        for _ in range(steps_per_T):
+            if max_evals is not None and evals + n_chains > max_evals:
+                break
+            # Un vecino por cadena
+            nuevo = estado + rng.uniform(-step, step, estado.shape)
+            np.minimum(np.maximum(nuevo, low, out=nuevo), high, out=nuevo)   # Recorte a bounds
+            valor_nuevo = objective(*nuevo)
+            evals += n_chains
+            pasos += 1
+            delta = valor_nuevo - valor
+            # Boltzmann: las mejoras siempre se aceptan (exp(0) = 1 > random);
+            # con delta >= 0 se acepta con probabilidad exp(-delta / T)
+            acepta = rng.random(n_chains) < np.exp(-np.maximum(delta, 0) / T)
+            aceptados += acepta
+            estado = np.where(acepta, nuevo, estado)
+            valor = np.where(acepta, valor_nuevo, valor)
+            # Mejor punto de cada cadena
+            mejora = valor < mejor_valor
+            mejor_estado = np.where(mejora, estado, mejor_estado)
+            mejor_valor = np.where(mejora, valor, mejor_valor)
+        tasa = aceptados / pasos if pasos else aceptados
+        if trace is not None:
+            trace.append(dict(evals=evals, T=T, step=float(np.mean(step)),
+                              acceptance=float(np.mean(tasa)), value=float(valor.min()),
+                              best=float(mejor_valor.min())))
+        if max_evals is not None and evals + n_chains > max_evals:
+            break   # No alcanza el presupuesto para otro paso de todas las cadenas
+
+        # Convergencia (de todas las cadenas): recalentar o terminar
+        convergidas = convergidas + 1 if np.all(valor - mejor_valor <= tol) else 0
+        if patience is not None and convergidas >= patience:
+            if recalentamientos >= max_reheats:
+                break
+            T *= reheat_factor
+            estado, valor = mejor_estado.copy(), mejor_valor.copy()
+            recalentamientos += 1
+            convergidas = 0
+            continue
+        # Paso adaptativo de cada cadena según su tasa de aceptación
+        if target_acceptance is not None:
+            step = np.clip(step * np.exp(ADAPT_GAIN * (tasa - target_acceptance)), MIN_STEP, max_step)
+        T *= alpha
+
+    return mejor_estado.T, mejor_valor
+
+def distinct_minima(estados, valores, tol=0.1, max_value=1e-3):
+    """
+    Agrupa los puntos con valor <= max_value (None = todos) que están a menos de tol
+    entre sí. Devuelve [(estado, valor, cuántas cadenas llegaron)] del mejor punto
+    de cada grupo, ordenado por valor."""
+    estados = np.asarray(estados, dtype=float)
+    valores = np.asarray(valores, dtype=float)
+    grupos = []   # [mejor_estado, mejor_valor, cuenta]
+    for k in np.argsort(valores, kind='stable'):
+        if max_value is not None and valores[k] > max_value:
+            break
+        punto = estados[k]
+        for grupo in grupos:
+            if np.linalg.norm(punto - grupo[0]) < tol:
+                grupo[2] += 1
+                break
+        else:
+            grupos.append([punto, float(valores[k]), 1])
+    return [(tuple(float(v) for v in estado), valor, cuenta) for estado, valor, cuenta in grupos]
+
+# Reinicios independientes en paralelo (un proceso por núcleo)
+def _restart(tarea):
+    # Un reinicio completo dentro de un proceso del pool. Cada reinicio tiene su
+    # propia semilla, así el resultado no depende de qué proceso lo corra.
+    objective, bounds, semilla, opciones = tarea
+    rng = np.random.default_rng(semilla)
+    x0 = [rng.uniform(low, high) for low, high in bounds]
+    return anneal(objective, x0, bounds, rng=rng, **opciones)
+
+def parallel_restarts(objective, bounds, n_restarts=8, workers=None, seed=0, tol=0.1,
+                      max_value=None, **opciones):
+    """
+    Corre n_restarts recocidos independientes (anneal) repartidos en un pool de
+    workers procesos (por defecto uno por núcleo) y junta los resultados.
+    objective: función objetivo escalar; debe estar definida a nivel de módulo para
+    poder enviarla a los procesos.
+    bounds: (mínimo, máximo) por coordenada, para los puntos iniciales y los vecinos.
+    seed: semilla maestra; la semilla de cada reinicio se deriva de ella
+    (np.random.SeedSequence), así que la misma semilla da los mismos resultados
+    con cualquier cantidad de procesos.
+    tol, max_value: ver distinct_minima. opciones: las de anneal (T, alpha, step,
+    target_acceptance, vectorized, ...); cada reinicio usa un rng de numpy.
+    Devuelve (resultados, minimos): [(estado, valor)] de cada reinicio en orden y
+    los mínimos distintos encontrados."""
+    semillas = [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(seed).spawn(n_restarts)]
+    tareas = [(objective, bounds, semilla, opciones) for semilla in semillas]
+    with Pool(processes=workers or os.cpu_count()) as pool:
+        resultados = pool.map(_restart, tareas, chunksize=1)
+    estados = [estado for estado, _ in resultados]
+    valores = [valor for _, valor in resultados]
+    return resultados, distinct_minima(estados, valores, tol, max_value)
+
+
+# Ejemplo: una corrida vectorizada con muchas cadenas y reinicios en paralelo
+def main():
+    parser = argparse.ArgumentParser(description="Recocido simulado sobre la función de Himmelblau")
+    parser.add_argument('--chains', type=int, default=2000, help="Cadenas de la corrida vectorizada")
+    parser.add_argument('--restarts', type=int, default=8, help="Reinicios en paralelo")
+    parser.add_argument('--workers', type=int, default=None, help="Procesos (por defecto, uno por núcleo)")
+    parser.add_argument('--scaling', nargs='*', type=int, default=[1, 2, 4, 8],
+                        help="Cantidades de procesos para medir la aceleración de los reinicios")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    # Una sola corrida vectorizada con muchas cadenas encuentra los cuatro mínimos
+    inicio = time.perf_counter()
+    estados, valores = simulated_annealing_batch(n_chains=args.chains, seed=args.seed)
+    print(f"{len(valores)} cadenas en {time.perf_counter() - inicio:.1f} s")
+    for estado, valor, cuenta in distinct_minima(estados, valores):
+        print(f"x={estado[0]:.4f}, y={estado[1]:.4f}, f={valor:.6f} ({cuenta} cadenas)")
+
+    inicio = time.perf_counter()
+    resultados, minimos = parallel_restarts(himmelblau, HIMMELBLAU_BOUNDS, args.restarts,
+                                            args.workers, args.seed, max_value=1e-3)
+    print(f"\n{len(resultados)} reinicios en paralelo en {time.perf_counter() - inicio:.1f} s")
+    for estado, valor, cuenta in minimos:
+        print(f"x={estado[0]:.4f}, y={estado[1]:.4f}, f={valor:.6f} ({cuenta} reinicios)")
+
+    # Aceleración de los reinicios según la cantidad de procesos (mismos resultados en todas)
+    if args.scaling:
+        print(f"\nNúcleos disponibles: {os.cpu_count()}")
+        tiempos = []
+        for workers in args.scaling:
+            inicio = time.perf_counter()
+            medidos, _ = parallel_restarts(himmelblau, HIMMELBLAU_BOUNDS, args.restarts, workers, args.seed)
+            tiempo = time.perf_counter() - inicio
+            if medidos != resultados:
+                raise AssertionError(f"{workers} procesos: los reinicios no coinciden")
+            tiempos.append((str(workers), tiempo))
+        print_speedup(tiempos, tiempos[0][1], args.scaling)
+
+    # Enfriamiento fijo contra adaptativo: evaluaciones gastadas y calidad obtenida
+    print(f"\n{'enfriamiento':<12} {'evaluaciones':>12} {'mediana f':>10} {'peor f':>10}")
+    for nombre, opciones in (('fijo', {}), ('adaptativo', ADAPTIVE)):
+        evals, finales = [], []
+        for corrida in range(args.restarts):
+            rng = random.Random(args.seed + corrida)
+            x0 = [rng.uniform(a, b) for a, b in HIMMELBLAU_BOUNDS]
+            traza = []
+            _, valor = anneal(himmelblau, x0, HIMMELBLAU_BOUNDS, rng=rng, trace=traza, **opciones)
+            evals.append(traza[-1]['evals'])
+            finales.append(valor)
+        finales.sort()
+        print(f"{nombre:<12} {sum(evals) / len(evals):>12.0f} {finales[len(finales) // 2]:>10.2e} "
+              f"{finales[-1]:>10.2e}")
+
+    # Números aleatorios de a uno o en bloques, y objetivo vectorizado (menos llamadas,
+    # algunos puntos más: los evaluados después de una aceptación se descartan)
+    print(f"\n{'modo':<12} {'tiempo (s)':>10} {'llamadas':>9} {'puntos':>9}")
+    for nombre, crear_rng, vectorizado in (('random', random.Random, False),
+                                           ('bloques', np.random.default_rng, False),
+                                           ('vectorizado', np.random.default_rng, True)):
+        llamadas = puntos = 0
+        def contada(*coordenadas):
+            nonlocal llamadas, puntos
+            llamadas += 1
+            puntos += np.size(coordenadas[0])
+            return himmelblau(*coordenadas)
+        inicio = time.perf_counter()
+        anneal(contada, (0.0, 0.0), HIMMELBLAU_BOUNDS, rng=crear_rng(args.seed), vectorized=vectorizado)
+        print(f"{nombre:<12} {time.perf_counter() - inicio:>10.3f} {llamadas:>9} {puntos:>9}")
 
-# Ejemplo: varias corridas para encontrar mínimos
 if __name__ == "__main__":
-    resultados = []
-    for i in range(5):
-        x0 = random.uniform(-6, 6)
-        y0 = random.uniform(-6, 6)
-        estado, valor = simulated_annealing(x0, y0)
-        resultados.append((estado, valor))
-        print(f"Run {i+1}: x={estado[0]:.4f}, y={estado[1]:.4f}, f={valor:.6f}")
+    main()
 '''Se obtienen al menos uno de los cuatro minimos globales.
     (3.0,2.0)
     (-2.805,3.131)
@@ -10,6 +10,42 @@
 #define PLAYER 'O'
 #define COMPUTER 'X'
 
+// Profundidad de la búsqueda en curso (el modo benchmark la cambia)
+static int max_depth = MAX_DEPTH;
+
+// =============================================================================
+// MODO BENCHMARK (compilar con -DBENCHMARK, ver gato_benchmark.py)
+// =============================================================================
+// Mismos contadores que SearchProfile de gato_motor.py: nodos por profundidad,
+// hojas, cortes, cortes con la primera jugada y, con timers, el tiempo de
+// ordenamiento y de evaluación. Sin -DBENCHMARK las macros no generan código.
+#ifdef BENCHMARK
+#include <time.h>
+
+static long long nodes_by_depth[N*N + 1];
+static long long leaves, cutoffs, first_move_cutoffs;
+static double ordering_time, evaluation_time;
+static int use_timers = 0;
+
+static double now(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec + ts.tv_nsec * 1e-9;
+}
+
+#define BENCH_NODE(depth) (nodes_by_depth[depth]++)
+#define BENCH_LEAF() (leaves++)
+#define BENCH_CUTOFF(k) (cutoffs++, first_move_cutoffs += ((k) == 0))
+#define BENCH_START() double bench_start = use_timers ? now() : 0.0
+#define BENCH_STOP(total) do { if (use_timers) (total) += now() - bench_start; } while (0)
+#else
+#define BENCH_NODE(depth)
+#define BENCH_LEAF()
+#define BENCH_CUTOFF(k)
+#define BENCH_START()
+#define BENCH_STOP(total)
+#endif
+
 // Estructura para representar un movimiento
 typedef struct {
     int i, j;
@@ -36,6 +72,7 @@ int is_board_full(char board[N][N]);
 // =============================================================================
 // FUNCIÓN PRINCIPAL - CORREGIDA
 // =============================================================================
+#ifndef BENCHMARK
 int main() {
     char board[N][N];
     int game_over = 0;
@@ -128,6 +165,64 @@ int main() {
     
     return 0;
 }
+#else
+// Uso: ./gato_bench <profundidad> <timers 0|1> < posiciones
+// Cada línea de entrada es un tablero de N*N caracteres ('X', 'O' o '.') por filas.
+// Para cada posición busca con profundidad 0, 1, ..., <profundidad> (sin pasar de
+// vacías - 1, como la profundización iterativa) e imprime una línea por profundidad:
+// posición profundidad i j segundos_acumulados nodos hojas cortes cortes_primera
+// t_ordenamiento t_evaluación nodos_por_profundidad(separados por comas)
+int main(int argc, char *argv[]) {
+    char line[256];
+    char board[N][N];
+    int depth_limit = argc > 1 ? atoi(argv[1]) : MAX_DEPTH;
+    int position = 0;
+    int depth, i, j, empty;
+    
+    use_timers = argc > 2 ? atoi(argv[2]) : 0;
+    while (fgets(line, sizeof(line), stdin) != NULL) {
+        if (strlen(line) < N*N) continue;
+        for (i = 0; i < N; i++) {
+            for (j = 0; j < N; j++) {
+                char c = line[i*N + j];
+                board[i][j] = (c == COMPUTER || c == PLAYER) ? c : EMPTY;
+            }
+        }
+        
+        // Con profundidad = vacías - 1 todas las hojas ya son finales
+        empty = 0;
+        for (i = 0; i < N; i++) {
+            for (j = 0; j < N; j++) {
+                if (board[i][j] == EMPTY) empty++;
+            }
+        }
+        
+        memset(nodes_by_depth, 0, sizeof(nodes_by_depth));
+        leaves = cutoffs = first_move_cutoffs = 0;
+        ordering_time = evaluation_time = 0.0;
+        double start = now();
+        for (depth = 0; depth <= depth_limit && depth < empty; depth++) {
+            max_depth = depth;
+            Move move = best_move(board);
+            double elapsed = now() - start;
+            long long nodes = 0;
+            for (i = 0; i <= N*N; i++) nodes += nodes_by_depth[i];
+            
+            printf("%d %d %d %d %.9f %lld %lld %lld %lld %.9f %.9f ", position, depth,
+                   move.i, move.j, elapsed, nodes, leaves, cutoffs, first_move_cutoffs,
+                   ordering_time, evaluation_time);
+            int last = N*N;
+            while (last > 0 && nodes_by_depth[last] == 0) last--;
+            for (i = 0; i <= last; i++) {
+                printf(i ? ",%lld" : "%lld", nodes_by_depth[i]);
+            }
+            printf("\n");
+        }
+        position++;
+    }
+    return 0;
+}
+#endif
 
 // =============================================================================
 // FUNCIÓN PARA VERIFICAR SI EL TABLERO ESTÁ LLENO
@@ -352,6 +447,7 @@ int minimax_alfa_beta(char board[N][N], int alpha, int beta, int maximizing, int
     PriorityMove moves[N*N];
     int move_count = 0;
     
+    BENCH_NODE(depth);
     // Si hay un ganador o empate, retornar evaluación
     if (result != 0) {
         return result * (100 - depth);
@@ -361,11 +457,16 @@ int minimax_alfa_beta(char board[N][N], int alpha, int beta, int maximizing, int
         return 0; // Empate
     }
     
-    if (depth >= MAX_DEPTH) {
-        return evaluate_board(board);
+    if (depth >= max_depth) {
+        BENCH_LEAF();
+        BENCH_START();
+        int score = evaluate_board(board);
+        BENCH_STOP(evaluation_time);
+        return score;
     }
     
     // Obtener y ordenar movimientos
+    BENCH_START();
     move_count = 0;
     for (i = 0; i < N; i++) {
         for (j = 0; j < N; j++) {
@@ -388,6 +489,7 @@ int minimax_alfa_beta(char board[N][N], int alpha, int beta, int maximizing, int
             }
         }
     }
+    BENCH_STOP(ordering_time);
     
     if (maximizing) {
         max_eval = INT_MIN;
@@ -402,7 +504,10 @@ int minimax_alfa_beta(char board[N][N], int alpha, int beta, int maximizing, int
             
             if (eval > max_eval) max_eval = eval;
             if (eval > alpha) alpha = eval;
-            if (beta <= alpha) break;
+            if (beta <= alpha) {
+                BENCH_CUTOFF(k);
+                break;
+            }
         }
         return max_eval;
     } else {
@@ -418,7 +523,10 @@ int minimax_alfa_beta(char board[N][N], int alpha, int beta, int maximizing, int
             
             if (eval < min_eval) min_eval = eval;
             if (eval < beta) beta = eval;
-            if (beta <= alpha) break;
+            if (beta <= alpha) {
+                BENCH_CUTOFF(k);
+                break;
+            }
         }
         return min_eval;
     }
@@ -441,6 +549,7 @@ Move best_move(char board[N][N]) {
     alpha = INT_MIN;
     
     // Obtener todos los movimientos posibles
+    BENCH_START();
     move_count = 0;
     for (i = 0; i < N; i++) {
         for (j = 0; j < N; j++) {
@@ -464,6 +573,8 @@ Move best_move(char board[N][N]) {
         }
     }
     
+    BENCH_STOP(ordering_time);
+    
     // Evaluar cada movimiento
     for (k = 0; k < move_count; k++) {
         i = moves[k].i; 
@@ -1,47 +1,33 @@
+import os
+import queue
+import threading
 import tkinter as tk
-N = 4          # Tamaño del tablero (4x4)
+from gato_motor import GatoEngine, SearchCancelled, TranspositionTable, board_to_masks
+from gato_tablas import Tablebase
+N = 4          # Tamaño del tablero (4x4); el motor admite de 4x4 a 7x7
+K = 4          # Fichas en línea necesarias para ganar (K = N es el gato clásico)
+SEARCH_RADIUS = None if N <= 4 else 1   # Solo jugar cerca de fichas puestas (None = todas)
 MAX_DEPTH = 5   # Profundidad máxima de búsqueda del algoritmo Minimax
+TIME_BUDGET_MS = 2000   # Tiempo de búsqueda por jugada de la computadora (profundización iterativa)
+# Juego resuelto (python gato_tablas.py); si el archivo no existe se busca siempre
+TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gato_4x4.tabla")
 
 # =============================================================================
 # BLOQUE 1: DETECCIÓN DE GANADOR
 # =============================================================================
+# El tablero de la interfaz sigue siendo una lista de listas; la lógica del juego
+# corre sobre bitboards (ver gato_motor.py) con las mismas reglas y valores.
+# La tabla de transposición se conserva entre jugadas y entre partidas.
+ENGINE = GatoEngine(N, MAX_DEPTH, tt=TranspositionTable(), k=K, radius=SEARCH_RADIUS)
+# La tabla solo cubre el gato clásico 4x4; se abre con memmap (no se carga entera)
+TABLE = Tablebase(TABLE_FILE) if N == K == 4 and os.path.exists(TABLE_FILE) else None
+
 def check_winner(board):
     """
     Verifica si hay un ganador en el tablero.
     Retorna: +1 (gana X), -1 (gana O), 0 (empate), None (juego continúa)
     """
-    # Verificar FILAS - Comprueba cada fila horizontalmente
-    for i in range(N):
-        if all(board[i][j] == "X" for j in range(N)): 
-            return +1  # Fila completa con X
-        if all(board[i][j] == "O" for j in range(N)): 
-            return -1  # Fila completa con O
-    
-    # Verificar COLUMNAS - Comprueba cada columna verticalmente  
-    for j in range(N):
-        if all(board[i][j] == "X" for i in range(N)): 
-            return +1  # Columna completa con X
-        if all(board[i][j] == "O" for i in range(N)): 
-            return -1  # Columna completa con O
-    
-    # Verificar DIAGONAL PRINCIPAL (de arriba-izquierda a abajo-derecha)
-    if all(board[i][i] == "X" for i in range(N)): 
-        return +1
-    if all(board[i][i] == "O" for i in range(N)): 
-        return -1
-    
-    # Verificar DIAGONAL SECUNDARIA (de arriba-derecha a abajo-izquierda)
-    if all(board[i][N-1-i] == "X" for i in range(N)): 
-        return +1
-    if all(board[i][N-1-i] == "O" for i in range(N)): 
-        return -1
-    
-    # Verificar EMPATE - si no hay espacios vacíos
-    if all(board[i][j] != " " for i in range(N) for j in range(N)):
-        return 0
-    
-    # Si no hay ganador y aún hay espacios vacíos
-    return None
+    return ENGINE.winner(*board_to_masks(board))
 
 # =============================================================================
 # BLOQUE 2: EVALUACIÓN HEURÍSTICA
@@ -68,22 +54,11 @@ def evaluate_line(line, board):
 def evaluate_board(board):
     """
     Evalúa el estado completo del tablero usando una función heurística.
-    Suma los valores de todas las líneas posibles.
+    Suma los valores de todas las líneas posibles (filas, columnas y diagonales).
+    Dentro de la búsqueda el motor no recalcula esto en cada hoja: lleva la suma al
+    día con contadores por línea que se actualizan al poner y quitar cada ficha.
     """
-    score = 0
-    
-    # Evaluar todas las FILAS y COLUMNAS
-    for i in range(N):
-        # Evaluar fila i
-        score += evaluate_line([(i, j) for j in range(N)], board)
-        # Evaluar columna i  
-        score += evaluate_line([(j, i) for j in range(N)], board)
-    
-    # Evaluar DIAGONALES
-    score += evaluate_line([(i, i) for i in range(N)], board)           # Diagonal principal
-    score += evaluate_line([(i, N-1-i) for i in range(N)], board)      # Diagonal secundaria
-    
-    return score
+    return ENGINE.evaluate(*board_to_masks(board))
 
 # =============================================================================
 # BLOQUE 3: ORDENAMIENTO PARA OPTIMIZAR PODA ALFA-BETA
@@ -92,47 +67,11 @@ def get_move_priority(i, j, board):
     """
     Asigna una prioridad a cada movimiento posible para ORDENARLOS.
     Esto optimiza la poda alfa-beta evaluando los mejores movimientos primero.
+    10000 si X gana ahí, 9000 si bloquea a O, +100 en el centro y +10 por el
+    potencial de las líneas que pasan por la casilla.
     """
-    priority = 0
-    
-    # PRIORIDAD MÁXIMA: Movimiento que GANA el juego inmediatamente
-    test_board = [row[:] for row in board]  # Copia del tablero
-    test_board[i][j] = "X"  # Probar movimiento de X
-    if check_winner(test_board) == 1:  # Si X gana con este movimiento
-        return 10000  # Prioridad máxima absoluta
-    
-    # ALTA PRIORIDAD: Movimiento que BLOQUEA al oponente de ganar
-    test_board[i][j] = "O"  # Probar movimiento de O
-    if check_winner(test_board) == -1:  # Si O ganaría en el siguiente turno
-        return 9000  # Prioridad muy alta (debemos bloquear)
-    
-    # PRIORIDAD MEDIA: Posiciones ESTRATÉGICAS (centro del tablero)
-    center = [(1,1), (1,2), (2,1), (2,2)]  # Casillas centrales en 4x4
-    if (i, j) in center:
-        priority += 100  # El centro es valioso en gato
-    
-    # PRIORIDAD BAJA: Evaluación de POTENCIAL de líneas afectadas
-    directions = [(0,1), (1,0), (1,1), (1,-1)]  # Horizontal, Vertical, Diagonales
-    
-    for dx, dy in directions:
-        line_score = 0
-        # Evaluar en ambas direcciones desde la casilla (i,j)
-        for sign in [-1, 1]:
-            count = 0
-            for k in range(1, N):  # Examinar hasta N casillas en esa dirección
-                x, y = i + sign * k * dx, j + sign * k * dy
-                # Verificar que esté dentro del tablero
-                if 0 <= x < N and 0 <= y < N:
-                    if board[x][y] == "X":  # Aliado en esa dirección
-                        count += 2
-                    elif board[x][y] == " ":  # Espacio vacío (potencial)
-                        count += 1
-                    else:  # Oponente o borde - cortar evaluación
-                        break
-            line_score += count
-        priority += line_score * 10  # Ponderar la evaluación de líneas
-    
-    return priority
+    x, o = board_to_masks(board)
+    return ENGINE.move_priority(i * N + j, x, o)
 
 # =============================================================================
 # BLOQUE 4: ALGORITMO MINIMAX CON PODA ALFA-BETA
@@ -148,131 +87,108 @@ def minimax_alfa_beta(board, alpha, beta, maximizing, depth):
     - maximizing: True si es turno del maximizador (X), False para minimizador (O)
     - depth: profundidad actual en el árbol de búsqueda
     """
-    
-    # 1. VERIFICAR ESTADO TERMINAL (ganador o empate)
-    result = check_winner(board)
-    if result is not None:
-        # Premiar victorias más rápidas (valor más alto por victoria rápida)
-        return result * (100 - depth)
-    
-    # 2. VERIFICAR LÍMITE DE PROFUNDIDAD
-    if depth >= MAX_DEPTH:
-        # Usar evaluación heurística cuando se alcanza la profundidad máxima
-        return evaluate_board(board)
-    
-    # 3. OBTENER Y ORDENAR MOVIMIENTOS (OPTIMIZACIÓN CRÍTICA)
-    moves = []
-    for i in range(N):
-        for j in range(N):
-            if board[i][j] == " ":  # Casilla vacía
-                priority = get_move_priority(i, j, board)
-                moves.append((priority, i, j))
-    
-    # ORDENAR por prioridad descendente (mejores movimientos primero)
-    moves.sort(reverse=True, key=lambda x: x[0])
-    
-    # 4. TURNO DEL MAXIMIZADOR (Jugador X - Computadora)
-    if maximizing:
-        max_eval = float("-inf")  # Inicializar con el peor valor posible
-        
-        for _, i, j in moves:  # Recorrer movimientos ORDENADOS
-            # Probar movimiento
-            board[i][j] = "X"
-            # Llamada recursiva (turno del minimizador)
-            eval = minimax_alfa_beta(board, alpha, beta, False, depth + 1)
-            # Deshacer movimiento (backtracking)
-            board[i][j] = " "
-            
-            # Actualizar mejor valor
-            max_eval = max(max_eval, eval)
-            # Actualizar alpha (mejor valor para maximizador)
-            alpha = max(alpha, eval)
-            
-            # PODA ALFA-BETA: si beta <= alpha, podar rama restante
-            if beta <= alpha:
-                break  # No evaluar los movimientos restantes
-                
-        return max_eval
-    
-    # 5. TURNO DEL MINIMIZADOR (Jugador O - Humano)  
-    else:
-        min_eval = float("inf")  # Inicializar con el peor valor posible
-        
-        for _, i, j in moves:  # Recorrer movimientos ORDENADOS
-            # Probar movimiento
-            board[i][j] = "O"
-            # Llamada recursiva (turno del maximizador)
-            eval = minimax_alfa_beta(board, alpha, beta, True, depth + 1)
-            # Deshacer movimiento (backtracking)
-            board[i][j] = " "
-            
-            # Actualizar mejor valor
-            min_eval = min(min_eval, eval)
-            # Actualizar beta (mejor valor para minimizador)
-            beta = min(beta, eval)
-            
-            # PODA ALFA-BETA: si beta <= alpha, podar rama restante
-            if beta <= alpha:
-                break  # No evaluar los movimientos restantes
-                
-        return min_eval
+    x, o = board_to_masks(board)
+    return ENGINE.minimax(x, o, alpha, beta, maximizing, depth)
 
 # =============================================================================
 # BLOQUE 5: BÚSQUEDA DEL MEJOR MOVIMIENTO
 # =============================================================================
+def choose_move(x, o, stop=None):
+    """
+    Casilla elegida para X y la profundidad alcanzada (None si salió de la tabla).
+    Primero consulta la tabla del juego resuelto; si la posición no está, busca.
+    """
+    if TABLE is not None:
+        hit = TABLE.lookup(x, o)
+        if hit is not None:
+            return hit[1], None
+    return ENGINE.iterative_deepening(x, o, budget_ms=TIME_BUDGET_MS, stop=stop)
+
 def best_move(board):
     """
     Encuentra el mejor movimiento para la computadora (jugador X).
-    Utiliza Minimax con poda alfa-beta y ordenamiento de movimientos.
+    Si hay tabla precalculada responde con la jugada perfecta; si no, utiliza
+    Minimax con poda alfa-beta y ordenamiento de movimientos, profundizando
+    de a un nivel mientras quede tiempo (TIME_BUDGET_MS). La profundidad alcanzada
+    queda en ENGINE.last_depth.
     """
-    best_val = float("-inf")  # Mejor valor encontrado (inicialmente -∞)
-    move = (-1, -1)          # Mejor movimiento encontrado
-    alpha = float("-inf")    # Límite inferior para poda alfa-beta
-    
-    # 1. OBTENER Y ORDENAR MOVIMIENTOS
-    moves = []
-    for i in range(N):
-        for j in range(N):
-            if board[i][j] == " ":
-                priority = get_move_priority(i, j, board)
-                moves.append((priority, i, j))
-    
-    # Ordenar por prioridad descendente (mejores primeros)
-    moves.sort(reverse=True, key=lambda x: x[0])
-    
-    # 2. EVALUAR CADA MOVIMIENTO POSIBLE
-    for _, i, j in moves:
-        # Probar movimiento
-        board[i][j] = "X"
-        # Evaluar movimiento usando Minimax
-        move_val = minimax_alfa_beta(board, alpha, float("inf"), False, 0)
-        # Deshacer movimiento
-        board[i][j] = " "
-        
-        # 3. ACTUALIZAR MEJOR MOVIMIENTO
-        if move_val > best_val:
-            best_val = move_val
-            move = (i, j)
-            # Actualizar alpha con el mejor valor actual
-            alpha = max(alpha, best_val)
-    
-    return move
+    cell, _ = choose_move(*board_to_masks(board))
+    if cell == -1:
+        return (-1, -1)
+    return divmod(cell, N)
 
 # =============================================================================
 # BLOQUE 6: INTERFAZ GRÁFICA (Tkinter)
 # =============================================================================
+# La computadora piensa en un hilo aparte para que la ventana no se congele.
+# El hilo deja su resultado en una cola y la interfaz la revisa con root.after
+# (Tkinter solo debe tocarse desde el hilo principal).
+search_results = queue.Queue()   # (generación, casilla, profundidad) de cada búsqueda
+search_cancel = threading.Event()  # Evento de cancelación de la búsqueda en curso
+search_generation = 0   # Sube en cada reinicio; resultados de otra generación se descartan
+engine_lock = threading.Lock()   # El motor no admite dos búsquedas a la vez
+thinking = False
+
+def search_worker(x, o, generation, cancel):
+    """
+    Corre la búsqueda de la computadora fuera del hilo de la interfaz.
+    """
+    try:
+        with engine_lock:
+            cell, depth = choose_move(x, o, stop=cancel)
+    except SearchCancelled:
+        return  # El juego se reinició mientras pensaba
+    search_results.put((generation, cell, depth))
+
+def poll_search(dots=0):
+    """
+    Revisa si el hilo terminó; mientras tanto anima el indicador "Pensando...".
+    """
+    global thinking
+    if not thinking:
+        return
+    try:
+        generation, cell, depth = search_results.get_nowait()
+    except queue.Empty:
+        label.config(text="Pensando" + "." * (dots % 3 + 1))
+        root.after(100, poll_search, dots + 1)
+        return
+    if generation != search_generation:
+        root.after(100, poll_search, dots + 1)  # Resultado viejo de antes de reiniciar
+        return
+    thinking = False
+    apply_computer_move(cell, depth)
+
+def apply_computer_move(cell, depth):
+    """
+    Coloca la X elegida por la búsqueda y verifica el resultado.
+    """
+    if cell != -1:
+        i, j = divmod(cell, N)
+        board[i][j] = "X"
+        buttons[i][j].config(text="X", state="disabled", bg="lightcoral")
+        source = "Jugada de la tabla" if depth is None else f"Profundidad alcanzada: {depth}"
+        info_label.config(text=f"{source} | Tablero: {N}x{N}")
+    
+    result = check_winner(board)
+    if result is not None:
+        show_result(result)
+    else:
+        label.config(text="Tu turno (O)")
 
 def on_click(i, j):
     """
     Maneja el clic del jugador en una casilla del tablero.
     """
+    global thinking
+    # Ignorar clics mientras la computadora piensa
+    if thinking:
+        return
     # Verificar que la casilla esté vacía y el juego no haya terminado
     if board[i][j] == " " and check_winner(board) is None:
         # 1. MOVIMIENTO DEL JUGADOR (O)
         board[i][j] = "O"
         buttons[i][j].config(text="O", state="disabled", bg="lightblue")
-        label.config(text="Pensando...")
-        root.update()  # Actualizar interfaz inmediatamente
         
         # 2. VERIFICAR SI EL JUGADOR GANÓ
         result = check_winner(board)
@@ -280,18 +196,13 @@ def on_click(i, j):
             show_result(result)
             return
         
-        # 3. MOVIMIENTO DE LA COMPUTADORA (X)
-        move = best_move(board)  # Encontrar mejor movimiento
-        if move != (-1, -1):
-            board[move[0]][move[1]] = "X"
-            buttons[move[0]][move[1]].config(text="X", state="disabled", bg="lightcoral")
-        
-        # 4. VERIFICAR RESULTADO DESPUÉS DEL MOVIMIENTO DE LA COMPUTADORA
-        result = check_winner(board)
-        if result is not None:
-            show_result(result)
-        else:
-            label.config(text="Tu turno (O)")
+        # 3. MOVIMIENTO DE LA COMPUTADORA (X), en segundo plano
+        thinking = True
+        label.config(text="Pensando...")
+        x, o = board_to_masks(board)
+        threading.Thread(target=search_worker, args=(x, o, search_generation, search_cancel),
+                         daemon=True).start()
+        root.after(100, poll_search)
 
 def show_result(result):
     """
@@ -311,9 +222,15 @@ def show_result(result):
 
 def reset_game():
     """
-    Reinicia el juego para empezar de nuevo.
+    Reinicia el juego para empezar de nuevo (cancela la búsqueda en curso).
     """
-    global board
+    global board, search_cancel, search_generation, thinking
+    # Cancelar la búsqueda en curso; la próxima usa un evento nuevo
+    search_cancel.set()
+    search_cancel = threading.Event()
+    search_generation += 1
+    thinking = False
+    
     # Reiniciar tablero lógico
     board = [[" " for _ in range(N)] for _ in range(N)]
     
@@ -328,49 +245,49 @@ def reset_game():
 # =============================================================================
 # CONFIGURACIÓN DE LA INTERFAZ GRÁFICA
 # =============================================================================
+if __name__ == "__main__":
+    # Crear ventana principal
+    root = tk.Tk()
+    root.title(f"Gato {N}x{N} ({K} en línea) con Minimax y Profundidad Limitada")
 
-# Crear ventana principal
-root = tk.Tk()
-root.title(f"Gato {N}x{N} con Minimax y Profundidad Limitada")
-
-# Inicializar tablero lógico y botones gráficos
-board = [[" " for _ in range(N)] for _ in range(N)]
-buttons = [[None for _ in range(N)] for _ in range(N)]
+    # Inicializar tablero lógico y botones gráficos
+    board = [[" " for _ in range(N)] for _ in range(N)]
+    buttons = [[None for _ in range(N)] for _ in range(N)]
 
-# Crear botones del tablero
-for i in range(N):
-    for j in range(N):
-        # Crear botón para cada casilla
-        buttons[i][j] = tk.Button(
-            root, 
-            text=" ", 
-            font=("Arial", 16, "bold"), 
-            width=4, 
-            height=2,
-            command=lambda i=i, j=j: on_click(i, j)  # Asignar función al clic
-        )
-        buttons[i][j].grid(row=i, column=j, padx=2, pady=2)
+    # Crear botones del tablero
+    for i in range(N):
+        for j in range(N):
+            # Crear botón para cada casilla
+            buttons[i][j] = tk.Button(
+                root, 
+                text=" ", 
+                font=("Arial", 16, "bold"), 
+                width=4, 
+                height=2,
+                command=lambda i=i, j=j: on_click(i, j)  # Asignar función al clic
+            )
+            buttons[i][j].grid(row=i, column=j, padx=2, pady=2)
 
-# Etiqueta para mostrar el estado del juego
-label = tk.Label(root, text="Tu turno (O)", font=("Arial", 14, "bold"))
-label.grid(row=N, column=0, columnspan=N, pady=10)
+    # Etiqueta para mostrar el estado del juego
+    label = tk.Label(root, text="Tu turno (O)", font=("Arial", 14, "bold"))
+    label.grid(row=N, column=0, columnspan=N, pady=10)
 
-# Botón para reiniciar el juego
-reset_button = tk.Button(
-    root, 
-    text="Reiniciar Juego", 
-    font=("Arial", 12), 
-    command=reset_game
-)
-reset_button.grid(row=N+1, column=0, columnspan=N, pady=5)
+    # Botón para reiniciar el juego
+    reset_button = tk.Button(
+        root, 
+        text="Reiniciar Juego", 
+        font=("Arial", 12), 
+        command=reset_game
+    )
+    reset_button.grid(row=N+1, column=0, columnspan=N, pady=5)
 
-# Etiqueta informativa
-info_label = tk.Label(
-    root, 
-    text=f"Profundidad de búsqueda: {MAX_DEPTH} | Tablero: {N}x{N}", 
-    font=("Arial", 10)
-)
-info_label.grid(row=N+2, column=0, columnspan=N, pady=5)
+    # Etiqueta informativa
+    info_label = tk.Label(
+        root, 
+        text=f"Tiempo por jugada: {TIME_BUDGET_MS} ms | Tablero: {N}x{N}", 
+        font=("Arial", 10)
+    )
+    info_label.grid(row=N+2, column=0, columnspan=N, pady=5)
 
-# Iniciar el bucle principal de la interfaz
-root.mainloop()
\ No newline at end of file
+    # Iniciar el bucle principal de la interfaz
+    root.mainloop()
@@ -0,0 +1,47 @@
+'''Utilidades compartidas por los benchmarks (laberinto_benchmark, gato_benchmark,
+puente_benchmark, gato_paralelo y Practica2_ejercicio3): guardar una tabla de
+resultados como CSV o markdown e imprimir la aceleración según la cantidad de procesos.'''
+import csv
+import os
+
+def write_table(rows, columns, filename, decimals=4, formats=None):
+    """
+    Guarda rows (diccionarios con columns) como CSV o, si la extensión es .md, como
+    tabla markdown. None queda vacío, los float con decimals decimales y formats
+    (columna -> función valor -> texto) permite formatear columnas especiales.
+    """
+    formats = formats or {}
+
+    def cell(row, column):
+        value = row[column]
+        if column in formats:
+            return formats[column](value)
+        if value is None:
+            return ''
+        return f"{value:.{decimals}f}" if isinstance(value, float) else str(value)
+
+    if os.path.splitext(filename)[1].lower() == '.md':
+        with open(filename, 'w', encoding='utf-8') as file:
+            file.write('| ' + ' | '.join(columns) + ' |\n')
+            file.write('|' + '---|' * len(columns) + '\n')
+            for row in rows:
+                file.write('| ' + ' | '.join(cell(row, c) for c in columns) + ' |\n')
+    else:
+        with open(filename, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.writer(file)
+            writer.writerow(columns)
+            for row in rows:
+                writer.writerow([cell(row, c) for c in columns])
+
+def print_speedup(rows, base, workers):
+    """
+    Imprime la tabla de aceleración: rows = [(nombre, segundos)], cada fila contra
+    base segundos. Si se pidieron más procesos (workers) que núcleos, lo avisa.
+    """
+    print(f"{'procesos':>8} {'tiempo (s)':>11} {'aceleración':>12}")
+    for name, elapsed in rows:
+        print(f"{name:>8} {elapsed:>11.3f} {base / elapsed:>11.2f}x")
+    cores = os.cpu_count() or 1
+    if workers and max(workers) > cores:
+        print(f"Con {cores} núcleo(s) la aceleración no puede superar {cores}x: los procesos "
+              "de más comparten CPU y solo suman comunicación")
@@ -0,0 +1,197 @@
+'''Benchmark del motor del Gato 4x4 sobre un conjunto fijo de posiciones.
+Corre la misma búsqueda en tres motores y reporta, para cada posición y cada
+profundidad 0, 1, ..., --depth (como la profundización iterativa):
+tiempo hasta completar esa profundidad, nodos, nodos por segundo, hojas, cortes,
+tasa de corte con la primera jugada, tasa de aciertos de la tabla de transposición
+y tiempo de ordenamiento frente al de evaluación.
+
+Motores:
+- c: Practica3.c compilado con -DBENCHMARK (se compila solo si hay compilador de C).
+- python: GatoEngine sin tabla de transposición. Es el mismo algoritmo que el de C,
+  así que se verifica que visite exactamente los mismos nodos y elija las mismas jugadas.
+- python-tt: GatoEngine con tabla de transposición e iterative_deepening (lo que usa
+  Practica3.py).
+
+Cada motor corre dos veces: una solo con contadores (tiempos y nodos por segundo) y
+otra con timers, de la que salen los tiempos de ordenamiento y evaluación (medir
+cada llamada infla el tiempo total, por eso no se mezclan).
+
+Uso:
+    python gato_benchmark.py
+    python gato_benchmark.py --depth 6 --engines python python-tt
+    python gato_benchmark.py --output gato_benchmark.md   (o .csv)'''
+import argparse
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+from benchmark_comun import write_table
+from gato_motor import MAX_DEPTH, GatoEngine, SearchProfile, TranspositionTable, board_to_masks
+
+N = 4   # Practica3.c está fijo en 4x4
+
+# Posiciones (filas de arriba a abajo; '.' = vacía), siempre con X por mover
+SUITE = [
+    ('esquina',    'O...' '....' '....' '....'),
+    ('centro',     '....' '.O..' '....' '....'),
+    ('apertura',   'O...' '.X..' '..O.' '....'),
+    ('amenaza',    'OOO.' '.X..' '..X.' '....'),
+    ('medio',      'O..X' '.OX.' '.X..' 'O..O'),
+    ('final',      'OXO.' 'XOX.' 'O.XO' '.X.O'),
+]
+
+ENGINES = ('c', 'python', 'python-tt')
+
+COLUMNS = ('engine', 'position', 'depth', 'move', 'time', 'nodes', 'nodes_per_s', 'leaves',
+           'cutoffs', 'first_move_rate', 'tt_hit_rate', 'ordering_time', 'evaluation_time',
+           'nodes_by_depth')
+
+def position_masks(text):
+    """Convierte el texto de la posición en las máscaras (x, o)."""
+    board = [[text[i * N + j].replace('.', ' ') for j in range(N)] for i in range(N)]
+    return board_to_masks(board)
+
+# =============================================================================
+# MOTORES
+# =============================================================================
+def run_python(positions, depth, tt=False, timers=False):
+    """Filas (sin tiempos derivados) de GatoEngine para cada posición y profundidad."""
+    rows = []
+    for name, text in positions:
+        x, o = position_masks(text)
+        profile = SearchProfile(timers=timers)
+        engine = GatoEngine(N, tt=TranspositionTable(16) if tt else None, profile=profile)
+        if tt:
+            engine.iterative_deepening(x, o, budget_ms=float('inf'), max_depth=depth)
+        else:
+            # Profundidad por profundidad, igual que el modo benchmark de Practica3.c
+            start = time.perf_counter()
+            for limit in range(min(depth, N * N - (x | o).bit_count() - 1) + 1):
+                engine.max_depth = limit
+                move = engine.best_move(x, o)
+                profile.mark(limit, time.perf_counter() - start, move)
+        for limit, elapsed, move, counters in profile.marks:
+            rows.append(dict(position=name, depth=limit, move=move, time=elapsed,
+                             tt_hit_rate=(counters['tt_hits'] / counters['tt_probes']
+                                          if counters['tt_probes'] else 0.0),
+                             **{k: counters[k] for k in ('nodes', 'leaves', 'cutoffs',
+                                                         'first_move_cutoffs', 'ordering_time',
+                                                         'evaluation_time', 'nodes_by_depth')}))
+    return rows
+
+def compile_c(directory, source=None):
+    """Compila Practica3.c con -DBENCHMARK en directory; devuelve el ejecutable o None."""
+    compiler = shutil.which('cc') or shutil.which('gcc') or shutil.which('clang')
+    if compiler is None:
+        return None
+    source = source or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Practica3.c')
+    binary = os.path.join(directory, 'gato_bench')
+    subprocess.run([compiler, '-O2', '-DBENCHMARK', '-o', binary, source, '-lm'], check=True)
+    return binary
+
+def run_c(binary, positions, depth, timers=False):
+    """Filas del modo benchmark de Practica3.c (mismo formato que run_python)."""
+    text = ''.join(board + '\n' for _, board in positions)
+    output = subprocess.run([binary, str(depth), '1' if timers else '0'], input=text,
+                            capture_output=True, text=True, check=True).stdout
+    rows = []
+    for line in output.splitlines():
+        fields = line.split()
+        position, limit, i, j = (int(v) for v in fields[:4])
+        nodes, leaves, cutoffs, first = (int(v) for v in fields[5:9])
+        rows.append(dict(position=positions[position][0], depth=limit,
+                         move=i * N + j if i >= 0 else -1, time=float(fields[4]),
+                         nodes=nodes, leaves=leaves, cutoffs=cutoffs, first_move_cutoffs=first,
+                         tt_hit_rate=0.0, ordering_time=float(fields[9]),
+                         evaluation_time=float(fields[10]),
+                         nodes_by_depth=[int(v) for v in fields[11].split(',')]))
+    return rows
+
+# =============================================================================
+# EJECUCIÓN
+# =============================================================================
+def run_benchmark(engines, depth, positions=SUITE):
+    """Devuelve una fila (diccionario con COLUMNS) por motor, posición y profundidad."""
+    with tempfile.TemporaryDirectory(prefix='gato_bench_') as directory:
+        binary = compile_c(directory) if 'c' in engines else None
+        if 'c' in engines and binary is None:
+            print("No hay compilador de C: se omite el motor 'c'")
+            engines = [engine for engine in engines if engine != 'c']
+
+        runs = {}
+        for engine in engines:
+            if engine == 'c':
+                runs[engine] = [run_c(binary, positions, depth, timers) for timers in (False, True)]
+            else:
+                runs[engine] = [run_python(positions, depth, engine == 'python-tt', timers)
+                                for timers in (False, True)]
+
+    results = {}
+    for engine in engines:
+        rows, timed = runs[engine]
+        for row, timed_row in zip(rows, timed):
+            row['ordering_time'] = timed_row['ordering_time']
+            row['evaluation_time'] = timed_row['evaluation_time']
+            row['engine'] = engine
+            row['nodes_per_s'] = row['nodes'] / row['time'] if row['time'] > 0 else 0.0
+            row['first_move_rate'] = (row['first_move_cutoffs'] / row['cutoffs']
+                                      if row['cutoffs'] else 0.0)
+        results[engine] = rows
+
+    # C y python corren el mismo algoritmo: deben coincidir nodo por nodo
+    if 'c' in results and 'python' in results:
+        for c_row, py_row in zip(results['c'], results['python']):
+            if (c_row['move'], c_row['nodes_by_depth']) != (py_row['move'], py_row['nodes_by_depth']):
+                raise AssertionError(f"{c_row['position']} profundidad {c_row['depth']}: "
+                                     f"C y Python no coinciden ({c_row['move']} {c_row['nodes_by_depth']} "
+                                     f"vs {py_row['move']} {py_row['nodes_by_depth']})")
+    return [row for engine in engines for row in results[engine]]
+
+def print_table(rows):
+    print(f"{'motor':<10} {'posición':<9} {'prof':>4} {'jugada':>6} {'tiempo (s)':>10} {'nodos':>8} "
+          f"{'nodos/s':>10} {'cortes':>7} {'1ra':>5} {'TT':>5} {'orden (s)':>9} {'eval (s)':>9}")
+    for row in rows:
+        print(f"{row['engine']:<10} {row['position']:<9} {row['depth']:>4} {row['move']:>6} "
+              f"{row['time']:>10.4f} {row['nodes']:>8} {row['nodes_per_s']:>10.0f} "
+              f"{row['cutoffs']:>7} {row['first_move_rate']:>5.0%} {row['tt_hit_rate']:>5.0%} "
+              f"{row['ordering_time']:>9.4f} {row['evaluation_time']:>9.4f}")
+
+def print_summary(rows):
+    """Totales por motor en la profundidad más alta de cada posición."""
+    print(f"\n{'motor':<10} {'tiempo (s)':>10} {'nodos':>9} {'nodos/s':>10} {'1ra':>5} "
+          f"{'orden / eval':>12}")
+    for engine in dict.fromkeys(row['engine'] for row in rows):
+        last = {}
+        for row in rows:
+            if row['engine'] == engine:
+                last[row['position']] = row   # Las filas van en orden de profundidad
+        final = list(last.values())
+        elapsed = sum(row['time'] for row in final)
+        nodes = sum(row['nodes'] for row in final)
+        cutoffs = sum(row['cutoffs'] for row in final)
+        first = sum(row['first_move_cutoffs'] for row in final)
+        ordering = sum(row['ordering_time'] for row in final)
+        evaluation = sum(row['evaluation_time'] for row in final)
+        print(f"{engine:<10} {elapsed:>10.4f} {nodes:>9} {nodes / elapsed if elapsed else 0:>10.0f} "
+              f"{first / cutoffs if cutoffs else 0:>5.0%} "
+              f"{ordering / evaluation if evaluation else 0:>11.1f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del motor del Gato (Python y C)")
+    parser.add_argument('--depth', type=int, default=MAX_DEPTH, help="Profundidad máxima")
+    parser.add_argument('--engines', nargs='+', choices=ENGINES, default=list(ENGINES))
+    parser.add_argument('--output', default=None, help="Guardar la tabla (.csv o .md)")
+    args = parser.parse_args()
+
+    rows = run_benchmark(args.engines, args.depth)
+    print_table(rows)
+    print_summary(rows)
+    if args.output:
+        write_table(rows, COLUMNS, args.output,
+                    formats={'nodes_by_depth': lambda value: '/'.join(str(v) for v in value)})
+        print(f"Tabla guardada en: {os.path.abspath(args.output)}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,694 @@
+'''Motor del Gato NxN de Practica3 sobre bitboards.
+El tablero se representa con dos enteros (x, o): el bit i*N + j vale 1 si la casilla
+(i, j) tiene una X (en x) o una O (en o). Las líneas ganadoras se precalculan como
+máscaras, así que detectar un ganador o puntuar una línea es un AND y un conteo de
+bits, sin recorrer listas ni copiar el tablero.
+
+El tablero puede ser de cualquier tamaño n x n con la regla de k en línea (por
+defecto k = n, el gato clásico). En tableros grandes conviene radius=1 o 2: solo se
+consideran las casillas cercanas a fichas ya puestas (poda del espacio de amenazas).
+
+La búsqueda es la misma de Practica3 (minimax con poda alfa-beta, mismo orden de
+movimientos y mismos valores), por lo que best_move elige exactamente las mismas jugadas.
+Opcionalmente usa una tabla de transposición (TranspositionTable) con hash de Zobrist,
+donde las 8 simetrías del tablero comparten una sola entrada.
+
+Durante la búsqueda la evaluación es incremental: se llevan contadores de X y O por
+línea y la suma de los puntajes de todas las líneas; make/unmake actualizan solo las
+líneas que pasan por la casilla, así que evaluar una hoja es leer un número.
+
+Con profile=SearchProfile() la búsqueda registra nodos por profundidad, cortes, tasa
+de corte en la primera jugada, aciertos de la tabla de transposición y (timers=True)
+el tiempo de ordenamiento frente al de evaluación (ver gato_benchmark.py).
+
+Uso:
+    engine = GatoEngine(tt=TranspositionTable())
+    x, o = board_to_masks(board)
+    cell = engine.best_move(x, o)       # índice i*N + j, o -1 si no hay movimientos
+    cell, depth = engine.iterative_deepening(x, o, budget_ms=500)
+    engine = GatoEngine(profile=SearchProfile(timers=True))
+    engine = GatoEngine(7, k=4, radius=1)   # 7x7, cuatro en línea'''
+import random
+import time
+from functools import lru_cache, wraps
+
+N = 4           # Tamaño del tablero por defecto (4x4)
+MAX_DEPTH = 5   # Profundidad máxima de búsqueda por defecto
+
+WIN_PRIORITY = 10000     # Movimiento que gana de inmediato
+BLOCK_PRIORITY = 9000    # Movimiento que bloquea una victoria del oponente
+PRIORITY_CACHE_LIMIT = 1 << 16   # Entradas por casilla antes de vaciar su caché
+
+INF = float("inf")
+
+# Tipos de entrada de la tabla de transposición
+EXACT, LOWER, UPPER = 0, 1, 2
+
+class SearchTimeout(Exception):
+    """Se acabó el tiempo de la iteración en curso (ver iterative_deepening)."""
+
+class SearchCancelled(Exception):
+    """La búsqueda se canceló desde afuera (evento stop de iterative_deepening)."""
+
+def board_to_masks(board):
+    """Convierte el tablero de listas ("X", "O", " ") en las máscaras (x, o)."""
+    n = len(board)
+    x = o = 0
+    for i, row in enumerate(board):
+        for j, value in enumerate(row):
+            if value == "X":
+                x |= 1 << (i * n + j)
+            elif value == "O":
+                o |= 1 << (i * n + j)
+    return x, o
+
+def masks_to_board(x, o, n=N):
+    """Inverso de board_to_masks: devuelve el tablero como lista de listas."""
+    board = [[" " for _ in range(n)] for _ in range(n)]
+    for cell in range(n * n):
+        if x >> cell & 1:
+            board[cell // n][cell % n] = "X"
+        elif o >> cell & 1:
+            board[cell // n][cell % n] = "O"
+    return board
+
+@lru_cache(maxsize=None)
+def winning_lines(n, k):
+    """
+    Máscaras de todos los tramos de k casillas seguidas en el tablero n x n
+    (horizontales, verticales y en ambas diagonales). Con k = n son las filas,
+    las columnas y las dos diagonales principales. Se calculan una vez por (n, k).
+    """
+    if not 1 <= k <= n:
+        raise ValueError(f"k debe estar entre 1 y n (n={n}, k={k})")
+    lines = []
+    for di, dj in [(0, 1), (1, 0), (1, 1), (1, -1)]:
+        for i in range(n):
+            for j in range(n):
+                end_i, end_j = i + di * (k - 1), j + dj * (k - 1)
+                if 0 <= end_i < n and 0 <= end_j < n:
+                    lines.append(sum(1 << ((i + di * t) * n + j + dj * t) for t in range(k)))
+    return tuple(lines)
+
+def symmetries(n):
+    """
+    Las 8 simetrías del tablero n x n (rotaciones y reflejos) como permutaciones:
+    perm[c] es la casilla a la que va la casilla c. La primera es la identidad.
+    """
+    transforms = [
+        lambda i, j: (i, j),
+        lambda i, j: (j, n - 1 - i),
+        lambda i, j: (n - 1 - i, n - 1 - j),
+        lambda i, j: (n - 1 - j, i),
+        lambda i, j: (i, n - 1 - j),
+        lambda i, j: (n - 1 - i, j),
+        lambda i, j: (j, i),
+        lambda i, j: (n - 1 - j, n - 1 - i),
+    ]
+    perms = []
+    for transform in transforms:
+        perm = []
+        for c in range(n * n):
+            i, j = transform(*divmod(c, n))
+            perm.append(i * n + j)
+        perms.append(tuple(perm))
+    return perms
+
+class TranspositionTable:
+    """
+    Tabla de transposición de tamaño fijo (2**bits casillas, índice = hash & máscara).
+    Cada entrada es (hash, depth, limit, flag, value, move):
+    - depth/limit: profundidad del nodo y profundidad máxima de la búsqueda que lo
+      guardó. Los valores dependen de ambas (victorias más rápidas valen más y la
+      heurística se aplica en el límite), así que solo se reutilizan si coinciden;
+      el movimiento guardado sirve para ordenar en cualquier caso.
+    - flag: EXACT (valor exacto), LOWER (cota inferior) o UPPER (cota superior).
+    - move: mejor casilla en coordenadas de la posición canónica (-1 si no hay).
+    replacement: 'depth' conserva la entrada con más profundidad restante cuando
+    dos posiciones distintas caen en la misma casilla; 'always' siempre reemplaza.
+    La tabla no se vacía entre jugadas ni entre partidas (las posiciones no cambian).
+    """
+    def __init__(self, bits=18, replacement='depth'):
+        if replacement not in ('depth', 'always'):
+            raise ValueError(f"Política de reemplazo desconocida '{replacement}' (use 'depth' o 'always')")
+        self.bits = bits
+        self.mask = (1 << bits) - 1
+        self.replacement = replacement
+        self.slots = [None] * (1 << bits)
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def probe(self, key):
+        self.probes += 1
+        entry = self.slots[key & self.mask]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        return None
+
+    def store(self, key, depth, limit, flag, value, move):
+        index = key & self.mask
+        old = self.slots[index]
+        if (old is not None and old[0] != key and self.replacement == 'depth'
+                and old[2] - old[1] > limit - depth):
+            return   # La entrada vieja costó más: se conserva
+        self.slots[index] = (key, depth, limit, flag, value, move)
+        self.stores += 1
+
+    def clear(self):
+        self.slots = [None] * (1 << self.bits)
+        self.probes = self.hits = self.stores = 0
+
+class SearchProfile:
+    """
+    Contadores opcionales de la búsqueda (GatoEngine(profile=...)):
+    nodes_by_depth[d]: nodos visitados a profundidad d (0 = después de la jugada de la raíz).
+    leaves: hojas evaluadas con la heurística (al llegar a max_depth).
+    cutoffs: cortes alfa-beta; first_move_cutoffs: cuántos fueron con la primera
+    jugada probada (un buen ordenamiento corta casi siempre con la primera).
+    tt_probes / tt_hits: consultas y aciertos en la tabla de transposición.
+    ordering_time / evaluation_time: segundos en ordered_moves y en la evaluación
+    incremental (load/make/unmake). Solo se miden con timers=True, porque medir cada
+    llamada también cuesta.
+    marks: (profundidad, segundos, jugada, as_dict()) al completar cada iteración de
+    iterative_deepening (o cuando se llama a mark).
+    Los contadores se acumulan si se reutiliza el mismo objeto en varias búsquedas.
+    """
+    FIELDS = ('nodes', 'leaves', 'cutoffs', 'first_move_cutoffs', 'tt_probes', 'tt_hits',
+              'ordering_time', 'evaluation_time')
+
+    def __init__(self, timers=False):
+        self.timers = timers
+        self.nodes_by_depth = []
+        self.leaves = 0
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.tt_probes = 0
+        self.tt_hits = 0
+        self.ordering_time = 0.0
+        self.evaluation_time = 0.0
+        self.marks = []
+
+    def visit(self, depth):
+        while len(self.nodes_by_depth) <= depth:
+            self.nodes_by_depth.append(0)
+        self.nodes_by_depth[depth] += 1
+
+    @property
+    def nodes(self):
+        return sum(self.nodes_by_depth)
+
+    @property
+    def first_move_rate(self):
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+
+    @property
+    def tt_hit_rate(self):
+        return self.tt_hits / self.tt_probes if self.tt_probes else 0.0
+
+    def mark(self, depth, elapsed, move=-1):
+        self.marks.append((depth, elapsed, move, self.as_dict()))
+
+    def as_dict(self):
+        result = {name: getattr(self, name) for name in self.FIELDS}
+        result['nodes_by_depth'] = list(self.nodes_by_depth)
+        return result
+
+def _timed_into(profile, field, method):
+    # Envuelve un método para sumar su tiempo de reloj en profile.<field>
+    @wraps(method)
+    def wrapper(*args):
+        start = time.perf_counter()
+        result = method(*args)
+        setattr(profile, field, getattr(profile, field) + time.perf_counter() - start)
+        return result
+    return wrapper
+
+class GatoEngine:
+    """
+    Tablas precalculadas y búsqueda minimax para un tablero n x n con k en línea.
+    lines: máscaras de las líneas ganadoras (ver winning_lines).
+    rest_lines[c]: para cada línea que pasa por la casilla c, la línea sin c
+    (la casilla completa esa línea si el jugador ya tiene todo el resto).
+    cell_lines[c]: índices (en lines) de las líneas que pasan por la casilla c.
+    rays[c]: las casillas (hasta k - 1) en cada una de las 8 direcciones desde c.
+    center_bonus[c]: 100 por cada anillo que separa a c del borde (en 4x4, +100
+    para las 4 casillas centrales, como en Practica3).
+    tt: TranspositionTable opcional; se conserva entre llamadas a best_move.
+    radius: si no es None, solo se juegan casillas a esa distancia (en filas,
+    columnas o diagonales) de alguna ficha; None considera todas las vacías.
+    win_score: una victoria a profundidad d vale ±(win_score - d). Por defecto es
+    100 en el 4x4 clásico (el valor de Practica3, para elegir las mismas jugadas) y
+    en los demás tableros un valor mayor que cualquier evaluación heurística, para
+    que ninguna hoja valga más que ganar.
+    profile: SearchProfile opcional (ver set_profile).
+    """
+    def __init__(self, n=N, max_depth=MAX_DEPTH, tt=None, seed=0, k=None, radius=None,
+                 win_score=None, profile=None):
+        self.n = n
+        self.k = n if k is None else k
+        self.radius = radius
+        self.max_depth = max_depth
+        self.tt = tt
+        self.last_depth = None   # Profundidad completada por la última iterative_deepening
+        self._deadline = None
+        self._stop = None
+        self.size = n * n
+        self.full = (1 << self.size) - 1
+
+        lines = winning_lines(n, self.k)
+        self.lines = lines
+        if win_score is None:
+            win_score = 100 if (n, self.k) == (4, 4) else len(lines) * 10 ** self.k
+        self.win_score = win_score
+        self.rest_lines = [[line & ~(1 << c) for line in lines if line >> c & 1]
+                           for c in range(self.size)]
+        self.cell_lines = [[index for index, line in enumerate(lines) if line >> c & 1]
+                           for c in range(self.size)]
+
+        # Puntaje de una línea según cuántas X y O tiene (igual que evaluate_line)
+        self.line_score = [[(10 ** xc if xc else 0) if oc == 0 else (-10 ** oc if xc == 0 else 0)
+                            for oc in range(self.k + 1)] for xc in range(self.k + 1)]
+        # Cambio del puntaje de una línea al sumarle una X (x_gain) o una O (o_gain)
+        table = self.line_score
+        self.x_gain = [[table[xc + 1][oc] - table[xc][oc] for oc in range(self.k + 1)]
+                       for xc in range(self.k)]
+        self.o_gain = [[table[xc][oc + 1] - table[xc][oc] for oc in range(self.k)]
+                       for xc in range(self.k + 1)]
+
+        # Estado incremental de la búsqueda en curso (ver load/make/unmake)
+        self._x_count = [0] * len(lines)
+        self._o_count = [0] * len(lines)
+        self.score = 0
+
+        # Bonificación por cercanía al centro: anillos desde el borde
+        self.center_bonus = [100 * min(i, j, n - 1 - i, n - 1 - j)
+                             for i, j in (divmod(c, n) for c in range(self.size))]
+
+        # Columnas de los extremos, para desplazar máscaras sin dar la vuelta de fila
+        first_col = sum(1 << (i * n) for i in range(n))
+        self._not_first_col = self.full & ~first_col
+        self._not_last_col = self.full & ~(first_col << (n - 1))
+
+        self.rays = []
+        self.zone = []   # Casillas de las que depende la prioridad de cada casilla
+        for c in range(self.size):
+            i, j = divmod(c, n)
+            rays = []
+            for dx, dy in [(0, 1), (1, 0), (1, 1), (1, -1)]:
+                for sign in [-1, 1]:
+                    ray = []
+                    for step in range(1, self.k):
+                        r, s = i + sign * step * dx, j + sign * step * dy
+                        if 0 <= r < n and 0 <= s < n:
+                            ray.append(1 << (r * n + s))
+                    rays.append(ray)
+            self.rays.append(rays)
+            self.zone.append(sum(bit for ray in rays for bit in ray))
+        self._priority_cache = [{} for _ in range(self.size)]
+
+        # Zobrist: un número aleatorio por (jugador, casilla). Se lleva un hash por
+        # cada simetría; zobrist[p][c][s] es el número de la casilla c vista con la
+        # simetría s, y el hash canónico de la posición es el menor de los 8.
+        self.symmetries = symmetries(n)
+        self.inverse = [tuple(perm.index(c) for c in range(self.size)) for perm in self.symmetries]
+        rng = random.Random(seed)
+        numbers = [[rng.getrandbits(64) for _ in range(self.size)] for _ in range(2)]
+        self.zobrist = [[tuple(numbers[p][perm[c]] for perm in self.symmetries)
+                         for c in range(self.size)] for p in range(2)]
+        self.set_profile(profile)
+
+    def set_profile(self, profile):
+        """
+        Activa (o con None desactiva) la instrumentación. Con profile.timers los
+        métodos de ordenamiento y evaluación se reemplazan en esta instancia por
+        versiones que miden su tiempo; sin perfil no queda ningún costo extra.
+        """
+        self.profile = profile
+        for name in ('ordered_moves', 'load', 'make', 'unmake'):
+            self.__dict__.pop(name, None)
+        if profile is not None and profile.timers:
+            self.ordered_moves = _timed_into(profile, 'ordering_time', self.ordered_moves)
+            for name in ('load', 'make', 'unmake'):
+                setattr(self, name, _timed_into(profile, 'evaluation_time', getattr(self, name)))
+
+    # -------------------------------------------------------------------------
+    # Estado del juego
+    # -------------------------------------------------------------------------
+    def winner(self, x, o):
+        """+1 (gana X), -1 (gana O), 0 (empate), None (el juego continúa)."""
+        for line in self.lines:
+            if x & line == line:
+                return +1
+        for line in self.lines:
+            if o & line == line:
+                return -1
+        if x | o == self.full:
+            return 0
+        return None
+
+    def evaluate(self, x, o):
+        """Suma del puntaje heurístico de todas las líneas (evaluate_board)."""
+        score = 0
+        table = self.line_score
+        for line in self.lines:
+            score += table[(x & line).bit_count()][(o & line).bit_count()]
+        return score
+
+    # -------------------------------------------------------------------------
+    # Evaluación incremental
+    # -------------------------------------------------------------------------
+    def load(self, x, o):
+        """Cuenta desde cero las X y O de cada línea; self.score queda en evaluate(x, o)."""
+        self._x_count = [(x & line).bit_count() for line in self.lines]
+        self._o_count = [(o & line).bit_count() for line in self.lines]
+        table = self.line_score
+        self.score = sum(table[xc][oc] for xc, oc in zip(self._x_count, self._o_count))
+
+    def make(self, cell, maximizing):
+        """Pone una X (maximizing) o una O en cell: actualiza solo sus líneas."""
+        x_count, o_count = self._x_count, self._o_count
+        score = self.score
+        if maximizing:
+            gain = self.x_gain
+            for index in self.cell_lines[cell]:
+                xc = x_count[index]
+                score += gain[xc][o_count[index]]
+                x_count[index] = xc + 1
+        else:
+            gain = self.o_gain
+            for index in self.cell_lines[cell]:
+                oc = o_count[index]
+                score += gain[x_count[index]][oc]
+                o_count[index] = oc + 1
+        self.score = score
+
+    def unmake(self, cell, maximizing):
+        """Deshace make(cell, maximizing)."""
+        x_count, o_count = self._x_count, self._o_count
+        score = self.score
+        if maximizing:
+            gain = self.x_gain
+            for index in self.cell_lines[cell]:
+                xc = x_count[index] - 1
+                score -= gain[xc][o_count[index]]
+                x_count[index] = xc
+        else:
+            gain = self.o_gain
+            for index in self.cell_lines[cell]:
+                oc = o_count[index] - 1
+                score -= gain[x_count[index]][oc]
+                o_count[index] = oc
+        self.score = score
+
+    # -------------------------------------------------------------------------
+    # Ordenamiento de movimientos
+    # -------------------------------------------------------------------------
+    def move_priority(self, cell, x, o):
+        """
+        Prioridad de jugar X en la casilla (get_move_priority). Solo depende de las
+        casillas en las 4 direcciones que pasan por ella, así que se guarda en caché
+        por ese patrón.
+        """
+        zone = self.zone[cell]
+        key = (x & zone) | ((o & zone) << self.size)
+        cache = self._priority_cache[cell]
+        priority = cache.get(key)
+        if priority is None:
+            if len(cache) >= PRIORITY_CACHE_LIMIT:
+                cache.clear()
+            priority = cache[key] = self._compute_priority(cell, x, o)
+        return priority
+
+    def _compute_priority(self, cell, x, o):
+        for rest in self.rest_lines[cell]:
+            if x & rest == rest:
+                return WIN_PRIORITY     # X gana jugando aquí
+        for rest in self.rest_lines[cell]:
+            if o & rest == rest:
+                return BLOCK_PRIORITY   # O ganaría jugando aquí
+        priority = self.center_bonus[cell]
+
+        # Potencial de las líneas: +2 por X aliada, +1 por vacía, hasta topar con O
+        count = 0
+        for ray in self.rays[cell]:
+            for bit in ray:
+                if x & bit:
+                    count += 2
+                elif o & bit:
+                    break
+                else:
+                    count += 1
+        return priority + count * 10
+
+    def near(self, stones):
+        """Casillas a distancia <= radius (rey de ajedrez) de alguna casilla de stones."""
+        n, full = self.n, self.full
+        for _ in range(self.radius):
+            stones |= ((stones << 1) & self._not_first_col) | ((stones >> 1) & self._not_last_col)
+            stones |= ((stones << n) & full) | (stones >> n)
+        return stones
+
+    def candidates(self, x, o):
+        """Máscara de las casillas que se consideran jugables."""
+        occupied = x | o
+        empty = self.full & ~occupied
+        if self.radius is not None and occupied:
+            # Toda casilla que gana o bloquea está junto a alguna ficha, así que la
+            # poda nunca descarta una amenaza inmediata
+            empty &= self.near(occupied)
+        return empty
+
+    def ordered_moves(self, x, o):
+        """Casillas jugables de mayor a menor prioridad (empates en orden de fila)."""
+        empty = self.candidates(x, o)
+        moves = [(-self.move_priority(cell, x, o), cell)
+                 for cell in range(self.size) if empty >> cell & 1]
+        moves.sort()
+        return [cell for _, cell in moves]
+
+    def hashes(self, x, o):
+        """Los 8 hashes de Zobrist de la posición (uno por simetría)."""
+        result = (0,) * 8
+        for cell in range(self.size):
+            if x >> cell & 1:
+                result = tuple(h ^ z for h, z in zip(result, self.zobrist[0][cell]))
+            elif o >> cell & 1:
+                result = tuple(h ^ z for h, z in zip(result, self.zobrist[1][cell]))
+        return result
+
+    # -------------------------------------------------------------------------
+    # Búsqueda
+    # -------------------------------------------------------------------------
+    def minimax(self, x, o, alpha, beta, maximizing, depth):
+        """minimax_alfa_beta de Practica3 sobre las máscaras (x, o)."""
+        hashes = self.hashes(x, o) if self.tt is not None else None
+        self.load(x, o)
+        return self._search(x, o, alpha, beta, maximizing, depth, -1, hashes)
+
+    def _search(self, x, o, alpha, beta, maximizing, depth, last, hashes):
+        # last: casilla recién jugada. Solo las líneas que pasan por ella pueden
+        # haberse completado, así que basta revisar esas (-1 = revisar todo).
+        # Los contadores (load/make/unmake) deben corresponder a (x, o) al entrar.
+        profile = self.profile
+        if profile is not None:
+            profile.visit(depth)
+        if last < 0:
+            result = self.winner(x, o)
+            if result is not None:
+                return result * (self.win_score - depth)
+        else:
+            mover = o if maximizing else x
+            for rest in self.rest_lines[last]:
+                if mover & rest == rest:
+                    return (-1 if maximizing else 1) * (self.win_score - depth)
+            if x | o == self.full:
+                return 0
+
+        if depth >= self.max_depth:
+            if profile is not None:
+                profile.leaves += 1
+            return self.score   # evaluate(x, o), mantenido por make/unmake
+        if self._deadline is not None:
+            if time.perf_counter() > self._deadline:
+                raise SearchTimeout
+            if self._stop is not None and self._stop.is_set():
+                raise SearchCancelled
+
+        tt = self.tt
+        tt_move = -1
+        if tt is not None:
+            key = min(hashes)
+            sym = hashes.index(key)
+            entry = tt.probe(key)
+            if profile is not None:
+                profile.tt_probes += 1
+                profile.tt_hits += entry is not None
+            if entry is not None:
+                _, entry_depth, limit, flag, value, move = entry
+                if entry_depth == depth and limit == self.max_depth:
+                    if flag == EXACT:
+                        return value
+                    if flag == LOWER and value > alpha:
+                        alpha = value
+                    elif flag == UPPER and value < beta:
+                        beta = value
+                    if beta <= alpha:
+                        return value
+                if move >= 0:
+                    tt_move = self.inverse[sym][move]
+
+        moves = self.ordered_moves(x, o)
+        if tt is not None:
+            if tt_move in moves:
+                # El mejor movimiento guardado se prueba primero
+                moves.remove(tt_move)
+                moves.insert(0, tt_move)
+            zobrist = self.zobrist[0 if maximizing else 1]
+            child_hashes = depth + 1 < self.max_depth
+            window = (alpha, beta)
+
+        best_cell = -1
+        if maximizing:
+            max_eval = -INF
+            for cell in moves:
+                if tt is not None and child_hashes:
+                    child = tuple(h ^ z for h, z in zip(hashes, zobrist[cell]))
+                else:
+                    child = None
+                self.make(cell, True)
+                value = self._search(x | 1 << cell, o, alpha, beta, False, depth + 1, cell, child)
+                self.unmake(cell, True)
+                if value > max_eval:
+                    max_eval = value
+                    best_cell = cell
+                if value > alpha:
+                    alpha = value
+                if beta <= alpha:
+                    if profile is not None:
+                        profile.cutoffs += 1
+                        profile.first_move_cutoffs += cell == moves[0]
+                    break
+            best = max_eval
+        else:
+            min_eval = INF
+            for cell in moves:
+                if tt is not None and child_hashes:
+                    child = tuple(h ^ z for h, z in zip(hashes, zobrist[cell]))
+                else:
+                    child = None
+                self.make(cell, False)
+                value = self._search(x, o | 1 << cell, alpha, beta, True, depth + 1, cell, child)
+                self.unmake(cell, False)
+                if value < min_eval:
+                    min_eval = value
+                    best_cell = cell
+                if value < beta:
+                    beta = value
+                if beta <= alpha:
+                    if profile is not None:
+                        profile.cutoffs += 1
+                        profile.first_move_cutoffs += cell == moves[0]
+                    break
+            best = min_eval
+
+        if tt is not None:
+            if best <= window[0]:
+                flag = UPPER
+            elif best >= window[1]:
+                flag = LOWER
+            else:
+                flag = EXACT
+            move = self.symmetries[sym][best_cell] if best_cell >= 0 else -1
+            tt.store(key, depth, self.max_depth, flag, best, move)
+        return best
+
+    def best_move(self, x, o):
+        """Mejor casilla para X (índice i*n + j), o -1 si el tablero está lleno."""
+        return self._root_search(x, o)
+
+    def _root_search(self, x, o, first=-1):
+        # Raíz de la búsqueda. Elige, entre las jugadas de mejor valor, la primera en
+        # orden de prioridad (como siempre). Si first indica una jugada (la mejor de
+        # la iteración anterior), se busca antes que las demás; las jugadas que van
+        # antes que la mejor actual en el orden de prioridad se buscan con la ventana
+        # abierta un punto más abajo, para detectar si empatan con ella.
+        moves = self.ordered_moves(x, o)
+        rank = {cell: k for k, cell in enumerate(moves)}
+        if first in rank:
+            moves.remove(first)
+            moves.insert(0, first)
+
+        best_val = -INF
+        move = -1
+        root = self.hashes(x, o) if self.tt is not None else None
+        for cell in moves:
+            if move != -1 and rank[cell] < rank[move]:
+                alpha = best_val - 1   # Valores enteros: basta con un punto
+            else:
+                alpha = best_val
+            value = self.root_move_value(x, o, cell, alpha, root)
+            if value > best_val or (value == best_val and move != -1 and rank[cell] < rank[move]):
+                best_val = value
+                move = cell
+        return move
+
+    def root_move_value(self, x, o, cell, alpha=-INF, root_hashes=None):
+        """
+        Valor de que X juegue en cell desde la posición (x, o), buscado con la
+        ventana (alpha, +inf): si el resultado es mayor que alpha es exacto, si no
+        es solo una cota superior. root_hashes evita recalcular los hashes de la raíz.
+        """
+        child = None
+        if self.tt is not None:
+            if root_hashes is None:
+                root_hashes = self.hashes(x, o)
+            child = tuple(h ^ z for h, z in zip(root_hashes, self.zobrist[0][cell]))
+        self.load(x | 1 << cell, o)   # Si una búsqueda anterior se cortó, los contadores quedaron a medias
+        return self._search(x | 1 << cell, o, alpha, INF, False, 0, -1, child)
+
+    def iterative_deepening(self, x, o, budget_ms=1000, max_depth=None, stop=None):
+        """
+        Busca con max_depth = 0, 1, 2, ... hasta agotar budget_ms milisegundos (o
+        llegar a max_depth, o al final del juego) y devuelve (casilla, profundidad):
+        la mejor jugada de la última profundidad completada. Cada iteración busca
+        primero la mejor jugada de la anterior, y con tabla de transposición los
+        mejores movimientos guardados ordenan también el resto del árbol.
+        La profundidad alcanzada queda además en self.last_depth.
+        stop: evento opcional (threading.Event); si se activa, la búsqueda termina
+        lanzando SearchCancelled.
+        """
+        empty = self.size - (x | o).bit_count()
+        if empty == 0:
+            self.last_depth = None
+            return -1, None
+        # Con max_depth = vacías - 1 todas las hojas ya son finales: más allá no cambia nada
+        limit = empty - 1 if max_depth is None else min(max_depth, empty - 1)
+        saved_depth = self.max_depth
+        start = time.perf_counter()
+        move = -1
+        reached = None
+        self._stop = stop
+        try:
+            for depth in range(limit + 1):
+                if stop is not None and stop.is_set():
+                    raise SearchCancelled
+                self.max_depth = depth
+                # La profundidad 0 siempre se completa, así siempre hay una jugada
+                self._deadline = start + budget_ms / 1000 if depth > 0 else None
+                try:
+                    move = self._root_search(x, o, move)
+                except SearchTimeout:
+                    break
+                reached = depth
+                if self.profile is not None:
+                    self.profile.mark(depth, time.perf_counter() - start, move)
+                if time.perf_counter() >= start + budget_ms / 1000:
+                    break
+        finally:
+            self.max_depth = saved_depth
+            self._deadline = None
+            self._stop = None
+        self.last_depth = reached
+        return move, reached
@@ -0,0 +1,152 @@
+'''Búsqueda paralela de best_move repartiendo las jugadas de la raíz entre procesos.
+Esquema "Young Brothers Wait" en la raíz: la primera jugada (la de mayor prioridad)
+se busca sola para fijar una cota; después las demás se reparten en un pool de
+procesos. El mejor valor encontrado vive en memoria compartida (multiprocessing.Value)
+y cada trabajador lo lee al empezar cada jugada, así la poda alfa-beta sigue
+funcionando entre procesos.
+
+Junto al mejor valor se comparte el orden de prioridad de la jugada que lo dio. Como
+en la búsqueda en serie, las jugadas que van antes que ella se buscan con alpha =
+mejor - 1 (los valores son enteros), de modo que si empatan devuelven su valor
+exacto; las que van después, con alpha = mejor, porque empatar no les alcanza. Al
+final se elige, entre las de mayor valor, la primera en orden de prioridad: la misma
+jugada que la búsqueda en serie.
+
+Uso:
+    with ParallelSearcher(workers=4) as searcher:
+        cell = searcher.best_move(x, o)
+    python gato_paralelo.py --workers 1 2 4 8 --depth 6'''
+import argparse
+import os
+import time
+from multiprocessing import Pool, Value
+
+from benchmark_comun import print_speedup
+from gato_motor import INF, MAX_DEPTH, N, GatoEngine, TranspositionTable
+
+# =============================================================================
+# LADO DEL TRABAJADOR
+# =============================================================================
+_engine = None
+_shared_best = None
+_shared_rank = None
+
+def _init_worker(shared_best, shared_rank, n, tt_bits, k, radius):
+    global _engine, _shared_best, _shared_rank
+    _engine = GatoEngine(n, tt=TranspositionTable(tt_bits), k=k, radius=radius)
+    _shared_best = shared_best
+    _shared_rank = shared_rank
+
+def _search_move(task):
+    x, o, cell, rank, max_depth = task
+    _engine.max_depth = max_depth
+    # Cota compartida al momento de empezar. Como en la búsqueda en serie, solo las
+    # jugadas que van antes que la mejor actual necesitan detectar un empate
+    with _shared_best.get_lock():
+        best, best_rank = _shared_best.value, _shared_rank.value
+    alpha = best - 1 if rank < best_rank else best
+    value = _engine.root_move_value(x, o, cell, alpha)
+    if value > alpha:
+        # Valor exacto: si mejora la cota compartida (o empata yendo antes en el
+        # orden), los demás podan más
+        with _shared_best.get_lock():
+            if value > _shared_best.value or (value == _shared_best.value and rank < _shared_rank.value):
+                _shared_best.value = value
+                _shared_rank.value = rank
+    return cell, value
+
+# =============================================================================
+# LADO DEL PROCESO PRINCIPAL
+# =============================================================================
+class ParallelSearcher:
+    """
+    Pool de procesos para buscar best_move en paralelo. Cada trabajador tiene su
+    propio motor y su propia tabla de transposición, que se conservan entre jugadas.
+    """
+    def __init__(self, workers=None, n=N, max_depth=MAX_DEPTH, tt_bits=16, k=None, radius=None):
+        self.workers = workers or os.cpu_count()
+        self.max_depth = max_depth
+        self.engine = GatoEngine(n, max_depth, tt=TranspositionTable(tt_bits), k=k, radius=radius)
+        self.shared_best = Value('d', -INF)
+        self.shared_rank = Value('i', 0, lock=False)   # Orden de la jugada de shared_best; usa su lock
+        self.pool = Pool(processes=self.workers, initializer=_init_worker,
+                         initargs=(self.shared_best, self.shared_rank, n, tt_bits, k, radius))
+
+    def best_move(self, x, o, max_depth=None):
+        """Igual que GatoEngine.best_move, con las jugadas de la raíz en paralelo."""
+        depth = self.max_depth if max_depth is None else max_depth
+        self.engine.max_depth = depth
+        moves = self.engine.ordered_moves(x, o)
+        if not moves:
+            return -1
+
+        # Hermano mayor: se busca solo, con ventana completa, para fijar la cota
+        best_val = self.engine.root_move_value(x, o, moves[0])
+        self.shared_best.value = best_val
+        self.shared_rank.value = 0
+        values = {moves[0]: best_val}
+
+        tasks = [(x, o, cell, rank, depth) for rank, cell in enumerate(moves) if rank > 0]
+        for cell, value in self.pool.imap_unordered(_search_move, tasks):
+            values[cell] = value
+
+        # Las jugadas por debajo de la cota devolvieron solo una cota superior menor
+        # que el máximo; las que empatan con él tienen valor exacto
+        best_val = max(values.values())
+        return next(cell for cell in moves if values[cell] == best_val)
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# =============================================================================
+# MEDICIÓN DE ACELERACIÓN
+# =============================================================================
+# Posiciones de prueba (x, o) con O recién jugado y X por mover
+POSITIONS = [
+    (0, 1 << 0),
+    (0, 1 << 5),
+    (1 << 5, (1 << 0) | (1 << 10)),
+    (1 << 6, (1 << 5) | (1 << 15)),
+    ((1 << 5) | (1 << 10), (1 << 0) | (1 << 6) | (1 << 15)),
+]
+
+def measure(workers_list, depth, positions=POSITIONS):
+    """
+    Tiempo de la búsqueda en serie y en paralelo para cada cantidad de procesos,
+    verificando que todas elijan la misma jugada. Devuelve [(procesos, segundos)].
+    """
+    serial = GatoEngine(max_depth=depth, tt=TranspositionTable(16))
+    t0 = time.perf_counter()
+    expected = [serial.best_move(x, o) for x, o in positions]
+    rows = [(0, time.perf_counter() - t0)]
+
+    for workers in workers_list:
+        with ParallelSearcher(workers, max_depth=depth) as searcher:
+            t0 = time.perf_counter()
+            moves = [searcher.best_move(x, o) for x, o in positions]
+            rows.append((workers, time.perf_counter() - t0))
+        if moves != expected:
+            raise AssertionError(f"{workers} procesos: {moves} != serie {expected}")
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Aceleración de best_move en paralelo")
+    parser.add_argument('--workers', nargs='+', type=int, default=[1, 2, 4, 8])
+    parser.add_argument('--depth', type=int, default=MAX_DEPTH + 1)
+    args = parser.parse_args()
+
+    rows = measure(args.workers, args.depth)
+    serial_time = rows[0][1]
+    print(f"Núcleos disponibles: {os.cpu_count()} | profundidad {args.depth} | {len(POSITIONS)} posiciones")
+    print_speedup([('serie' if workers == 0 else str(workers), elapsed) for workers, elapsed in rows],
+                  serial_time, args.workers)
+
+if __name__ == '__main__':
+    main()
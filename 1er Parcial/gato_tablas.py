@@ -0,0 +1,172 @@
+'''Tabla precalculada (apertura + final) del Gato 4x4: el juego resuelto por completo.
+El paso de construcción recorre todas las posiciones alcanzables desde el tablero vacío
+(empieza O, como en la interfaz de Practica3), juntando las 8 simetrías en una sola
+posición canónica, y calcula el valor exacto de cada una con minimax completo (sin
+límite de profundidad ni heurística). Se guardan las posiciones donde mueve X, con su
+valor y su mejor jugada, en un archivo binario que se abre con np.memmap: consultar
+una jugada es una búsqueda binaria sobre las claves ordenadas, sin cargar la tabla.
+
+Valores (desde el punto de vista de X, con n*n casillas): 0 = empate con juego perfecto;
++v = X gana en n*n + 1 - v jugadas; -v = O gana en n*n + 1 - v jugadas. Entre jugadas de
+igual valor se guarda la primera en el orden de prioridad del motor.
+
+Uso:
+    python gato_tablas.py      (escribe gato_4x4.tabla junto a este archivo, donde la busca Practica3)
+    table = Tablebase('gato_4x4.tabla')
+    hit = table.lookup(x, o)        # (valor, casilla) o None si no está en la tabla'''
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from gato_motor import GatoEngine
+
+TB_MAGIC = b'GATOTB01'   # Encabezado: magia + n, k, cantidad de posiciones (int64)
+TB_HEADER_SIZE = len(TB_MAGIC) + 3 * 8
+
+def _symmetry_tables(engine):
+    # Para cada simetría, dos tablas de 256 entradas que transforman el byte bajo y
+    # el byte alto de una máscara de hasta 16 casillas
+    tables = []
+    for perm in engine.symmetries:
+        low = [0] * 256
+        high = [0] * 256
+        for byte in range(256):
+            for bit in range(8):
+                if byte >> bit & 1:
+                    if bit < engine.size:
+                        low[byte] |= 1 << perm[bit]
+                    if bit + 8 < engine.size:
+                        high[byte] |= 1 << perm[bit + 8]
+        tables.append((low, high))
+    return tables
+
+def canonical(x, o, tables):
+    """Clave canónica (x | o << 16 de la simetría menor) y el índice de esa simetría."""
+    best = None
+    best_sym = 0
+    for sym, (low, high) in enumerate(tables):
+        key = (low[x & 255] | high[x >> 8]) | (low[o & 255] | high[o >> 8]) << 16
+        if best is None or key < best:
+            best = key
+            best_sym = sym
+    return best, best_sym
+
+# =============================================================================
+# CONSTRUCCIÓN
+# =============================================================================
+def solve(n=4, k=None):
+    """
+    Resuelve el juego completo. Devuelve (keys, values, moves) como arreglos de numpy
+    ordenados por clave, solo con las posiciones no terminales donde mueve X.
+    """
+    engine = GatoEngine(n, k=k)
+    if engine.size > 16:
+        raise ValueError("La tabla solo admite tableros de hasta 16 casillas (4x4)")
+    tables = _symmetry_tables(engine)
+    win = engine.size + 1   # Valor de una victoria ya consumada
+    values = {}   # Clave canónica -> valor exacto
+    moves = {}    # Clave canónica (mueve X) -> mejor jugada en coordenadas canónicas
+
+    def shrink(value):
+        # Un valor visto una jugada antes: las victorias quedan un paso más lejos
+        return value - 1 if value > 0 else value + 1 if value < 0 else 0
+
+    def value_of(x, o):
+        key, sym = canonical(x, o, tables)
+        value = values.get(key)
+        if value is not None:
+            return value
+        result = engine.winner(x, o)
+        if result is not None:
+            values[key] = result * win
+            return values[key]
+
+        if o.bit_count() > x.bit_count():   # Mueve X (maximiza)
+            best, best_cell = -win - 1, -1
+            for cell in engine.ordered_moves(x, o):
+                child = shrink(value_of(x | 1 << cell, o))
+                if child > best:
+                    best, best_cell = child, cell
+            moves[key] = engine.symmetries[sym][best_cell]
+        else:                                # Mueve O (minimiza)
+            best = win + 1
+            empty = engine.full & ~(x | o)
+            for cell in range(engine.size):
+                if empty >> cell & 1:
+                    best = min(best, shrink(value_of(x, o | 1 << cell)))
+        values[key] = best
+        return best
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 4 * engine.size + 100))
+    value_of(0, 0)
+
+    keys = np.array(sorted(moves), dtype=np.uint32)
+    return (keys,
+            np.array([values[key] for key in keys.tolist()], dtype=np.int8),
+            np.array([moves[key] for key in keys.tolist()], dtype=np.uint8))
+
+def build_tablebase(filename, n=4, k=None):
+    """Resuelve el juego y guarda la tabla en disco. Devuelve cuántas posiciones guardó."""
+    keys, values, moves = solve(n, k)
+    with open(filename, 'wb') as file:
+        file.write(TB_MAGIC)
+        file.write(np.array([n, n if k is None else k, len(keys)], dtype='<i8').tobytes())
+        file.write(keys.astype('<u4').tobytes())
+        file.write(values.tobytes())
+        file.write(moves.tobytes())
+    return len(keys)
+
+# =============================================================================
+# CONSULTA
+# =============================================================================
+class Tablebase:
+    """
+    Tabla abierta con np.memmap (solo se leen del disco las páginas que se consultan).
+    lookup(x, o) responde para posiciones del juego donde mueve X; para las demás
+    devuelve None y hay que buscar con el motor.
+    """
+    def __init__(self, filename):
+        with open(filename, 'rb') as file:
+            if file.read(len(TB_MAGIC)) != TB_MAGIC:
+                raise ValueError(f"'{filename}' no es una tabla del gato")
+            n, k, count = np.frombuffer(file.read(3 * 8), dtype='<i8').tolist()
+        self.n, self.k, self.count = n, k, count
+        self.keys = np.memmap(filename, dtype='<u4', mode='r', offset=TB_HEADER_SIZE, shape=(count,))
+        self.values = np.memmap(filename, dtype=np.int8, mode='r',
+                                offset=TB_HEADER_SIZE + 4 * count, shape=(count,))
+        self.moves = np.memmap(filename, dtype=np.uint8, mode='r',
+                               offset=TB_HEADER_SIZE + 5 * count, shape=(count,))
+        engine = GatoEngine(n, k=k)
+        self._tables = _symmetry_tables(engine)
+        self._inverse = engine.inverse
+
+    def lookup(self, x, o):
+        """(valor, casilla) de la mejor jugada de X, o None si la posición no está."""
+        if o.bit_count() != x.bit_count() + 1:
+            return None   # No es turno de X en una partida que empezó O
+        key, sym = canonical(x, o, self._tables)
+        index = int(np.searchsorted(self.keys, np.uint32(key)))   # Mismo tipo: sin copiar el arreglo
+        if index >= self.count or self.keys[index] != key:
+            return None   # Posición terminal o imposible
+        return int(self.values[index]), self._inverse[sym][int(self.moves[index])]
+
+def main():
+    parser = argparse.ArgumentParser(description="Resuelve el Gato y guarda la tabla de jugadas")
+    parser.add_argument('--n', type=int, default=4, help="Tamaño del tablero (hasta 4)")
+    parser.add_argument('--k', type=int, default=None, help="Fichas en línea (por defecto n)")
+    parser.add_argument('--output', default=None, help="Archivo de salida (por defecto gato_<n>x<n>.tabla junto a este módulo)")
+    args = parser.parse_args()
+
+    # Por defecto junto al módulo, que es donde Practica3.TABLE_FILE la busca
+    output = args.output or os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                         f"gato_{args.n}x{args.n}.tabla")
+    t0 = time.perf_counter()
+    count = build_tablebase(output, args.n, args.k)
+    print(f"{count} posiciones guardadas en {os.path.abspath(output)} "
+          f"({os.path.getsize(output) / 1e6:.1f} MB, {time.perf_counter() - t0:.1f} s)")
+
+if __name__ == '__main__':
+    main()
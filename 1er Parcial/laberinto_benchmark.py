@@ -0,0 +1,168 @@
+'''Comparación de motores de búsqueda de Practica2_ejercicio1 sobre laberintos generados.
+Para cada familia de laberintos y cada tamaño se corre cada motor, se verifica que
+los caminos óptimos tengan la misma longitud y se reportan los contadores de
+SearchStats (expandidos, apilados, pico de la lista abierta, reaperturas,
+operaciones de heap y tiempo). Antes se verifica que ningún motor devuelva un camino
+cuando el inicio o el fin es una pared.
+
+Uso:
+    python laberinto_benchmark.py
+    python laberinto_benchmark.py --sizes 101 301 --engines a_star jps
+    python laberinto_benchmark.py --output comparacion.md   (o .csv)'''
+import argparse
+import os
+import random
+
+import numpy as np
+
+from Practica2_ejercicio1 import PackedMaze, SearchStats, ENGINES
+from benchmark_comun import write_table
+
+# =============================================================================
+# GENERADORES DE LABERINTOS
+# =============================================================================
+def random_walls(size, seed=0, density=0.3):
+    """
+    Paredes al azar con densidad alta (muchos callejones). Se abre antes una
+    escalera al azar de 'S' a 'E' para que siempre exista al menos un camino.
+    """
+    rng = np.random.default_rng(seed)
+    cells = (rng.random(size * size) < density).astype(np.uint8)
+    last = size - 1 if size % 2 else size - 2   # Misma celda 'E' que _with_corners
+    moves = rng.permutation([0] * last + [1] * last)   # 0 = derecha, 1 = abajo
+    r = c = 0
+    for move in moves:
+        r += move
+        c += 1 - move
+        cells[r * size + c] = 0
+    return _with_corners(cells, size)
+
+def open_field(size, seed=0, density=0.05):
+    """Campo abierto con obstáculos sueltos (density = fracción de paredes)."""
+    rng = np.random.default_rng(seed)
+    cells = (rng.random(size * size) < density).astype(np.uint8)
+    return _with_corners(cells, size)
+
+def corridors(size, seed=0):
+    """
+    Laberinto perfecto de pasillos de ancho 1 (backtracker recursivo iterativo):
+    un solo camino entre dos celdas cualesquiera, con muchas vueltas.
+    """
+    rng = random.Random(seed)
+    cells = np.ones(size * size, dtype=np.uint8)
+    stack = [(0, 0)]
+    cells[0] = 0
+    while stack:
+        r, c = stack[-1]
+        options = [(r + dr, c + dc, dr, dc) for dr, dc in ((0, 2), (2, 0), (0, -2), (-2, 0))
+                   if 0 <= r + dr < size and 0 <= c + dc < size and cells[(r + dr) * size + c + dc]]
+        if not options:
+            stack.pop()
+            continue
+        nr, nc, dr, dc = rng.choice(options)
+        cells[(r + dr // 2) * size + c + dc // 2] = 0  # Tirar la pared intermedia
+        cells[nr * size + nc] = 0
+        stack.append((nr, nc))
+    return _with_corners(cells, size)
+
+def rooms(size, seed=0, room=10):
+    """
+    Cuadrícula de habitaciones de room x room separadas por muros, con una
+    puerta al azar en cada tramo de muro entre dos habitaciones vecinas.
+    """
+    rng = random.Random(seed)
+    grid = np.zeros((size, size), dtype=np.uint8)
+    step = room + 1
+    grid[room::step, :] = 1
+    grid[:, room::step] = 1
+    for wall in range(room, size, step):
+        for lo in range(0, size, step):
+            hi = min(lo + room, size)
+            grid[wall, rng.randrange(lo, hi)] = 0   # Puerta en el muro horizontal
+            grid[rng.randrange(lo, hi), wall] = 0   # Puerta en el muro vertical
+    return _with_corners(grid.reshape(-1), size)
+
+def _with_corners(cells, size):
+    # 'S' arriba a la izquierda y 'E' en la última celda libre de la diagonal inferior
+    end = size * size - 1
+    if size % 2 == 0:
+        end -= size + 1  # En tamaños pares el pasillo termina una fila y columna antes
+    cells[0] = 0
+    cells[end] = 0
+    return PackedMaze(cells, size, size, 0, end)
+
+FAMILIES = {
+    'random': random_walls,
+    'corridors': corridors,
+    'rooms': rooms,
+    'open_field': open_field,
+}
+
+# =============================================================================
+# VERIFICACIÓN
+# =============================================================================
+def verify_walls(engines, families=FAMILIES, size=21, seed=0):
+    """Con inicio o fin sobre una pared todos los motores deben devolver None; AssertionError si no."""
+    for family in families:
+        maze = FAMILIES[family](size, seed)
+        wall = maze.coords(int(np.flatnonzero(np.asarray(maze.cells))[0]))
+        start, end = maze.coords(maze.start), maze.coords(maze.end)
+        for engine in engines:
+            for query in ((start, wall), (wall, end), (wall, wall)):
+                path = ENGINES[engine](maze, *query)
+                if path is not None:
+                    raise AssertionError(f"{engine} en {family}: {query[0]} -> {query[1]} "
+                                         f"devolvió un camino de {len(path)} celdas sobre una pared")
+
+# =============================================================================
+# EJECUCIÓN
+# =============================================================================
+COLUMNS = ('family', 'size', 'engine', 'length') + SearchStats.FIELDS
+
+def run_benchmark(families, sizes, engines, seed=0):
+    """Devuelve una fila (diccionario con COLUMNS) por familia, tamaño y motor."""
+    rows = []
+    for family in families:
+        for size in sorted(sizes):
+            maze = FAMILIES[family](size, seed)
+            start, end = maze.coords(maze.start), maze.coords(maze.end)
+            lengths = set()
+            for engine in engines:
+                stats = SearchStats()
+                path = ENGINES[engine](maze, start, end, stats=stats)
+                length = len(path) if path else None
+                rows.append(dict(family=family, size=size, engine=engine, length=length,
+                                 **stats.as_dict()))
+                if engine != 'dfs':  # dfs no garantiza el camino más corto
+                    lengths.add(length)
+            if len(lengths) > 1:
+                raise AssertionError(f"{family} {size}: los motores óptimos no coinciden en longitud {lengths}")
+    return rows
+
+def print_table(rows):
+    print(f"{'familia':<11} {'tamaño':>6} {'motor':<21} {'largo':>7} {'expandidos':>10} "
+          f"{'apilados':>9} {'pico':>7} {'reab.':>5} {'heap':>8} {'tiempo (s)':>10}")
+    for row in rows:
+        print(f"{row['family']:<11} {row['size']:>6} {row['engine']:<21} {str(row['length']):>7} "
+              f"{row['nodes_expanded']:>10} {row['nodes_pushed']:>9} {row['peak_frontier']:>7} "
+              f"{row['reopenings']:>5} {row['heap_ops']:>8} {row['wall_time']:>10.4f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de motores de búsqueda en laberintos")
+    parser.add_argument('--families', nargs='+', default=list(FAMILIES), choices=list(FAMILIES))
+    parser.add_argument('--sizes', nargs='+', type=int, default=[51, 101, 201, 401])
+    parser.add_argument('--engines', nargs='+', choices=list(ENGINES), default=list(ENGINES))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help="Guardar la tabla (.csv o .md)")
+    args = parser.parse_args()
+
+    verify_walls(args.engines, args.families)
+    print("Verificado: ningún motor sale de una pared ni termina en ella\n")
+    rows = run_benchmark(args.families, args.sizes, args.engines, args.seed)
+    print_table(rows)
+    if args.output:
+        write_table(rows, COLUMNS, args.output)
+        print(f"Tabla guardada en: {os.path.abspath(args.output)}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+'''Replanificación incremental (LPA*) cuando las celdas del laberinto cambian en ejecución.
+En vez de llamar a a_star desde cero después de cada cambio de pared, el planificador
+conserva g (costo actual) y rhs (costo según los vecinos) de cada celda y, al recibir
+cambios, solo vuelve a expandir las celdas cuyo costo realmente se ve afectado.
+
+Inicio y fin son fijos, así que se usa LPA* (D* Lite sin robot en movimiento).
+
+Uso:
+    planner = IncrementalPlanner(grid, start, end)
+    path = planner.plan()
+    path = planner.update_cells([((3, 4), '1'), ((7, 2), '0')])
+    print(planner.last_repair.nodes_expanded, planner.last_repair.full_replan_expanded)'''
+import heapq
+from array import array
+
+import numpy as np
+
+from Practica2_ejercicio1 import PackedMaze, SearchStats, a_star, pack_maze
+
+INF = 2**31 - 1  # "Sin camino" en los buffers int32
+
+class RepairStats:
+    """
+    Costo de una replanificación:
+    nodes_expanded: celdas sacadas de la cola y procesadas.
+    nodes_touched: celdas distintas cuyo g o rhs cambió.
+    full_replan_expanded: nodos que expande a_star desde cero sobre el mismo mapa
+    (solo si se pidió la comparación; None si no).
+    """
+    def __init__(self):
+        self.nodes_expanded = 0
+        self.nodes_touched = 0
+        self.full_replan_expanded = None
+
+class IncrementalPlanner:
+    def __init__(self, maze, start, end):
+        if isinstance(maze, PackedMaze):
+            # Copia propia de las celdas: update_cells las modifica, y el laberinto
+            # del llamador puede ser compartido o de solo lectura (open_maze_binary)
+            maze = PackedMaze(np.array(maze.cells, dtype=np.uint8), maze.rows, maze.cols,
+                              maze.start, maze.end)
+        else:
+            maze = pack_maze(maze)
+        self.maze = maze
+        self.start = self.maze.index(start)
+        self.end = self.maze.index(end)
+        self.end_i, self.end_j = self.maze.coords(self.end)
+        size = self.maze.size
+        self.g = array('i', [INF]) * size
+        self.rhs = array('i', [INF]) * size
+        self.open_list = []
+        self.queued = {}   # Celda -> clave vigente en la cola (las demás entradas son viejas)
+        self.last_repair = None
+        self._touched = set()
+        self._expanded = 0
+
+        if not self.maze.walls[self.start]:
+            self.rhs[self.start] = 0
+            self._push(self.start)
+
+    # -------------------------------------------------------------------------
+    # Núcleo de LPA*
+    # -------------------------------------------------------------------------
+    def _key(self, cell):
+        best = min(self.g[cell], self.rhs[cell])
+        h = abs(cell // self.maze.cols - self.end_i) + abs(cell % self.maze.cols - self.end_j)
+        return (best + h, best)
+
+    def _push(self, cell):
+        key = self._key(cell)
+        self.queued[cell] = key
+        heapq.heappush(self.open_list, (key, cell))
+
+    def _top_key(self):
+        # Descartar entradas viejas hasta encontrar la vigente
+        while self.open_list:
+            key, cell = self.open_list[0]
+            if self.queued.get(cell) == key:
+                return key
+            heapq.heappop(self.open_list)
+        return (INF, INF)
+
+    def _adjacent(self, cell):
+        # Las cuatro celdas vecinas dentro del tablero, sean pared o no
+        cols = self.maze.cols
+        j = cell % cols
+        result = []
+        if j + 1 < cols:
+            result.append(cell + 1)
+        if cell + cols < self.maze.size:
+            result.append(cell + cols)
+        if j > 0:
+            result.append(cell - 1)
+        if cell >= cols:
+            result.append(cell - cols)
+        return result
+
+    def _update_vertex(self, cell):
+        g = self.g
+        if cell == self.start:
+            rhs = INF if self.maze.walls[cell] else 0
+        elif self.maze.walls[cell]:
+            rhs = INF
+        else:
+            rhs = INF
+            for neighbor in self.maze.neighbors(cell):
+                if g[neighbor] != INF and g[neighbor] + 1 < rhs:
+                    rhs = g[neighbor] + 1
+        if rhs != self.rhs[cell]:
+            self.rhs[cell] = rhs
+            self._touched.add(cell)
+
+        if self.g[cell] != rhs:
+            self._push(cell)
+        else:
+            self.queued.pop(cell, None)
+
+    def _compute_shortest_path(self):
+        g, rhs, end = self.g, self.rhs, self.end
+        while self._top_key() < self._key(end) or rhs[end] != g[end]:
+            if not self.open_list:
+                break
+            _, cell = heapq.heappop(self.open_list)
+            del self.queued[cell]
+            self._expanded += 1
+            self._touched.add(cell)
+
+            if g[cell] > rhs[cell]:
+                # Sobreconsistente: el costo bajó, se fija y se propaga
+                g[cell] = rhs[cell]
+                for neighbor in self.maze.neighbors(cell):
+                    self._update_vertex(neighbor)
+            else:
+                # Subconsistente: el costo subió, se invalida y se recalcula
+                g[cell] = INF
+                self._update_vertex(cell)
+                for neighbor in self.maze.neighbors(cell):
+                    self._update_vertex(neighbor)
+
+    def _extract_path(self):
+        g = self.g
+        if g[self.end] == INF:
+            return None
+        current = self.end
+        path = [self.maze.coords(current)]
+        while current != self.start:
+            # Predecesor: el primer vecino que está exactamente un paso antes
+            wanted = g[current] - 1
+            for neighbor in self.maze.neighbors(current):
+                if g[neighbor] == wanted:
+                    current = neighbor
+                    break
+            path.append(self.maze.coords(current))
+        path.reverse()
+        return path
+
+    # -------------------------------------------------------------------------
+    # API
+    # -------------------------------------------------------------------------
+    def plan(self, compare=False):
+        """Calcula (o termina de reparar) el camino actual de start a end."""
+        self._touched = set()
+        self._expanded = 0
+        self._compute_shortest_path()
+        return self._finish(compare)
+
+    def update_cells(self, changes, compare=False):
+        """
+        Aplica cambios de celdas (sobre la copia propia del planificador; el laberinto
+        recibido no cambia) y repara el camino.
+        changes: iterable de ((i, j), valor) donde valor es '1'/True para pared y
+        '0'/False para libre. Con compare=True también corre a_star desde cero
+        para reportar cuántos nodos habría expandido un replan completo.
+        """
+        self._touched = set()
+        self._expanded = 0
+        cells = self.maze.cells
+        for cell, value in changes:
+            index = self.maze.index(cell)
+            wall = 1 if value in ('1', 1, True) else 0
+            if cells[index] == wall:
+                continue
+            cells[index] = wall
+            self._update_vertex(index)
+            for neighbor in self._adjacent(index):
+                self._update_vertex(neighbor)
+        self._compute_shortest_path()
+        return self._finish(compare)
+
+    def _finish(self, compare):
+        path = self._extract_path()
+        report = RepairStats()
+        report.nodes_expanded = self._expanded
+        report.nodes_touched = len(self._touched)
+        if compare:
+            stats = SearchStats()
+            a_star(self.maze, self.maze.coords(self.start), self.maze.coords(self.end), stats=stats)
+            report.full_replan_expanded = stats.nodes_expanded
+        self.last_repair = report
+        return path
@@ -0,0 +1,234 @@
+'''Índice de distancias precalculadas para consultas repetidas sobre un mismo laberinto.
+- Para cada destino elegido se guarda un campo de distancias BFS (una distancia por celda),
+  así una consulta hacia ese destino es solo bajar por el campo: O(largo del camino).
+- Opcionalmente se eligen landmarks (ALT): con sus campos, la desigualdad del triángulo
+  da una cota inferior mucho mejor que Manhattan para A* hacia cualquier otro destino.
+- El índice se guarda en disco (.npz) junto con una huella del laberinto, para no
+  reconstruirlo al reiniciar.
+
+Uso:
+    python laberinto_indice.py laberinto.csv --landmarks 4 --output laberinto_indice.npz'''
+import argparse
+import hashlib
+import os
+from array import array
+from collections import deque
+
+import numpy as np
+
+from Practica2_ejercicio1 import a_star, open_maze
+
+UNREACHABLE = -1
+
+def distance_field(maze, target):
+    """
+    Distancia BFS de cada celda al índice target (UNREACHABLE si no hay camino).
+    Como los movimientos son reversibles, es también la distancia desde target.
+    ValueError si target es una pared (ningún camino termina ahí).
+    """
+    if maze.walls[target]:
+        raise ValueError(f"El destino {maze.coords(target)} es una pared")
+    dist = array('i', [UNREACHABLE]) * maze.size
+    dist[target] = 0
+    queue = deque([target])
+    while queue:
+        current = queue.popleft()
+        next_dist = dist[current] + 1
+        for neighbor in maze.neighbors(current):
+            if dist[neighbor] == UNREACHABLE:
+                dist[neighbor] = next_dist
+                queue.append(neighbor)
+    return np.frombuffer(dist, dtype=np.int32)
+
+def maze_fingerprint(maze):
+    """Huella del laberinto: un índice guardado solo sirve para el mismo mapa."""
+    digest = hashlib.sha256()
+    digest.update(np.array([maze.rows, maze.cols], dtype=np.int64).tobytes())
+    digest.update(np.ascontiguousarray(maze.cells, dtype=np.uint8).tobytes())
+    return digest.hexdigest()
+
+class MazeIndex:
+    """
+    Campos de distancia precalculados sobre un PackedMaze.
+    fields: destino (índice plano) -> arreglo int32 de distancias a ese destino.
+    landmarks: índices de los landmarks; landmark_fields: sus campos (uno por fila).
+    """
+    def __init__(self, maze):
+        self.maze = maze
+        self.fingerprint = maze_fingerprint(maze)
+        self.fields = {}
+        self.landmarks = []
+        self.landmark_fields = np.empty((0, maze.size), dtype=np.int32)
+
+    # -------------------------------------------------------------------------
+    # Construcción
+    # -------------------------------------------------------------------------
+    def add_target(self, cell):
+        """Precalcula el campo de distancias hacia la celda (i, j) (ValueError si es pared)."""
+        target = self.maze.index(cell)
+        if target not in self.fields:
+            self.fields[target] = distance_field(self.maze, target)
+        return self.fields[target]
+
+    def add_landmarks(self, count, seed=0):
+        """
+        Elige count landmarks por el criterio del punto más lejano: cada nuevo
+        landmark es la celda alcanzable más alejada de los ya elegidos.
+        """
+        free = np.flatnonzero(self.maze.cells == 0)
+        if len(free) == 0 or count <= 0:
+            return
+        fields = list(self.landmark_fields)
+        if not fields:
+            rng = np.random.default_rng(seed)
+            seed_field = distance_field(self.maze, int(rng.choice(free)))
+            first = int(np.argmax(seed_field))
+            self.landmarks.append(first)
+            fields.append(distance_field(self.maze, first))
+
+        while len(self.landmarks) < count:
+            # Distancia de cada celda al landmark más cercano (las inalcanzables no cuentan)
+            stacked = np.stack(fields)
+            nearest = np.where(stacked == UNREACHABLE, -1, stacked).min(axis=0)
+            candidate = int(np.argmax(nearest))
+            if nearest[candidate] <= 0:
+                break  # Ya no hay celdas nuevas que valga la pena cubrir
+            self.landmarks.append(candidate)
+            fields.append(distance_field(self.maze, candidate))
+        self.landmark_fields = np.stack(fields)
+
+    # -------------------------------------------------------------------------
+    # Consultas
+    # -------------------------------------------------------------------------
+    def distance(self, start, end):
+        """Distancia exacta si end tiene campo precalculado; si no, None."""
+        field = self.fields.get(self.maze.index(end))
+        if field is None:
+            return None
+        d = int(field[self.maze.index(start)])
+        return None if d == UNREACHABLE else d
+
+    def heuristic_to(self, end):
+        """
+        Cota inferior de la distancia hacia end para A*: el máximo entre Manhattan y
+        |d(L, end) - d(L, v)| para cada landmark L (desigualdad del triángulo).
+        """
+        maze = self.maze
+        target = maze.index(end)
+        cols = maze.cols
+        end_i, end_j = end
+        rows = [memoryview(field) for field in self.landmark_fields]
+        target_dists = [int(field[target]) for field in self.landmark_fields]
+        pairs = [(row, d) for row, d in zip(rows, target_dists) if d != UNREACHABLE]
+
+        def h(index):
+            best = abs(index // cols - end_i) + abs(index % cols - end_j)
+            for row, d_target in pairs:
+                d = row[index]
+                if d != UNREACHABLE:
+                    bound = d - d_target if d > d_target else d_target - d
+                    if bound > best:
+                        best = bound
+            return best
+        return h
+
+    def shortest_path(self, start, end, stats=None):
+        """
+        Camino más corto de start a end. Si end tiene campo precalculado se baja por
+        el campo (sin búsqueda); si no, A* con la heurística de landmarks.
+        """
+        maze = self.maze
+        field = self.fields.get(maze.index(end))
+        if field is None:
+            return a_star(maze, start, end, stats=stats, index_heuristic=self.heuristic_to(end))
+
+        current = maze.index(start)
+        dist = memoryview(field)
+        if dist[current] == UNREACHABLE:
+            return None
+        path = [maze.coords(current)]
+        while dist[current] > 0:
+            # Siguiente celda: el primer vecino (mismo orden que las búsquedas)
+            # que está un paso más cerca del destino
+            wanted = dist[current] - 1
+            for neighbor in maze.neighbors(current):
+                if dist[neighbor] == wanted:
+                    current = neighbor
+                    break
+            path.append(maze.coords(current))
+        return path
+
+    # -------------------------------------------------------------------------
+    # Persistencia
+    # -------------------------------------------------------------------------
+    def save(self, filename):
+        targets = np.array(sorted(self.fields), dtype=np.int64)
+        target_fields = (np.stack([self.fields[t] for t in targets]) if len(targets)
+                         else np.empty((0, self.maze.size), dtype=np.int32))
+        with open(filename, 'wb') as file:
+            np.savez(file,
+                     fingerprint=np.array(self.fingerprint),
+                     targets=targets,
+                     target_fields=target_fields,
+                     landmarks=np.array(self.landmarks, dtype=np.int64),
+                     landmark_fields=self.landmark_fields)
+
+    @classmethod
+    def load(cls, filename, maze):
+        """Carga un índice guardado; falla si fue construido para otro laberinto."""
+        index = cls(maze)
+        with np.load(filename) as data:
+            if str(data['fingerprint']) != index.fingerprint:
+                raise ValueError(f"El índice '{filename}' no corresponde a este laberinto")
+            for target, field in zip(data['targets'], data['target_fields']):
+                index.fields[int(target)] = field
+            index.landmarks = [int(l) for l in data['landmarks']]
+            index.landmark_fields = data['landmark_fields']
+        return index
+
+def load_or_build(filename, maze, targets=(), landmarks=0):
+    """
+    Abre el índice de disco si existe y es de este laberinto; si no, lo construye
+    con los destinos y landmarks pedidos y lo guarda. Agrega lo que falte.
+    """
+    index = None
+    if os.path.exists(filename):
+        try:
+            index = MazeIndex.load(filename, maze)
+        except ValueError:
+            index = None  # Índice viejo de otro mapa: se reconstruye
+
+    changed = index is None
+    if index is None:
+        index = MazeIndex(maze)
+    for cell in targets:
+        if maze.index(cell) not in index.fields:
+            index.add_target(cell)
+            changed = True
+    if len(index.landmarks) < landmarks:
+        index.add_landmarks(landmarks)
+        changed = True
+    if changed:
+        index.save(filename)
+    return index
+
+def main():
+    parser = argparse.ArgumentParser(description="Construye el índice de distancias de un laberinto")
+    parser.add_argument('maze', help="Laberinto (CSV o binario .lab)")
+    parser.add_argument('--landmarks', type=int, default=4, help="Cantidad de landmarks ALT")
+    parser.add_argument('--output', default=None, help="Archivo .npz (por defecto <maze>.indice.npz)")
+    args = parser.parse_args()
+
+    maze = open_maze(args.maze)
+    output = args.output or os.path.splitext(args.maze)[0] + '.indice.npz'
+    targets = [maze.coords(maze.end)] if maze.end is not None else []
+    index = load_or_build(output, maze, targets, args.landmarks)
+    print(f"Índice con {len(index.fields)} destino(s) y {len(index.landmarks)} landmark(s) en {os.path.abspath(output)}")
+
+    if maze.start is not None and maze.end is not None:
+        start, end = maze.coords(maze.start), maze.coords(maze.end)
+        path = index.shortest_path(start, end)
+        print(f"Camino S -> E: {len(path) if path else 'sin camino'} pasos")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+'''Resolución por lotes de muchos trabajos (laberinto, inicio, fin) con un pool de procesos.
+Cada laberinto se carga y empaqueta una sola vez en el proceso principal y se publica
+en memoria compartida; los procesos trabajadores lo abren por nombre (sin copiarlo ni
+serializarlo) y los resultados se entregan a medida que terminan.
+
+Formato del archivo de trabajos (CSV, una línea por trabajo; inicio/fin vacíos = 'S'/'E'):
+    laberinto,fila_inicio,col_inicio,fila_fin,col_fin
+    laberinto.csv,,,,
+    laberinto.csv,0,0,19,19
+
+Uso:
+    python laberinto_lote.py trabajos.csv --engine a_star --workers 4 --output resultados.jsonl'''
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+from Practica2_ejercicio1 import ENGINES, PackedMaze, SearchStats, open_maze
+
+# =============================================================================
+# LADO DEL TRABAJADOR
+# =============================================================================
+_attached = {}  # Nombre del bloque compartido -> (SharedMemory, PackedMaze) ya abiertos
+
+def _attach(name, rows, cols):
+    if name not in _attached:
+        shm = shared_memory.SharedMemory(name=name)
+        cells = np.ndarray((rows * cols,), dtype=np.uint8, buffer=shm.buf)
+        _attached[name] = (shm, PackedMaze(cells, rows, cols))
+    return _attached[name][1]
+
+def _solve_job(task):
+    job_id, label, name, rows, cols, start, end, engine, include_path = task
+    maze = _attach(name, rows, cols)
+    stats = SearchStats()
+    t0 = time.perf_counter()
+    path = ENGINES[engine](maze, start, end, stats=stats)
+    result = {
+        'job': job_id,
+        'maze': label,
+        'start': list(start),
+        'end': list(end),
+        'engine': engine,
+        'length': len(path) if path else None,
+        'seconds': round(time.perf_counter() - t0, 6),
+    }
+    result.update(stats.as_dict())  # Contadores de la búsqueda (ver SearchStats)
+    if include_path:
+        result['path'] = [list(cell) for cell in path] if path else None
+    return result
+
+# =============================================================================
+# LADO DEL PROCESO PRINCIPAL
+# =============================================================================
+def _publish(maze):
+    # Copia las celdas empaquetadas a un bloque de memoria compartida
+    shm = shared_memory.SharedMemory(create=True, size=max(maze.size, 1))
+    shared = np.ndarray((maze.size,), dtype=np.uint8, buffer=shm.buf)
+    shared[:] = maze.cells
+    return shm
+
+def solve_batch(jobs, engine='a_star', workers=None, include_path=False, chunksize=1,
+                cache_binary=False):
+    """
+    Resuelve jobs = [(archivo_laberinto, inicio, fin), ...] en paralelo y va
+    entregando (yield) un diccionario por trabajo en el orden en que terminan.
+    inicio/fin pueden ser None para usar 'S'/'E' del laberinto (ValueError si el
+    laberinto no las tiene). Los laberintos pueden ser CSV o binarios (.lab); con
+    cache_binary=True cada CSV se convierte una vez a binario para que las
+    siguientes corridas no tengan que parsearlo.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Motor desconocido '{engine}'. Opciones: {', '.join(ENGINES)}")
+
+    blocks = {}   # Archivo -> (SharedMemory, PackedMaze)
+    tasks = []
+    try:
+        for job_id, (filename, start, end) in enumerate(jobs):
+            if filename not in blocks:
+                maze = open_maze(filename, cache_binary)
+                blocks[filename] = (_publish(maze), maze)
+            shm, maze = blocks[filename]
+            if start is None and maze.start is None:
+                raise ValueError(f"Trabajo {job_id} ({filename}): falta el inicio y el laberinto no tiene 'S'")
+            if end is None and maze.end is None:
+                raise ValueError(f"Trabajo {job_id} ({filename}): falta el fin y el laberinto no tiene 'E'")
+            start = tuple(start) if start is not None else maze.coords(maze.start)
+            end = tuple(end) if end is not None else maze.coords(maze.end)
+            tasks.append((job_id, filename, shm.name, maze.rows, maze.cols,
+                          start, end, engine, include_path))
+
+        with Pool(processes=workers) as pool:
+            for result in pool.imap_unordered(_solve_job, tasks, chunksize=chunksize):
+                yield result
+    finally:
+        for shm, _ in blocks.values():
+            shm.close()
+            shm.unlink()
+
+def read_jobs(filename):
+    """Lee el archivo de trabajos (ver formato arriba)."""
+    jobs = []
+    base = os.path.dirname(os.path.abspath(filename))
+    with open(filename, 'r', newline='', encoding='utf-8-sig') as file:
+        for row in csv.reader(file):
+            row = [cell.strip() for cell in row]
+            if not row or not row[0] or row[0].startswith('#') or row[0] == 'laberinto':
+                continue  # Líneas vacías, comentarios o encabezado
+            row += [''] * (5 - len(row))
+            maze = row[0] if os.path.isabs(row[0]) else os.path.join(base, row[0])
+            start = (int(row[1]), int(row[2])) if row[1] and row[2] else None
+            end = (int(row[3]), int(row[4])) if row[3] and row[4] else None
+            jobs.append((maze, start, end))
+    return jobs
+
+def main():
+    parser = argparse.ArgumentParser(description="Resuelve lotes de laberintos con un pool de procesos")
+    parser.add_argument('jobs', help="CSV con los trabajos")
+    parser.add_argument('--engine', default='a_star', choices=list(ENGINES))
+    parser.add_argument('--workers', type=int, default=None, help="Procesos (por defecto, uno por núcleo)")
+    parser.add_argument('--chunksize', type=int, default=1)
+    parser.add_argument('--paths', action='store_true', help="Incluir el camino completo en cada resultado")
+    parser.add_argument('--cache-binary', action='store_true',
+                        help="Guardar cada CSV como .lab mapeable para las próximas corridas")
+    parser.add_argument('--output', default=None, help="Archivo JSON Lines (por defecto, salida estándar)")
+    args = parser.parse_args()
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for result in solve_batch(read_jobs(args.jobs), args.engine, args.workers,
+                                  args.paths, args.chunksize, args.cache_binary):
+            out.write(json.dumps(result) + '\n')
+            out.flush()  # Cada resultado sale apenas termina
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+'''Benchmark de cruzar_puente_k (Practica1): cómo crece el tiempo con n personas y
+capacidad k. Antes de medir se verifica el resultado:
+- contra una búsqueda exhaustiva sobre todos los subconjuntos (instancias chicas),
+- con k = 2, contra la estrategia de cruzar_puente (instancias grandes).
+
+Para cada (n, k) se reporta el tiempo de la búsqueda y el exponente de crecimiento
+respecto del n anterior (log(t2 / t1) / log(n2 / n1)); con k = 2 también el tiempo
+de tiempo_total como referencia.
+
+Uso:
+    python puente_benchmark.py
+    python puente_benchmark.py --ns 50 100 200 400 --ks 2 3
+    python puente_benchmark.py --output puente.md   (o .csv)'''
+import argparse
+import heapq
+import itertools
+import math
+import os
+import random
+import time
+
+from Practica1 import cruzar_puente_k, tiempo_total
+from benchmark_comun import write_table
+
+COLUMNS = ('n', 'k', 'total', 'time', 'exponent', 'greedy_time')
+
+def random_times(n, rng):
+    """Tiempos de cruce mezclando gente muy rápida, media y lenta (los casos difíciles)."""
+    return [rng.choice((rng.randint(1, 5), rng.randint(1, 100), rng.randint(1, 1000)))
+            for _ in range(n)]
+
+# =============================================================================
+# VERIFICACIÓN
+# =============================================================================
+def brute_force(times, k):
+    """Tiempo óptimo por Dijkstra sobre todos los subconjuntos (solo para n chico)."""
+    n = len(times)
+    everyone = (1 << n) - 1
+    best = {(everyone, 1): 0}   # (quiénes están en la orilla inicial, antorcha ahí)
+    queue = [(0, everyone, 1)]
+    while queue:
+        elapsed, start, torch = heapq.heappop(queue)
+        if elapsed > best[(start, torch)]:
+            continue
+        if start == 0:
+            return elapsed
+        side = start if torch else everyone & ~start
+        people = [i for i in range(n) if side >> i & 1]
+        for size in range(1, k + 1):
+            for group in itertools.combinations(people, size):
+                mask = sum(1 << i for i in group)
+                state = (start & ~mask if torch else start | mask, 1 - torch)
+                cost = elapsed + max(times[i] for i in group)
+                if cost < best.get(state, math.inf):
+                    best[state] = cost
+                    heapq.heappush(queue, (cost, *state))
+    raise ValueError(f"Con capacidad {k} no pueden cruzar {n} personas")
+
+def verify(ks, cases=200, max_n=7, seed=0):
+    """Compara con brute_force y, con k = 2, con tiempo_total; AssertionError si difieren."""
+    rng = random.Random(seed)
+    for _ in range(cases):
+        k = rng.choice(ks)
+        times = random_times(rng.randint(1, max_n), rng)
+        expected = brute_force(times, k)
+        _, total = cruzar_puente_k(times, k)
+        if total != expected:
+            raise AssertionError(f"k={k} {times}: {total} != óptimo {expected}")
+        if k == 2:
+            big = random_times(rng.randint(1, 200), rng)
+            if cruzar_puente_k(big, 2)[1] != tiempo_total(big):
+                raise AssertionError(f"k=2 {big}: no coincide con cruzar_puente")
+
+# =============================================================================
+# MEDICIÓN
+# =============================================================================
+def run_benchmark(ns, ks, seed=0):
+    """Una fila (diccionario con COLUMNS) por cada k y cada n."""
+    rows = []
+    for k in ks:
+        previous = None
+        for n in ns:
+            times = random_times(n, random.Random(seed + n))
+            t0 = time.perf_counter()
+            _, total = cruzar_puente_k(times, k)
+            elapsed = time.perf_counter() - t0
+            greedy_time = None
+            if k == 2:
+                t0 = time.perf_counter()
+                tiempo_total(times)
+                greedy_time = time.perf_counter() - t0
+            exponent = None
+            if previous is not None and previous[1] > 0 and elapsed > 0:
+                exponent = math.log(elapsed / previous[1]) / math.log(n / previous[0])
+            rows.append(dict(n=n, k=k, total=total, time=elapsed, exponent=exponent,
+                             greedy_time=greedy_time))
+            previous = (n, elapsed)
+    return rows
+
+def print_table(rows):
+    print(f"{'n':>6} {'k':>3} {'total':>9} {'tiempo (s)':>11} {'exponente':>10} {'voraz (s)':>10}")
+    for row in rows:
+        exponent = f"{row['exponent']:.2f}" if row['exponent'] is not None else '-'
+        greedy = f"{row['greedy_time']:.5f}" if row['greedy_time'] is not None else '-'
+        print(f"{row['n']:>6} {row['k']:>3} {row['total']:>9} {row['time']:>11.4f} "
+              f"{exponent:>10} {greedy:>10}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Escalamiento del puente con capacidad k")
+    parser.add_argument('--ns', nargs='+', type=int, default=[25, 50, 100, 200])
+    parser.add_argument('--ks', nargs='+', type=int, default=[2, 3, 4])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help="Guardar la tabla (.csv o .md)")
+    args = parser.parse_args()
+
+    verify(args.ks, seed=args.seed)
+    print("Verificado contra la búsqueda exhaustiva (y contra cruzar_puente con k = 2)\n")
+    rows = run_benchmark(args.ns, args.ks, args.seed)
+    print_table(rows)
+    if args.output:
+        write_table(rows, COLUMNS, args.output, decimals=6)
+        print(f"Tabla guardada en: {os.path.abspath(args.output)}")
+
+if __name__ == '__main__':
+    main()